@@ -0,0 +1,102 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""
+Measure import time of testit modules and fail if it regressed
+
+python bench_import.py [--runs 20] [--max-ms 30] [--output bench_output.txt]
+
+Every module is imported in a fresh interpreter with -X importtime, median of cumulative import time is reported.
+Bytecode is written on the first import, so compilation of sources is not measured.
+The check fails (exit code 1) if median import time of a module is larger than --max-ms
+or importing it loads libraries which should be imported only on first request
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = ("testit_api", "testit_models", "testit_async")
+
+# standard modules imported before the measured one: the async client can not avoid asyncio
+PRELOAD = {"testit_async": "asyncio"}
+
+# libraries which must not be executed by import of testit modules
+HEAVY_MODULES = ("urllib3", "requests.sessions", "aiohttp.client", "orjson.orjson", "concurrent.futures.thread",
+                 "testit_endpoints")
+
+CHECK_CODE = f"""
+import sys
+import {{module}}
+print(",".join(name for name in {HEAVY_MODULES!r} if name in sys.modules))
+"""
+
+
+def _run(*arguments):
+    environment = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run([sys.executable, *arguments], capture_output=True, text=True, check=True, env=environment,
+                          cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module):
+    """
+    Return cumulative import time (in milliseconds) of module in a fresh interpreter
+    """
+    preload = f"import {PRELOAD[module]}; " if module in PRELOAD else ""
+    output = _run("-X", "importtime", "-c", f"{preload}import {module}")
+    for line in output.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"Import time of {module} is not found")
+
+
+def loaded_heavy_modules(module):
+    """
+    Return names of heavy libraries executed by import of module
+    """
+    output = _run("-c", CHECK_CODE.format(module=module))
+    return [name for name in output.stdout.strip().split(",") if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time of testit modules")
+    parser.add_argument("--runs", type=int, default=20, help="Number of imports of every module")
+    parser.add_argument("--max-ms", type=float, default=30.0, help="Maximum median import time of a module")
+    parser.add_argument("--output", help="File to write report to")
+    arguments = parser.parse_args()
+    report = list()
+    failed = False
+    for module in MODULES:
+        # the first import writes bytecode
+        import_time(module)
+        times = [import_time(module) for _ in range(arguments.runs)]
+        median = statistics.median(times)
+        heavy = loaded_heavy_modules(module)
+        status = "ok"
+        if median > arguments.max_ms:
+            status = f"FAIL: slower than {arguments.max_ms} ms"
+        if heavy:
+            status = f"FAIL: loads {', '.join(heavy)}"
+        failed = failed or status != "ok"
+        report.append(f"{module}: median {median:.1f} ms, min {min(times):.1f} ms, max {max(times):.1f} ms - {status}")
+    print("\n".join(report))
+    if arguments.output:
+        with open(arguments.output, mode="w", encoding="utf-8") as output:
+            output.write("\n".join(report) + "\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,2190 +9,960 @@
 # WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
 # ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
-import json
-import os.path
+import gzip
+import os
+import random
+import threading
+import time
+from collections import deque
 from collections.abc import Mapping, Sequence
 
-import requests
+from testit_codec import get_codec
+from testit_lazy import import_module
+from testit_transfer import DownloadTarget, MultipartStream
 
+# requests is imported by the first created client, endpoint table - on first use of TestITClient class
+# (concurrent.futures, email.utils, inspect and testit_validation are imported inside functions using them
+# for the same reason)
+requests = None
+testit_endpoints = None
+_endpoints_lock = threading.Lock()
 
-class TestITClient:
+
+class TestITError(Exception):
+    """
+    TestIT returned unexpected response
+    """
+    def __init__(self, response, status_code=None, retry_after=None):
+        super().__init__(response if status_code is None else f"{status_code}: {response}")
+        self.response = response
+        self.status_code = status_code
+        # value of Retry-After header of the response
+        self.retry_after = retry_after
+
+
+class RetryPolicy:
+    """
+    Rules for repeating requests failed because of network errors or temporary TestIT errors
+    """
+    def __init__(self, max_attempts=3, backoff_factor=0.5, backoff_max=30.0, jitter=True,
+                 retry_statuses=(429, 500, 502, 503, 504), retry_methods=('get', 'put', 'delete'),
+                 respect_retry_after=True):
+        """
+        :param max_attempts: Maximum number of attempts for one request (1 - no retries)
+        :param backoff_factor: Delay (in seconds) before the first retry, it is doubled for every next retry
+        :param backoff_max: Maximum delay (in seconds) before retry
+        :param jitter: Use random delay from 0 to calculated delay, so clients do not retry at the same moment
+        :param retry_statuses: Response statuses to retry
+        :param retry_methods: Methods to retry, add 'post' to retry not idempotent requests too
+        :param respect_retry_after: Wait for time from Retry-After header of response (but no more than backoff_max)
+        """
+        if max_attempts < 1:
+            raise AssertionError("max_attempts should be positive")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(retry_methods)
+        self.respect_retry_after = respect_retry_after
+
+    def get_delay(self, attempt, retry_after=None):
+        """
+        Return delay (in seconds) before next attempt after failed attempt number attempt
+        :param retry_after: Value of Retry-After header of failed response
+        """
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after and retry_after:
+            try:
+                server_delay = float(retry_after)
+            except ValueError:
+                from email.utils import parsedate_to_datetime
+                try:
+                    server_delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    server_delay = 0
+            delay = max(delay, min(server_delay, self.backoff_max))
+        return delay
+
+
+class BulkResult:
+    """
+    Merged result of bulk request sent in chunks
+    """
+    def __init__(self, size):
+        # response item (or None if TestIT returns no content) for every item of request, in request order
+        self.results = [None] * size
+        # request item index -> exception for items which were not accepted by TestIT
+        self.errors = dict()
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+class _SingleFlight:
+    """
+    Share one call of function between threads calling it with the same key at the same time:
+    the first thread calls the function, others wait for it and get the same result or exception
+    """
+    def __init__(self):
+        # key -> [event set when call is finished, result, exception]
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, function, *args):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = [threading.Event(), None, None]
+        if not leader:
+            call[0].wait()
+            if call[2] is not None:
+                raise call[2]
+            return call[1]
+        try:
+            call[1] = function(*args)
+            return call[1]
+        except Exception as error:
+            call[2] = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call[0].set()
+
+
+def _split_chunks(data, chunk_size, chunk_bytes=None, encode=None):
+    """
+    Split list to chunks with no more than chunk_size items and (if set) no more than chunk_bytes of json
+    (items are measured with encode function)
+    Return list of (index of the first item, chunk)
+    """
+    chunks = list()
+    start = 0
+    size = 2
+    for index, item in enumerate(data):
+        item_size = len(encode(item)) + 1 if chunk_bytes else 0
+        if index > start and (index - start >= chunk_size or (chunk_bytes and size + item_size > chunk_bytes)):
+            chunks.append((start, data[start:index]))
+            start = index
+            size = 2
+        size += item_size
+    if start < len(data):
+        chunks.append((start, data[start:]))
+    return chunks
+
+
+def _import_requests():
+    """
+    Import requests (once, under a lock) when the first client is created
+    """
+    global requests
+    if requests is None:
+        requests = import_module("requests")
+
+
+def _endpoint_table():
+    """
+    Return table of endpoints, on first call import testit_endpoints and add API methods to TestITClient
+    """
+    global testit_endpoints
+    if testit_endpoints is None:
+        with _endpoints_lock:
+            if testit_endpoints is None:
+                module = import_module("testit_endpoints")
+                for name, endpoint in module.ENDPOINTS.items():
+                    if name not in TestITClient.__dict__:
+                        setattr(TestITClient, name, _endpoint_method(name, endpoint))
+                testit_endpoints = module
+    return testit_endpoints.ENDPOINTS
+
+
+class _ClientType(type):
+    """
+    Type of TestITClient: API methods are added to the class from the table of endpoints when the first client
+    is created or the class is inspected, so they are found on the class like written methods
+    (super(), help(), mock.create_autospec)
+    """
+    def __call__(cls, *args, **kwargs):
+        _endpoint_table()
+        return super().__call__(*args, **kwargs)
+
+    def __getattr__(cls, name):
+        if not name.startswith('_') and name in _endpoint_table():
+            return getattr(cls, _add_endpoint_method(name))
+        raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+
+    def __dir__(cls):
+        _endpoint_table()
+        return super().__dir__()
+
+
+class TestITClient(metaclass=_ClientType):
     """
     Realize TestIT API as python class
     """
-    def __init__(self, testit_url, secretkey):
+    def __init__(self, testit_url, secretkey, pool_connections=10, pool_maxsize=10, pool_block=False,
+                 keep_alive=True, verify=True, retry=RetryPolicy(), timeout=(10, 300), raise_errors=False,
+                 rate_limiter=None, concurrency=None, codec=None, compress_threshold=None, compress_level=6,
+                 attachment_cache=None, cache=None, validators=None, coalesce=False, validate=False, metrics=None):
         """
         :param testit_url: Specify url your TestIT system in format: "https://example.com"
         :param secretkey: Use your "API secret key" from TestIT
-        """
+        :param pool_connections: Number of connection pools (one pool per host) to cache
+        :param pool_maxsize: Maximum number of connections kept open per host
+        :param pool_block: Wait for a free connection instead of opening an extra one when the pool is exhausted
+        :param keep_alive: Keep connections (and their TLS sessions) open between requests
+        :param verify: Verify the TLS certificate of TestIT, or path to a CA bundle
+        :param retry: RetryPolicy for failed requests (None - no retries)
+        :param timeout: Timeout (in seconds) for request, or tuple (connect timeout, read timeout)
+        :param raise_errors: Raise TestITError if TestIT returned error status instead of returning response content
+        :param rate_limiter: RateLimiter from testit_throttle, may be shared by several clients
+        :param concurrency: ConcurrencyController from testit_throttle adapting number of requests in flight
+        :param codec: Json codec from testit_codec (or its name), by default the fastest installed one
+        :param compress_threshold: Compress request bodies larger than this number of bytes with gzip
+        (None - do not compress)
+        :param compress_level: Gzip compression level from 1 (fastest) to 9 (smallest)
+        :param attachment_cache: AttachmentCache from testit_attachments to upload files with the same content
+        by AddAttachment only once
+        :param cache: ResponseCache from testit_cache to keep get responses of slow-changing entities
+        :param validators: ValidatorCache from testit_cache to revalidate repeated get requests with ETag and
+        Last-Modified of previous responses instead of downloading unchanged bodies again
+        :param coalesce: Send identical get requests made at the same time from several threads only once,
+        all callers get the same response (or exception)
+        :param validate: Check request bodies against models of testit_models before sending them and raise
+        ValidationError from testit_validation instead of sending invalid body
+        :param metrics: MetricsRegistry from testit_metrics recording latency, sizes, retries and status codes
+        of requests by endpoint
+        """
+        _import_requests()
         if testit_url.endswith('/'):
             testit_url = testit_url[:-1]
         self.testit_url = testit_url
         self.secretkey = secretkey
-
-    def SendCommand(self, method, path, data=None, request_file=None):
+        self.retry = retry
+        self.timeout = timeout
+        self.raise_errors = raise_errors
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.codec = codec if codec is not None and not isinstance(codec, str) else get_codec(codec)
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+        self.attachment_cache = attachment_cache
+        self.cache = cache
+        self.validators = validators
+        self.coalesce = coalesce
+        self.validate = validate
+        self.metrics = metrics
+        # callables (method, path, decoded response) called after every successful request, see AutoTestIndex
+        self.response_hooks = []
+        self._single_flight = _SingleFlight()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.verify = verify
+        # one session for the whole client: connections are pooled and reused by every method
+        # (session is created on first request)
+        self.session = None
+        self._session_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getattr__(self, name):
+        # entries added to the table of endpoints after API methods were built get their methods on first access
+        if name.startswith('_') or name not in _endpoint_table():
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return getattr(self, _add_endpoint_method(name))
+
+    def close(self):
+        """
+        Close all pooled connections of the client
+        """
+        with self._session_lock:
+            if self.session is not None:
+                self.session.close()
+                self.session = None
+
+    def _get_session(self):
+        """
+        Return requests session of the client, create it on first use
+        """
+        session = self.session
+        if session is not None:
+            return session
+        with self._session_lock:
+            if self.session is not None:
+                return self.session
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=self.pool_connections,
+                                                    pool_maxsize=self.pool_maxsize, pool_block=self.pool_block)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.verify = self.verify
+            session.headers['Authorization'] = 'PrivateToken ' + self.secretkey
+            session.headers['Accept'] = 'application/json'
+            session.headers['Accept-Encoding'] = 'gzip, deflate'
+            if not self.keep_alive:
+                session.headers['Connection'] = 'close'
+            self.session = session
+            return session
+
+    def SendCommand(self, method, path, data=None, request_file=None, retry=None, compress=None, progress=None):
         """
         Send request to TestIT and return response
-        """
-        # prepare target url
-        target_url = self.testit_url + path
-        # prepare payload to send
-        payload = bytes(json.dumps(data), 'utf-8')
-        # prepare headers
-        headers = {'Authorization': 'PrivateToken ' + self.secretkey, 'Content-Type': 'application/json'}
-        # choose method and send request
-        if method == 'post':
-            if request_file is None:
-                response = requests.post(target_url, headers=headers, data=payload)
-            else:
-                response = requests.post(target_url, headers=headers, files=request_file)
-        elif method == 'put':
-            response = requests.put(target_url, headers=headers, data=payload)
-        elif method == 'delete':
-            response = requests.delete(target_url, headers=headers, data=payload)
+        :param request_file: Path to file or file object opened in binary mode, sent as multipart/form-data
+        :param retry: Retry this request according to RetryPolicy of the client even if method is not listed in
+        retry_methods of the policy (True) or do not retry it at all (False)
+        :param compress: Compress request body with gzip (True) or send it as is (False) regardless of
+        compress_threshold of the client
+        :param progress: Callable (bytes_sent, total_bytes) reporting upload of request_file
+        """
+        cacheable = self.cache is not None and method == 'get' and request_file is None
+        content = self.cache.get(method, path) if cacheable else None
+        if content is not None:
+            # cached body is decoded on every hit, so callers never share (and modify) the same object
+            return self.codec.decode(content)
+        revalidate = self.validators is not None and method == 'get' and request_file is None
+        headers = self.validators.request_headers(path) if revalidate else None
+        if self.coalesce and method == 'get' and request_file is None:
+            key = (path, tuple(sorted(headers.items())) if headers else ())
+            response = self._single_flight.do(key, self._request, method, path, None, None, retry, None, None, headers)
         else:
-            response = requests.get(target_url, headers=headers)
+            response = self._request(method, path, data, request_file, retry, compress, progress, headers)
+        if response.status_code == 304 and headers:
+            content = self.validators.get(path)
+            if content is not None:
+                return self.codec.decode(content)
+            # response was forgotten while the request was sent, so it is requested again without validators
+            response = self._request(method, path, data, request_file, retry, compress, progress)
+        if self.cache is not None and method != 'get':
+            self.cache.invalidate(path)
+        elif cacheable and response.ok:
+            self.cache.put(method, path, response.content)
+        if revalidate and response.ok:
+            self.validators.put(path, response.headers, response.content)
+        if self.raise_errors and not response.ok:
+            raise TestITError(response.content, status_code=response.status_code,
+                              retry_after=response.headers.get('Retry-After'))
         # return response
         try:
-            return response.json()
-        except:
+            result = self.codec.decode(response.content)
+        except ValueError:
             return response.content
+        if self.response_hooks and response.ok:
+            self._run_hooks(method, path, result)
+        return result
 
-    def AddAttachment(self, file, **parameters):
-        """
-        Create attachment
-
-        Use case
-        User send file
-        User runs method execution
-        System upload file
-        System create attachment
-        System return attachment model (listed in response parameters)
+    def _run_hooks(self, method, path, result):
         """
-        method = "post"
-        path = f"/api/v2/attachments"
-        request_parameters = list()
-        for param in parameters:
-            if param == "apiVersion":
-                # string
-                request_parameters.append(f"apiVersion={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        if isinstance(file, str) and os.path.isfile(file):
-            request_file = open(file, mode="rb")
-        elif isinstance(file, str) and not os.path.isfile(file):
-            raise AssertionError("File object or path to file expected")
-        else:
-            request_file = file
-        return self.SendCommand(method, path, request_file)
-
-    def GetAllAutoTests(self, **parameters):
+        Pass decoded response of successful request to response_hooks of the client
         """
-        Get all AutoTests (if parameters are specified, then it's filtered by them.)
-
-        Use case
-        [Optional] User sets search parameters (listed in request parameters) and runs method execution
-        System returns all autotests, matching search criteria
-        """
-        method = "get"
-        path = f"/api/v2/autoTests"
-        request_parameters = list()
-        for param in parameters:
-            if param == "projectId":
-                # Project internal identifier
-                # string (uuid)
-                request_parameters.append(f"projectId={parameters[param]}")
-            if param == "externalId":
-                # Autotest external identifier
-                # string
-                request_parameters.append(f"externalId={parameters[param]}")
-            if param == "globalId":
-                # Autotest global identifier
-                # integer (int64)
-                request_parameters.append(f"globalId={parameters[param]}")
-            if param == "Namespace":
-                # Name of abstract storage where autotest is located
-                # string
-                request_parameters.append(f"Namespace={parameters[param]}")
-            if param == "isNamespaceNull":
-                # Boolean flag which defines if search must include autotests with null value Namespace attribute
-                # boolean
-                request_parameters.append(f"isNamespaceNull={parameters[param]}")
-            if param == "classname":
-                # Name of the class where autotest is located
-                # string
-                request_parameters.append(f"classname={parameters[param]}")
-            if param == "isClassnameNull":
-                # Boolean flag which defines if search must include autotests with null value Classname attribute
-                # boolean
-                request_parameters.append(f"isClassnameNull={parameters[param]}")
-            if param == "isDeleted":
-                # Boolean flag which defines if search must include deleted autotests
-                # boolean
-                request_parameters.append(f"isDeleted={parameters[param]}")
-            if param == "labels":
-                # List of autotests labels to filter by
-                # array
-                request_parameters.append(f"labels={parameters[param]}")
-            if param == "stabilityMinimal":
-                # Minimal stability value to filter by
-                # integer (int32)
-                request_parameters.append(f"stabilityMinimal={parameters[param]}")
-            if param == "stabilityMaximal":
-                # Maximal stability value to filter by
-                # integer (int32)
-                request_parameters.append(f"stabilityMaximal={parameters[param]}")
-            if param == "isFlaky":
-                # [Optional] If flaky is set
-                # boolean
-                request_parameters.append(f"isFlaky={parameters[param]}")
-            if param == "includeSteps":
-                # Boolean flag which defines if setup, steps and teardown fields must be included
-                # boolean
-                request_parameters.append(f"includeSteps={parameters[param]}")
-            if param == "includeLabels":
-                # Boolean flag which defines if labels field must be included
-                # boolean
-                request_parameters.append(f"includeLabels={parameters[param]}")
-            if param == "Skip":
-                # Amount of items to be skipped (offset)
-                request_parameters.append(f"Skip={parameters[param]}")
-            if param == "Take":
-                # Amount of items to be taken (limit)
-                request_parameters.append(f"Take={parameters[param]}")
-            if param == "OrderBy":
-                # SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)
-                request_parameters.append(f"OrderBy={parameters[param]}")
-            if param == "SearchField":
-                # Property name for searching
-                request_parameters.append(f"SearchField={parameters[param]}")
-            if param == "SearchValue":
-                # Value for searching
-                request_parameters.append(f"SearchValue={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def CreateAutoTest(self, data):
-        """
-        Create AutoTest
+        for hook in self.response_hooks:
+            hook(method, path, result)
 
-        Use case
-        User sets autotest parameters (listed in the example) and runs method execution
-        System creates autotest
-        [Optional] If steps enumeration is set, system creates step items and relates them to autotest
-        [Optional] If setup enumeration is set, system creates setup items and relates them to autotest
-        [Optional] If teardown enumeration is set, system creates teardown items and relates them to autotest
-        [Optional] If label enumeration is set, system creates labels and relates them to autotest
-        [Optional] If link enumeration is set, system creates links and relates them to autotest
-        System returns autotest model (example listed in response parameters)
-        """
-        method = "post"
-        path = f"/api/v2/autoTests"
-        # data like a AutoTestPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def UpdateAutoTest(self, data):
-        """
-        Update AutoTest
-
-        Use case
-        User sets autotest updated parameters values (listed in the example) and runs method execution
-        System finds the autotest by the identifier
-        System updates autotest parameters
-        [Optional] If steps enumeration is set, system creates step items, relates them to autotest
-        and deletes relations with current steps( if exist)
-        [Optional] If Setup enumeration is set, system creates setup items and relates them to autotest
-        and deletes relations with current Setup items (if exist)
-        [Optional] If teardown enumeration is set, system creates teardown items and relates them to autotest
-        and deletes relations with current teardown items (if exist)
-        [Optional] If label enumeration is set, system creates labels and relates them to autotest
-        and deletes relations with current Labels (if exist)
-        [Optional] If link enumeration is set, system creates links and relates them to autotest
-        and deletes relations with current Links (if exist)
-        System updates autotest and returns no content response
-        """
-        method = "put"
-        path = f"/api/v2/autoTests"
-        # data like a AutoTestPutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetAutoTestById(self, autoTestId):
-        """
-        Get AutoTest by Id or GlobalId
-
-        Use case
-        User sets autotest internal or global identifier and runs method execution
-        System returns autotest, which internal or global identifier equals the identifier value set in the previous
-        action
+    def _request(self, method, path, data=None, request_file=None, retry=None, compress=None, progress=None,
+                 headers=None):
         """
-        method = "get"
-        path = f"/api/v2/autoTests/{autoTestId}"
-        return self.SendCommand(method, path)
-
-    def DeleteAutoTest(self, autoTestId):
+        Send request to TestIT through the pooled session, retrying it according to RetryPolicy,
+        and return raw response
+        :param headers: Additional headers of the request
         """
-        Delete AutoTest by Id or GlobalId
+        # prepare target url
+        target_url = self.testit_url + path
+        # prepare payload to send, encoded straight to bytes (requests without data have no body)
+        if request_file is not None:
+            # file is streamed from disk chunk by chunk and closed right after the request
+            with MultipartStream(request_file, progress=progress) as stream:
+                kwargs = {'headers': {**(headers or {}), 'Content-Type': stream.content_type}, 'data': stream}
+                return self._send_measured(method, path, target_url, kwargs, retry, len(stream))
+        if data is None or method == 'get':
+            kwargs = {'headers': headers} if headers else {}
+        else:
+            kwargs = {'headers': {**(headers or {}), 'Content-Type': 'application/json'},
+                      'data': self.codec.encode(data)}
+            if self._should_compress(len(kwargs['data']), compress):
+                kwargs['headers']['Content-Encoding'] = 'gzip'
+                kwargs['data'] = gzip.compress(kwargs['data'], compresslevel=self.compress_level, mtime=0)
+        return self._send_measured(method, path, target_url, kwargs, retry, len(kwargs.get('data') or b''))
 
-        Use case
-        User sets autotest internal (guid format) or global (integer format) identifier and runs method execution
-        System finds the autotest by the identifier
-        System deletes autotest and returns no content response
+    def _send_measured(self, method, path, target_url, kwargs, retry, request_bytes):
         """
-        method = "delete"
-        path = f"/api/v2/autoTests/{autoTestId}"
-        return self.SendCommand(method, path)
-
-    def CreateMultiple(self, data):
+        Send request with retries and record it in metrics registry of the client
         """
-        Create AutoTests multiple
-
-        Use case
-        User sets autotest parameters (listed in the example) and runs method execution
-        System creates autotest
-        [Optional] If steps enumeration is set, system creates step items and relates them to autotest
-        [Optional] If setup enumeration is set, system creates setup items and relates them to autotest
-        [Optional] If teardown enumeration is set, system creates teardown items and relates them to autotest
-        [Optional] If label enumeration is set, system creates labels and relates them to autotest
-        [Optional] If link enumeration is set, system creates links and relates them to autotest
-        System returns autotest model (example listed in response parameters)
-        """
-        method = "post"
-        path = f"/api/v2/autoTests/bulk"
-        # data like a list of AutoTestPostModel
-        if isinstance(data, Mapping) and not isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a list of dicts")
-        return self.SendCommand(method, path, data)
-
-    def UpdateMultiple(self, data):
+        if self.metrics is None:
+            return self._send_with_retry(method, target_url, kwargs, retry)
+        started = time.monotonic()
+        try:
+            response = self._send_with_retry(method, target_url, kwargs, retry)
+        except Exception:
+            self.metrics.observe(method, path, None, time.monotonic() - started, request_bytes)
+            raise
+        self.metrics.observe(method, path, response.status_code, time.monotonic() - started, request_bytes,
+                             len(response.content))
+        return response
+
+    def _send_with_retry(self, method, target_url, kwargs, retry=None):
+        """
+        Send request, repeating it according to RetryPolicy of the client, and return raw response
+        """
+        policy = self.retry
+        if retry is None:
+            retry = policy is not None and method in policy.retry_methods
+        if not retry or policy is None:
+            return self._send(method, target_url, kwargs)
+        attempt = 1
+        while True:
+            try:
+                response = self._send(method, target_url, kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= policy.max_attempts:
+                    raise
+                delay = policy.get_delay(attempt)
+            else:
+                if attempt >= policy.max_attempts or response.status_code not in policy.retry_statuses:
+                    return response
+                delay = policy.get_delay(attempt, response.headers.get('Retry-After'))
+                response.close()
+            if self.metrics is not None:
+                self.metrics.retry(method, target_url[len(self.testit_url):])
+            time.sleep(delay)
+            # streamed body is sent again from the beginning
+            if hasattr(kwargs.get('data'), 'seek'):
+                kwargs['data'].seek(0)
+            attempt += 1
+
+    def _download(self, method, path, destination, data=None, chunk_size=1024 * 1024, resume_attempts=3,
+                  atomic=True, progress=None):
+        """
+        Stream response body to destination chunk by chunk and return number of received bytes
+        Download by get request is resumed with HTTP Range from the last received byte if connection is dropped
         """
-        Update AutoTests multiple
-
-        Use case
-        User sets autotest updated parameters values (listed in the example) and runs method execution
-        System finds the autotest by the identifier
-        System updates autotest parameters
-        [Optional] If steps enumeration is set, system creates step items, relates them to autotest
-        and deletes relations with current steps( if exist)
-        [Optional] If Setup enumeration is set, system creates setup items and relates them to autotest
-        and deletes relations with current Setup items (if exist)
-        [Optional] If teardown enumeration is set, system creates teardown items and relates them to autotest
-        and deletes relations with current teardown items (if exist)
-        [Optional] If label enumeration is set, system creates labels and relates them to autotest
-        and deletes relations with current Labels (if exist)
-        [Optional] If link enumeration is set, system creates links and relates them to autotest
-        and deletes relations with current Links (if exist)
-        System updates autotest and returns no content response
-        """
-        method = "put"
-        path = f"/api/v2/autoTests/bulk"
-        # data like a list of AutoTestPutModel
-        if isinstance(data, Mapping) and not isinstance(data, Sequence):
+        target_url = self.testit_url + path
+        resumable = method == 'get'
+        target = DownloadTarget(destination, atomic)
+        try:
+            attempt = 0
+            while True:
+                kwargs = {'headers': {}, 'stream': True}
+                if resumable:
+                    # ranges and length refer to not encoded body
+                    kwargs['headers']['Accept-Encoding'] = 'identity'
+                    if target.written:
+                        kwargs['headers']['Range'] = f'bytes={target.written}-'
+                if data is not None:
+                    kwargs['headers']['Content-Type'] = 'application/json'
+                    kwargs['data'] = self.codec.encode(data)
+                started = time.monotonic()
+                status_code = None
+                received_from = target.written
+                try:
+                    with self._send_with_retry(method, target_url, kwargs) as response:
+                        status_code = response.status_code
+                        total = self._check_download_response(response, target)
+                        received_from = target.written
+                        try:
+                            for chunk in response.iter_content(chunk_size):
+                                target.write(chunk)
+                                if progress is not None:
+                                    progress(target.written, total)
+                            expected_length = response.headers.get('Content-Length')
+                            if expected_length is not None and response.raw.tell() != int(expected_length):
+                                raise requests.exceptions.ChunkedEncodingError("Response body is incomplete")
+                        except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                            if not resumable or attempt >= resume_attempts:
+                                raise
+                            attempt += 1
+                            continue
+                finally:
+                    self._observe_download(method, path, status_code, started, len(kwargs.get('data') or b''),
+                                           target.written - received_from)
+                if total is not None and target.written != total:
+                    raise TestITError(f"Received {target.written} bytes of {total}")
+                break
+        except BaseException:
+            target.abort()
+            raise
+        target.commit()
+        return target.written
+
+    def _observe_download(self, method, path, status_code, started, request_bytes, received):
+        """
+        Record one attempt of download in metrics registry of the client with number of bytes written by it
+        """
+        if self.metrics is not None:
+            self.metrics.observe(method, path, status_code, time.monotonic() - started, request_bytes, received)
+
+    @staticmethod
+    def _check_download_response(response, target):
+        """
+        Check response of download request and return total length of the body (None if it is unknown)
+        """
+        if response.status_code == 206 and target.written:
+            # Content-Range: bytes start-end/total
+            content_range = response.headers.get('Content-Range', '')
+            try:
+                range_start = int(content_range.split(' ')[1].split('-')[0])
+                range_total = content_range.split('/')[1]
+            except (IndexError, ValueError):
+                raise TestITError(f"Unexpected Content-Range: {content_range}", status_code=206)
+            if range_start != target.written:
+                raise TestITError(f"Unexpected Content-Range: {content_range}", status_code=206)
+            return int(range_total) if range_total != '*' else None
+        if not response.ok:
+            raise TestITError(response.content, status_code=response.status_code)
+        # whole body is sent again
+        target.restart()
+        if response.headers.get('Content-Encoding') or response.headers.get('Content-Length') is None:
+            return None
+        return int(response.headers['Content-Length'])
+
+    def _should_compress(self, size, compress=None):
+        """
+        Check if request body of size bytes should be compressed
+        """
+        if compress is not None:
+            return compress
+        return self.compress_threshold is not None and size > self.compress_threshold
+
+    def _send(self, method, target_url, kwargs):
+        """
+        Send one request through the pooled session, keeping rate and concurrency limits of the client
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self.concurrency is None:
+            return self._get_session().request(method, target_url, timeout=self.timeout, **kwargs)
+        self.concurrency.acquire()
+        status_code = None
+        started = time.monotonic()
+        try:
+            response = self._get_session().request(method, target_url, timeout=self.timeout, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            self.concurrency.release(time.monotonic() - started, status_code)
+
+    def _send_checked(self, method, path, data=None, request_file=None):
+        """
+        Send request to TestIT and return response, raise TestITError if TestIT returned error status
+        """
+        response = self._request(method, path, data, request_file)
+        if not response.ok:
+            raise TestITError(response.content, status_code=response.status_code,
+                              retry_after=response.headers.get('Retry-After'))
+        if not response.content:
+            return None
+        result = self.codec.decode(response.content)
+        if self.response_hooks:
+            self._run_hooks(method, path, result)
+        return result
+
+    def _send_chunk(self, method, path, start, chunk, retries, result):
+        """
+        Send one chunk of bulk request, retry it on network errors and temporary TestIT errors
+        and split it in halves to isolate bad items if TestIT rejects it
+        """
+        for attempt in range(1, retries + 2):
+            try:
+                response = self._send_checked(method, path, chunk)
+            except (TestITError, requests.RequestException) as error:
+                if self._is_transient(error):
+                    if attempt > retries:
+                        # halves of the chunk would fail the same way, so they are not sent
+                        result.errors.update(dict.fromkeys(range(start, start + len(chunk)), error))
+                        return
+                    if self.metrics is not None:
+                        self.metrics.retry(method, path)
+                    time.sleep(self._retry_delay(attempt, error))
+                    continue
+                # items rejected by TestIT (4xx) are rejected again, so the chunk is split right away
+                if len(chunk) == 1:
+                    result.errors[start] = error
+                    return
+                middle = len(chunk) // 2
+                self._send_chunk(method, path, start, chunk[:middle], retries, result)
+                self._send_chunk(method, path, start + middle, chunk[middle:], retries, result)
+                return
+            if isinstance(response, list) and len(response) == len(chunk):
+                result.results[start:start + len(chunk)] = response
+            return
+
+    def _is_transient(self, error):
+        """
+        Check if failed request may succeed when sent again: network error or TestIT error with status
+        from retry_statuses of RetryPolicy (429 and 5xx by default)
+        """
+        if not isinstance(error, TestITError):
+            return True
+        statuses = self.retry.retry_statuses if self.retry is not None else RetryPolicy().retry_statuses
+        return error.status_code in statuses
+
+    def _retry_delay(self, attempt, error):
+        """
+        Return delay (in seconds) before repeating request failed with transient error after attempt number attempt,
+        Retry-After of TestIT response is respected
+        """
+        policy = self.retry if self.retry is not None else RetryPolicy()
+        return policy.get_delay(attempt, getattr(error, 'retry_after', None))
+
+    def _send_in_chunks(self, method, path, data, chunk_size, chunk_bytes, max_workers, retries):
+        """
+        Send bulk request in chunks from a pool of worker threads and merge responses into BulkResult
+        """
+        if isinstance(data, Mapping) or not isinstance(data, Sequence):
             raise AssertionError("requestBody should be a list of dicts")
-        return self.SendCommand(method, path, data)
-
-    def GetWorkItemsLinkedToAutoTest(self, autoTestId, **parameters):
-        """
-        Get all WorkItems Ids linked to AutoTest by Id or GlobalId
-
-        Use case
-        User sets autotest internal (guid format) or global (integer format) identifier and runs method execution
-        System finds the autotest by the identifier
-        System finds all actual and not deleted WorkItems related to the found autotest
-        System returns the enumeration of WorkItems
-        """
-        method = "get"
-        path = f"/api/v2/autoTests/{autoTestId}/workItems"
-        request_parameters = list()
-        for param in parameters:
-            if param == "isWorkItemDeleted":
-                # Boolean flag which defines if search must include deleted worItems
-                # boolean
-                request_parameters.append(f"isWorkItemDeleted={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def LinkAutoTestToWorkItem(self, data, autoTestId):
-        """
-        Link AutoTest to WorkItem by Id or GlobalId
-
-        Use case
-        User sets autotest internal (guid format) or global (integer format) identifier
-        User sets workitem internal (guid format) or global (integer format) identifier
-        User runs method execution
-        System finds the autotest by the autotest identifier
-        System finds the workitem by the workitem identifier
-        System relates the workitem with the autotest and returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/autoTests/{autoTestId}/workItems"
-        # data like a WorkItemIdModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def DeleteAutoTestLinkFromWorkItem(self, autoTestId, **parameters):
-        """
-        Delete AutoTest link from WorkItem by Id or GlobalId
-        (if workItemId is not specified, then remove all links WorkItems to AutoTest)
-
-        Use case
-        User sets autotest internal (guid format) or global (integer format) identifier
-        [Optional] User sets workitem internal (guid format) or global (integer format) identifier
-        User runs method execution
-        System finds the autotest by the autotest identifier
-        [Optional] if workitem id is set by User, System finds the workitem by the workitem identifier and unlinks it
-        from autotest.
-        [Optional] Otherwise, if workitem id is not specified, System unlinks all workitems linked to autotest.
-        System returns no content response
-        """
-        method = "delete"
-        path = f"/api/v2/autoTests/{autoTestId}/workItems"
-        request_parameters = list()
-        for param in parameters:
-            if param == "workItemId":
-                # workItem internal (guid format) or global (integer format) identifier
-                # string
-                request_parameters.append(f"workItemId={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def GetWorkItemResults(self, autoTestId, **parameters):
-        """
-        History of TestResults for AutoTest by Id or GlobalId
-
-        Use case
-        User sets autotest internal (guid format) or global (integer format) identifier
-        User sets getTestResultHistoryReportQuery (listed in the example)
-        User runs method execution
-        System search for test results using filters set by user in getTestResultHistoryReportQuery and autoTestId
-        System returns the enumeration of test results
-        """
-        method = "get"
-        path = f"/api/v2/autoTests/{autoTestId}/testResultHistory"
-        request_parameters = list()
-        for param in parameters:
-            if param == "From":
-                # string (date-time)
-                request_parameters.append(f"From={parameters[param]}")
-            if param == "To":
-                # string (date-time)
-                request_parameters.append(f"To={parameters[param]}")
-            if param == "ConfigurationIds":
-                # array
-                request_parameters.append(f"ConfigurationIds={parameters[param]}")
-            if param == "TestPlanIds":
-                # array
-                request_parameters.append(f"TestPlanIds={parameters[param]}")
-            if param == "UserIds":
-                # array
-                request_parameters.append(f"UserIds={parameters[param]}")
-            if param == "Outcomes":
-                # array
-                request_parameters.append(f"Outcomes={parameters[param]}")
-            if param == "IsAutomated":
-                # boolean
-                request_parameters.append(f"IsAutomated={parameters[param]}")
-            if param == "TestRunIds":
-                # array
-                request_parameters.append(f"TestRunIds={parameters[param]}")
-            if param == "Skip":
-                # Amount of items to be skipped (offset)
-                request_parameters.append(f"Skip={parameters[param]}")
-            if param == "Take":
-                # Amount of items to be taken (limit)
-                request_parameters.append(f"Take={parameters[param]}")
-            if param == "OrderBy":
-                # SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)
-                request_parameters.append(f"OrderBy={parameters[param]}")
-            if param == "SearchField":
-                # Property name for searching
-                request_parameters.append(f"SearchField={parameters[param]}")
-            if param == "SearchValue":
-                # Value for searching
-                request_parameters.append(f"SearchValue={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def GetTestRuns(self, autoTestId):
-        """
-        Stopped and completed TestRuns which contain AutoTest by Id or GlobalId
-
-        Use case
-        User sets autotest internal (guid format) or global (integer format) identifier
-        User runs method execution
-        System search for all test runs related to the autotest
-        System returns the enumeration of test runs
-        """
-        method = "get"
-        path = f"/api/v2/autoTests/{autoTestId}/testRuns"
-        return self.SendCommand(method, path)
-
-    def GetAutoTestAverageDuration(self, autoTestId):
-        """
-        Get AutoTest average duration by Id or GlobalId
-
-        Use case
-        User sets autotest internal (guid format) or global (integer format) identifier
-        User runs method execution
-        System calculates pass average duration and fail average duration of autotest from all related test results
-        System returns pass average duration and fail average duration for autotest
-        """
-        method = "get"
-        path = f"/api/v2/autoTests/{autoTestId}/averageDuration"
-        return self.SendCommand(method, path)
-
-    def GetAutoTestChronology(self, autoTestId):
-        """
-        Get AutoTest chronology by Id or GlobalId
-
-        Use case
-        User sets autotest internal (guid format) or global (integer format) identifier
-        User runs method execution
-        System search all test results related to autotest (with default limit equal 100)
-        System orders the test results by CompletedOn property descending and then orders by CreatedDate property
-        descending
-        System returns test result chronology for autotest
-        """
-        method = "get"
-        path = f"/api/v2/autoTests/{autoTestId}/chronology"
-        return self.SendCommand(method, path)
-
-    def GetConfigurationById(self, configurationId):
-        """
-        Get Configuration by Id or GlobalId
-
-        Use case
-        User sets configuration internal (guid format) or global (integer format) identifier
-        User runs method execution
-        System search configuration using the identifier
-        System returns configuration
-        """
-        method = "get"
-        path = f"/api/v2/configurations/{configurationId}"
-        return self.SendCommand(method, path)
-
-    def CreateConfiguration(self, data):
-        """
-        Create Configuration
-
-        Use case
-        User sets configuration model (listed in the request example)
-        User runs method execution
-        System creates configuration
-        System returns created configuration (listed in the response example)
-        """
-        method = "post"
-        path = f"/api/v2/configurations"
-        # data like a ConfigurationPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def UpdateConfiguration(self, data):
-        """
-        Update Configuration
-
-        Use case
-        User sets configuration updated properties(listed in the request example)
-        User runs method execution
-        System updated configuration using updated properties
-        System returns no content response
-        """
-        method = "put"
-        path = f"/api/v2/configurations"
-        # data like a ConfigurationPutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetAllParameters(self, **parameters):
-        """
-        Get all parameters (if isDeleted is true, return deleted parameters)
-
-        Use case
-        [Optional] User sets isDeleted field value
-        [Optional] If User sets isDeleted field value as true, System search all deleted parameters
-        [Optional] If User sets isDeleted field value as false, System search all parameters which are not deleted
-        If User did not set isDeleted field value, System search all parameters
-        System returns array of all found parameters(listed in response model)
-        """
-        method = "get"
-        path = f"/api/v2/parameters"
-        request_parameters = list()
-        for param in parameters:
-            if param == "isDeleted":
-                # Boolean flag which defines if search must include deleted parameters
-                # boolean
-                request_parameters.append(f"isDeleted={parameters[param]}")
-            if param == "Skip":
-                # Amount of items to be skipped (offset)
-                request_parameters.append(f"Skip={parameters[param]}")
-            if param == "Take":
-                # Amount of items to be taken (limit)
-                request_parameters.append(f"Take={parameters[param]}")
-            if param == "OrderBy":
-                # SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)
-                request_parameters.append(f"OrderBy={parameters[param]}")
-            if param == "SearchField":
-                # Property name for searching
-                request_parameters.append(f"SearchField={parameters[param]}")
-            if param == "SearchValue":
-                # Value for searching
-                request_parameters.append(f"SearchValue={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def CreateParameter(self, data):
-        """
-        Create parameter
-
-        Use case
-        User sets parameter model (listed in the request example)
-        User runs method execution
-        System creates parameter
-        System returns parameter model
-        """
-        method = "post"
-        path = f"/api/v2/parameters"
-        # data like a ParameterPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def UpdateParameter(self, data):
-        """
-        Update parameter
-
-        Use case
-        User sets parameter updated properties(listed in the request example)
-        User runs method execution
-        System updated parameter using updated properties
-        System returns no content response
-        """
-        method = "put"
-        path = f"/api/v2/parameters"
-        # data like a ParameterPutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetParameterById(self, parameterId):
-        """
-        Get parameter by id
-
-        Use case
-        User sets parameter internal (guid format) identifier
-        User runs method execution
-        System search parameter using the identifier
-        System returns parameter
-        """
-        method = "get"
-        path = f"/api/v2/parameters/{parameterId}"
-        return self.SendCommand(method, path)
-
-    def DeleteParameter(self, parameterId):
-        """
-        Delete parameter by id
-
-        Use case
-        User sets parameter internal (guid format) identifier
-        System search and delete parameter
-        System returns deleted parameter
-        """
-        method = "delete"
-        path = f"/api/v2/parameters/{parameterId}"
-        return self.SendCommand(method, path)
-
-    def DeleteByName(self, name):
-        """
-        Delete parameter by name
-
-        Deletes parameter and all it's values
-        """
-        method = "delete"
-        path = f"/api/v2/parameters/name/{name}"
-        return self.SendCommand(method, path)
-
-    def GetAllProjects(self, **parameters):
-        """
-        Get all Projects (if isDeleted is true, return deleted Projects)
-
-        Use case
-        [Optional] User sets isDeleted field value
-        [Optional] If User sets isDeleted field value as true, System search all deleted projects
-        [Optional] If User sets isDeleted field value as false, System search all projects which are not deleted
-        If User did not set isDeleted field value, System search all projects
-        System returns array of all found projects(listed in response model)
-        """
-        method = "get"
-        path = f"/api/v2/projects"
-        request_parameters = list()
-        for param in parameters:
-            if param == "isDeleted":
-                # Boolean flag which defines if search must include deleted projects
-                # boolean
-                request_parameters.append(f"isDeleted={parameters[param]}")
-            if param == "projectName":
-                # string
-                request_parameters.append(f"projectName={parameters[param]}")
-            if param == "Skip":
-                # Amount of items to be skipped (offset)
-                request_parameters.append(f"Skip={parameters[param]}")
-            if param == "Take":
-                # Amount of items to be taken (limit)
-                request_parameters.append(f"Take={parameters[param]}")
-            if param == "OrderBy":
-                # SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)
-                request_parameters.append(f"OrderBy={parameters[param]}")
-            if param == "SearchField":
-                # Property name for searching
-                request_parameters.append(f"SearchField={parameters[param]}")
-            if param == "SearchValue":
-                # Value for searching
-                request_parameters.append(f"SearchValue={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def CreateProject(self, data):
-        """
-        Create Project
-
-        Use case
-        User sets project parameters (listed in request example) and runs method execution
-        System creates project
-        System returns project model (example listed in response parameters)
-        """
-        method = "post"
-        path = f"/api/v2/projects"
-        # data like a ProjectPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def UpdateProject(self, data):
-        """
-        Update Project
-
-        Use case
-        User sets project parameters (listed in request example) and runs method execution
-        System updates project
-        System returns updated project model (example listed in response parameters)
-        """
-        method = "put"
-        path = f"/api/v2/projects"
-        # data like a ProjectPutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetProjectById(self, projectId):
-        """
-        Get Project by Id or GlobalId
-
-        Use case
-        User sets project internal or global identifier and runs method execution
-        System search project
-        System returns project (example listed in response parameters)
-        """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}"
-        return self.SendCommand(method, path)
-
-    def DeleteProject(self, projectId):
-        """
-        Delete Project by Id or GlobalId
-
-        Use case
-        User sets project internal or global identifier and runs method execution
-        System search and delete project
-        System returns no content response
-        """
-        method = "delete"
-        path = f"/api/v2/projects/{projectId}"
-        return self.SendCommand(method, path)
-
-    def RestoreProject(self, projectId):
-        """
-        Restore Project by Id or GlobalId
-
-        Use case
-        User sets project internal or global identifier and runs method execution
-        System search and restores deleted project
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/projects/{projectId}/restore"
-        return self.SendCommand(method, path)
-
-    def GetSectionsByProjectId(self, projectId, **parameters):
-        """
-        Get Sections for Project by Id or GlobalId
-
-        Use case
-        User sets project internal or global identifier and runs method execution
-        System search project
-        System search all sections related to the project
-        System returns array of sections (listed in response)
-        """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}/sections"
-        request_parameters = list()
-        for param in parameters:
-            if param == "Skip":
-                # Amount of items to be skipped (offset)
-                request_parameters.append(f"Skip={parameters[param]}")
-            if param == "Take":
-                # Amount of items to be taken (limit)
-                request_parameters.append(f"Take={parameters[param]}")
-            if param == "OrderBy":
-                # SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)
-                request_parameters.append(f"OrderBy={parameters[param]}")
-            if param == "SearchField":
-                # Property name for searching
-                request_parameters.append(f"SearchField={parameters[param]}")
-            if param == "SearchValue":
-                # Value for searching
-                request_parameters.append(f"SearchValue={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def GetAutoTestsNamespaces(self, projectId):
-        """
-        Get AutoTests Namespaces for Project by Id or GlobalId
-
-        Use case
-        User sets project internal or global identifier and runs method execution
-        System search project
-        System search all autotest related to the project
-        System returns array of autotest with namespaces and classnames (listed in response)
-        """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}/autoTestsNamespaces"
-        return self.SendCommand(method, path)
-
-    def GetWorkItemsByProjectId(self, projectId, **parameters):
-        """
-        Get WorkItems for Project by Id or GlobalId (if isDeleted is true, return deleted WorkItems)
-
-        Use case
-        User sets project internal or global identifier
-        [Optional] User sets isDeleted field value
-        User runs method execution
-        System search project
-        [Optional] If User sets isDeleted field value as true, System search all deleted workitems related to project
-        [Optional] If User sets isDeleted field value as false, System search all workitems related to project which
-        are not deleted
-        If User did not set isDeleted field value, System search all  workitems related to project
-        System returns array of found workitems (listed in response model)
-        """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}/workItems"
-        request_parameters = list()
-        for param in parameters:
-            if param == "isDeleted":
-                # Boolean flag which defines if search must include deleted workitems
-                # boolean
-                request_parameters.append(f"isDeleted={parameters[param]}")
-            if param == "tagNames":
-                # Array of workitem tag names
-                # array
-                request_parameters.append(f"tagNames={parameters[param]}")
-            if param == "includeIterations":
-                # boolean
-                request_parameters.append(f"includeIterations={parameters[param]}")
-            if param == "Skip":
-                # Amount of items to be skipped (offset)
-                request_parameters.append(f"Skip={parameters[param]}")
-            if param == "Take":
-                # Amount of items to be taken (limit)
-                request_parameters.append(f"Take={parameters[param]}")
-            if param == "OrderBy":
-                # SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)
-                request_parameters.append(f"OrderBy={parameters[param]}")
-            if param == "SearchField":
-                # Property name for searching
-                request_parameters.append(f"SearchField={parameters[param]}")
-            if param == "SearchValue":
-                # Value for searching
-                request_parameters.append(f"SearchValue={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def GetConfigurationsByProjectId(self, projectId):
-        """
-        Get Configurations for Project by Id or GlobalId
-
-        Use case
-        User sets project internal or global identifier
-        User runs method execution
-        System search project
-        System search all configurations related to project
-        System returns array of found configurations (listed in response model)
-        """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}/configurations"
-        return self.SendCommand(method, path)
-
-    def GetAttributesByProjectId(self, projectId, **parameters):
-        """
-        Get Projects Attributes by Id or GlobalId
-
-        Use case
-        User sets project internal or global identifier
-        [Optional] User sets isDeleted field value
-        User runs method execution
-        System search project
-        [Optional] If User sets isDeleted field value as true, System search all deleted attributes related to
-        project
-        [Optional] If User sets isDeleted field value as false, System search all attributes related to project which
-        are not deleted
-        [Optional] If User did not set isDeleted field value, System search all attributes related to project
-        System returns array of found attributes (listed in response model)
-        """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}/attributes"
-        request_parameters = list()
-        for param in parameters:
-            if param == "isDeleted":
-                # Boolean flag which defines if search must include deleted attributes
-                # boolean
-                request_parameters.append(f"isDeleted={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def CreateProjectsAttribute(self, data, projectId):
-        """
-        Create Projects Attribute
-
-        Use case
-        User sets attribute parameters (listed in request example) and runs method execution
-        System search project
-        System creates attribute and relates it to the project
-        System returns project attribute properties (example listed in response parameters)
-        """
-        method = "post"
-        path = f"/api/v2/projects/{projectId}/attributes"
-        # data like a CustomAttributePostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
+        if chunk_size <= 0:
+            raise AssertionError("chunk_size should be positive")
+        result = BulkResult(len(data))
+        chunks = _split_chunks(data, chunk_size, chunk_bytes, self.codec.encode)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="testit-bulk") as executor:
+            futures = [executor.submit(self._send_chunk, method, path, start, chunk, retries, result)
+                       for start, chunk in chunks]
+            for future in futures:
+                future.result()
+        return result
+
+    def _paginate(self, list_method, *args, page_size=100, prefetch=0, **parameters):
+        """
+        Call list_method page by page (using Skip and Take parameters) and yield found items one by one
+        If prefetch is set, next pages (no more than prefetch) are requested in worker threads
+        while current page is processed
+        """
+        if page_size <= 0:
+            raise AssertionError("page_size should be positive")
+        skip = parameters.pop("Skip", 0)
+        parameters.pop("Take", None)
+        if prefetch > 0:
+            yield from self._paginate_prefetch(list_method, args, skip, page_size, prefetch, parameters)
+            return
+        while True:
+            page = list_method(*args, Skip=skip, Take=page_size, **parameters)
+            if not isinstance(page, list):
+                raise TestITError(page)
+            yield from page
+            # short page is the last one
+            if len(page) < page_size:
+                return
+            skip += page_size
+
+    @staticmethod
+    def _paginate_prefetch(list_method, args, skip, page_size, prefetch, parameters):
+        """
+        Yield items of pages requested in a pool of prefetch worker threads, keeping order of pages
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="testit-prefetch")
+        pending = deque()
+        try:
+            for _ in range(prefetch):
+                pending.append(executor.submit(list_method, *args, Skip=skip, Take=page_size, **parameters))
+                skip += page_size
+            while True:
+                page = pending.popleft().result()
+                if not isinstance(page, list):
+                    raise TestITError(page)
+                # short page is the last one
+                if len(page) < page_size:
+                    yield from page
+                    return
+                # keep prefetch pages in flight while current page is consumed
+                pending.append(executor.submit(list_method, *args, Skip=skip, Take=page_size, **parameters))
+                skip += page_size
+                yield from page
+        finally:
+            # pages requested beyond the end (or after consumer has stopped) are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
 
-    def UpdateProjectsAttribute(self, data, projectId):
+    def IterAllAutoTests(self, page_size=100, prefetch=0, **parameters):
         """
-        Update Projects Attribute
-
-        Use case
-        User sets project parameters (listed in request example) and runs method execution
-        System updates project
-        System updates attribute related to the project
-        System returns no content response
+        Iterate over all AutoTests page by page (parameters like in GetAllAutoTests)
+        Use OrderBy parameter to get stable order of items between pages
         """
-        method = "put"
-        path = f"/api/v2/projects/{projectId}/attributes"
-        # data like a CustomAttributeModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
+        return self._paginate(self.GetAllAutoTests, page_size=page_size, prefetch=prefetch, **parameters)
 
-    def GetAttributeByProjectId(self, projectId, attributeId):
+    def IterWorkItemResults(self, autoTestId, page_size=100, prefetch=0, **parameters):
         """
-        Get Projects Attribute by Id
-
-        Use case
-        User sets project internal or global identifier
-        User sets project attribute identifier
-        User runs method execution
-        System search project
-        System search project attribute
-        System returns project attribute (listed in response model)
+        Iterate over history of TestResults for AutoTest page by page (parameters like in GetWorkItemResults)
         """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}/attributes/{attributeId}"
-        return self.SendCommand(method, path)
+        return self._paginate(self.GetWorkItemResults, autoTestId, page_size=page_size, prefetch=prefetch, **parameters)
 
-    def DeleteProjectsAttribute(self, projectId, attributeId):
+    def IterAllParameters(self, page_size=100, prefetch=0, **parameters):
         """
-        Delete Projects Attribute by Id
-
-        Use case
-        User sets project identifier and runs method execution
-        User sets attribute identifier
-        User runs method execution
-        System search project
-        System search and delete attribute
-        System returns no content response
+        Iterate over all Parameters page by page (parameters like in GetAllParameters)
         """
-        method = "delete"
-        path = f"/api/v2/projects/{projectId}/attributes/{attributeId}"
-        return self.SendCommand(method, path)
+        return self._paginate(self.GetAllParameters, page_size=page_size, prefetch=prefetch, **parameters)
 
-    def GetTestPlansByProjectId(self, projectId, **parameters):
+    def IterAllProjects(self, page_size=100, prefetch=0, **parameters):
         """
-        Get TestPlans for Project by Id or GlobalId (if isDeleted is true, return deleted TestPlans)
-
-        Use case
-        User sets project internal or global identifier
-        [Optional] User sets isDeleted field value
-        User runs method execution
-        System search project
-        [Optional] If User sets isDeleted field value as true, System search all deleted test plans related to
-        project
-        [Optional] If User sets isDeleted field value as false, System search all test plans related to project which
-        are not deleted
-        [Optional] If User did not set isDeleted field value, System search all v related to project
-        System returns array of found test plans (listed in response model)
-        """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}/testPlans"
-        request_parameters = list()
-        for param in parameters:
-            if param == "isDeleted":
-                # Boolean flag which defines if search must include deleted test plans
-                # boolean
-                request_parameters.append(f"isDeleted={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def GetTestRunsByProjectId(self, projectId, **parameters):
-        """
-        Get TestRuns for Project by Id or GlobalId
-
-        Use case
-        User sets project internal or global identifier
-        User runs method execution
-        System search project
-        System search all test runs related to project
-        System returns array of found test runs (listed in response model)
-        """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}/testRuns"
-        request_parameters = list()
-        for param in parameters:
-            if param == "NotStarted":
-                # boolean
-                request_parameters.append(f"NotStarted={parameters[param]}")
-            if param == "InProgress":
-                # boolean
-                request_parameters.append(f"InProgress={parameters[param]}")
-            if param == "Stopped":
-                # boolean
-                request_parameters.append(f"Stopped={parameters[param]}")
-            if param == "Completed":
-                # boolean
-                request_parameters.append(f"Completed={parameters[param]}")
-            if param == "CreatedDateFrom":
-                # string (date-time)
-                request_parameters.append(f"CreatedDateFrom={parameters[param]}")
-            if param == "CreatedDateTo":
-                # string (date-time)
-                request_parameters.append(f"CreatedDateTo={parameters[param]}")
-            if param == "TestPlanId":
-                # string (uuid)
-                request_parameters.append(f"TestPlanId={parameters[param]}")
-            if param == "Skip":
-                # Amount of items to be skipped (offset)
-                request_parameters.append(f"Skip={parameters[param]}")
-            if param == "Take":
-                # Amount of items to be taken (limit)
-                request_parameters.append(f"Take={parameters[param]}")
-            if param == "OrderBy":
-                # SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)
-                request_parameters.append(f"OrderBy={parameters[param]}")
-            if param == "SearchField":
-                # Property name for searching
-                request_parameters.append(f"SearchField={parameters[param]}")
-            if param == "SearchValue":
-                # Value for searching
-                request_parameters.append(f"SearchValue={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def Export(self, data, projectId, **parameters):
-        """
-        Export Project with tests, sections and configurations in json file
-
-        Use case
-        User sets project internal or global identifier
-        User runs method execution
-        System search project
-        System returns project data as json file, containing project data, related attributes, sections and
-        workitems
-        """
-        method = "post"
-        path = f"/api/v2/projects/{projectId}/export"
-        request_parameters = list()
-        for param in parameters:
-            if param == "includeAttachments":
-                # boolean
-                request_parameters.append(f"includeAttachments={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        # data like a ProjectExportQueryModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def ExportWithTestPlansAndConfigurations(self, data, projectId, **parameters):
-        """
-        Export Project with tests, sections, configurations, testPlans, testSuites and testPoints as json file
-
-        Use case
-        User sets project internal or global identifier
-        User runs method execution
-        System search project
-        System returns project data as json file, containing project data, related attributes, sections, workitems,
-        test plans, test suites, test points and configurations
-        """
-        method = "post"
-        path = f"/api/v2/projects/{projectId}/export-by-testPlans"
-        request_parameters = list()
-        for param in parameters:
-            if param == "includeAttachments":
-                # boolean
-                request_parameters.append(f"includeAttachments={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        # data like a ProjectExportWithTestPlansPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def Import(self, file, **parameters):
-        """
-        Import Project from json file
-        Project can be imported only once (this method or ImportToExistingProject)
-        Next import will sync content in previously imported project.
-
-        Use case
-        User attaches project as json file taken from export or export-by-testPlans method
-        User runs method execution
-        System creates project
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/projects/import"
-        request_parameters = list()
-        for param in parameters:
-            if param == "apiVersion":
-                # string
-                request_parameters.append(f"apiVersion={parameters[param]}")
-            if param == "includeAttachments":
-                # boolean
-                request_parameters.append(f"includeAttachments={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        if isinstance(file, str) and os.path.isfile(file):
-            request_file = open(file, mode="rb")
-        elif isinstance(file, str) and not os.path.isfile(file):
-            raise AssertionError("File object or path to file expected")
-        else:
-            request_file = file
-
-        return self.SendCommand(method, path, request_file)
-
-    def ImportToExistingProject(self, file, projectId, **parameters):
+        Iterate over all Projects page by page (parameters like in GetAllProjects)
         """
-        Import to existing Project from json file.
-        Sections can be imported in only one target project!
-
-        Use case
-        User attaches project as json file taken from export or export-by-testPlans method
-        User runs method execution
-        System updates project
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/projects/{projectId}/import"
-        request_parameters = list()
-        for param in parameters:
-            if param == "apiVersion":
-                # string
-                request_parameters.append(f"apiVersion={parameters[param]}")
-            if param == "includeAttachments":
-                # boolean
-                request_parameters.append(f"includeAttachments={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        if isinstance(file, str) and os.path.isfile(file):
-            request_file = open(file, mode="rb")
-        elif isinstance(file, str) and not os.path.isfile(file):
-            raise AssertionError("File object or path to file expected")
-        else:
-            request_file = file
-
-        return self.SendCommand(method, path, request_file)
+        return self._paginate(self.GetAllProjects, page_size=page_size, prefetch=prefetch, **parameters)
 
-    def GetCustomAttributeTestPlanProjectRelations(self, projectId):
+    def IterSectionsByProjectId(self, projectId, page_size=100, prefetch=0, **parameters):
         """
-        Get project for test plans attributes
-
-        Use case
-        User runs method execution
-        System returns project for test plans attributes by project identifier
+        Iterate over Sections for Project page by page (parameters like in GetSectionsByProjectId)
         """
-        method = "get"
-        path = f"/api/v2/projects/{projectId}/testPlans/attributes"
-        return self.SendCommand(method, path)
+        return self._paginate(self.GetSectionsByProjectId, projectId, page_size=page_size, prefetch=prefetch,
+                              **parameters)
 
-    def CreateCustomAttributeTestPlanProjectRelations(self, data, projectId):
+    def IterWorkItemsByProjectId(self, projectId, page_size=100, prefetch=0, **parameters):
         """
-        Add attributes to project for test plans
-
-        Use case
-        User sets project internal or global identifier and attributes identifiers
-        User runs method execution
-        System updates project and add attributes to project for test plans
-        System returns no content response
+        Iterate over WorkItems for Project page by page (parameters like in GetWorkItemsByProjectId)
         """
-        method = "post"
-        path = f"/api/v2/projects/{projectId}/testPlans/attributes"
-        # data should be a list of uuid string
-        if isinstance(data, Mapping) and not isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a list of items")
-        return self.SendCommand(method, path, data)
+        return self._paginate(self.GetWorkItemsByProjectId, projectId, page_size=page_size, prefetch=prefetch,
+                              **parameters)
 
-    def DeleteCustomAttributeTestPlanProjectRelations(self, projectId, attributeId):
+    def IterTestRunsByProjectId(self, projectId, page_size=100, prefetch=0, **parameters):
         """
-        Delete attribute from project for test plans
-
-        Use case
-        User sets project internal or global identifier and attribute identifier
-        User runs method execution
-        System updates project and delete attribute from project for test plans
-        System returns no content response
+        Iterate over TestRuns for Project page by page (parameters like in GetTestRunsByProjectId)
         """
-        method = "delete"
-        path = f"/api/v2/projects/{projectId}/testPlans/attribute/{attributeId}"
-        return self.SendCommand(method, path)
+        return self._paginate(self.GetTestRunsByProjectId, projectId, page_size=page_size, prefetch=prefetch,
+                              **parameters)
 
-    def UpdateCustomAttributeTestPlanProjectRelations(self, data, projectId):
+    def IterWorkItemsBySectionId(self, sectionId, page_size=100, prefetch=0, **parameters):
         """
-        Update project attribute for test plan
-
-        Use case
-        User sets project internal or global identifier and attribute model
-        User runs method execution
-        System updates project and project attribute for test plan
-        System returns no content response
+        Iterate over WorkItems for Section page by page (parameters like in GetWorkItemsBySectionId)
         """
-        method = "put"
-        path = f"/api/v2/projects/{projectId}/testPlans/attribute"
-        # data like a CustomAttributeTestPlanProjectRelationPutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
+        return self._paginate(self.GetWorkItemsBySectionId, sectionId, page_size=page_size, prefetch=prefetch,
+                              **parameters)
 
-    def DeleteProjectAutoTests(self, projectId):
+    def IterWorkItemsById(self, testSuiteId, page_size=100, prefetch=0, **parameters):
         """
-        Delete all AutoTests from Project
-
-        Use case
-        User sets project internal or global identifier
-        User runs method execution
-        System delete all autotests from project
-        System returns no content response
+        Iterate over WorkItems for TestSuite page by page (parameters like in GetWorkItemsById)
         """
-        method = "delete"
-        path = f"/api/v2/projects/{projectId}/autoTests"
-        return self.SendCommand(method, path)
+        return self._paginate(self.GetWorkItemsById, testSuiteId, page_size=page_size, prefetch=prefetch, **parameters)
 
-    def GetSectionById(self, sectionId, **parameters):
+    def AddAttachment(self, file, progress=None, **parameters):
         """
-        Get Section by id
-
-        Use case
-        User sets section internal (guid format) identifier
-        User runs method execution
-        System search section by the section identifier
-        [Optional] If isDeleted flag equals false, deleted workitems are not being searched.
-        If true, deleted workitems are also being searched, null for all workitems.
-        System returns section
-        """
-        method = "get"
-        path = f"/api/v2/sections/{sectionId}"
-        request_parameters = list()
-        for param in parameters:
-            if param == "isDeleted":
-                # Flag that defines if deleted section must be include in the response
-                # boolean
-                request_parameters.append(f"isDeleted={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def DeleteSection(self, sectionId):
-        """
-        Delete Section by id
+        Create attachment
 
         Use case
-        User sets section identifier
+        User send file
         User runs method execution
-        System search section by the identifier
-        System search and delete nested sections of the found section
-        System search and delete workitems related to the found nested sections
-        System deletes initial section and related workitem
-        System returns no content response
-        """
-        method = "delete"
-        path = f"/api/v2/sections/{sectionId}"
-        return self.SendCommand(method, path)
-
-    def CreateSection(self, data):
-        """
-        Create Section
-
-        Use case
-        User sets section properties (listed in request example)
-        User runs method execution
-        System creates section property values
-        System returns section (listed in response example)
-        """
-        method = "post"
-        path = f"/api/v2/sections"
-        # data like a SectionPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def UpdateSection(self, data):
-        """
-        Update Section
-
-        Use case
-        User sets section properties (listed in request example)
-        User runs method execution
-        System search section by the identifier
-        System updates section using the property values
-        System returns no content response
-        """
-        method = "put"
-        path = f"/api/v2/sections"
-        # data like a SectionPutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def Rename(self, data):
-        """
-        Rename Section
-
-        Use case
-        User sets section identifier and new name (listed in request example)
-        User runs method execution
-        System search section by the identifier
-        System updates section name using the new name
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/sections/rename"
-        # data like a SectionRenameModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def Move(self, data):
-        """
-        Move Section. Can be moved inside another section. It is possible to indicate a project
-
-        Use case
-        User sets section identifier, old parent identifier, parent identifier and  next section identifier (listed
-        in request example)
-        User runs method execution
-        System search section by the identifier
-        System unlink section from the old parent and links to the new one
-        System updates section rank using the next section identifier
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/sections/move"
-        # data like a SectionMoveModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetWorkItemsBySectionId(self, sectionId, **parameters):
-        """
-        Get WorkItems for Section (if isDeleted is true, return deleted WorkItems)
-
-        Use case
-        User sets section identifier
-        User runs method execution
-        System search section by the identifier
-        System search workitems related to the section
-        [Optional] If isDeleted flag equals false, deleted workitems are not being searched.
-        If true, deleted workitems are also being searched, null for all workitems.
-        System returns workitem collection
-        """
-        method = "get"
-        path = f"/api/v2/sections/{sectionId}/workItems"
-        request_parameters = list()
-        for param in parameters:
-            if param == "isDeleted":
-                # Flag that defines if deleted workitems must be include in the response
-                # boolean
-                request_parameters.append(f"isDeleted={parameters[param]}")
-            if param == "tagNames":
-                # Array of workitem tag names
-                # array
-                request_parameters.append(f"tagNames={parameters[param]}")
-            if param == "includeIterations":
-                # boolean
-                request_parameters.append(f"includeIterations={parameters[param]}")
-            if param == "Skip":
-                # Amount of items to be skipped (offset)
-                request_parameters.append(f"Skip={parameters[param]}")
-            if param == "Take":
-                # Amount of items to be taken (limit)
-                request_parameters.append(f"Take={parameters[param]}")
-            if param == "OrderBy":
-                # SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)
-                request_parameters.append(f"OrderBy={parameters[param]}")
-            if param == "SearchField":
-                # Property name for searching
-                request_parameters.append(f"SearchField={parameters[param]}")
-            if param == "SearchValue":
-                # Value for searching
-                request_parameters.append(f"SearchValue={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def GetTestPlanById(self, testPlanId):
-        """
-        Get TestPlan by Id
-
-        Use case
-        User sets test plan identifier
-        User runs method execution
-        System search  test plan by the identifier
-        System returns test plan
-        """
-        method = "get"
-        path = f"/api/v2/testPlans/{testPlanId}"
-        return self.SendCommand(method, path)
-
-    def DeleteTestPlan(self, testPlanId):
-        """
-        Delete TestPlan
-
-        Use case
-        User sets test plan identifier
-        User runs method execution
-        System delete test plan
-        System returns no content response
-        """
-        method = "delete"
-        path = f"/api/v2/testPlans/{testPlanId}"
-        return self.SendCommand(method, path)
-
-    def CreateTestPlan(self, data):
-        """
-        Create TestPlan
-
-        Use case
-        User sets test plan properties (listed in request example)
-        User runs method execution
-        System creates test plan
-        System returns test plan (listed in response example)
-        """
-        method = "post"
-        path = f"/api/v2/testPlans"
-        # data like a TestPlanPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def UpdateTestPlan(self, data):
-        """
-        Update TestPlan
-
-        Use case
-        User sets test plan properties(listed in request example)
-        User runs method execution
-        System updates test plan
-        System returns no content response
-        """
-        method = "put"
-        path = f"/api/v2/testPlans"
-        # data like a TestPlanPutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def RestoreTestPlan(self, testPlanId):
-        """
-        Restore TestPlan
-
-        Use case
-        User sets test plan identifier
-        User runs method execution
-        System restores test plan
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testPlans/{testPlanId}/restore"
-        return self.SendCommand(method, path)
-
-    def Clone(self, testPlanId):
-        """
-        Clone TestPlan
-
-        Use case
-        User sets test plan identifier
-        User runs method execution
-        System clones test plan
-        System returns test plan (listed in response example)
-        """
-        method = "post"
-        path = f"/api/v2/testPlans/{testPlanId}/clone"
-        return self.SendCommand(method, path)
-
-    def Start(self, testPlanId):
-        """
-        Start TestPlan
-
-        Use case
-        User sets test plan identifier
-        User runs method execution
-        System starts the test plan and updates test plan status
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testPlans/{testPlanId}/start"
-        return self.SendCommand(method, path)
-
-    def Pause(self, testPlanId):
-        """
-        Pause TestPlan
-
-        Use case
-        User sets test plan identifier
-        User runs method execution
-        System pauses the test plan and updates test plan status
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testPlans/{testPlanId}/pause"
-        return self.SendCommand(method, path)
-
-    def Complete(self, testPlanId):
-        """
-        Complete TestPlan
-
-        Use case
-        User sets test plan identifier
-        User runs method execution
-        System completes the test plan and updates test plan status
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testPlans/{testPlanId}/complete"
-        return self.SendCommand(method, path)
-
-    def GetTestSuitesById(self, testPlanId):
-        """
-        Get TestSuites Tree By Id
-
-        Use case
-        User sets test plan identifier
-        User runs method execution
-        System finds test suites related to the test plan
-        System returns test suites as a tree model (listed in response example)
-        """
-        method = "get"
-        path = f"/api/v2/testPlans/{testPlanId}/testSuites"
-        return self.SendCommand(method, path)
-
-    def AddWorkItemsWithSections(self, data, testPlanId):
-        """
-        Add WorkItems to TestPlan with Sections as TestSuites
-
-        Use case
-        User sets TestPlan identifier
-        User sets WorkItem identifiers (listed in request example)
-        User runs method execution
-        System added WorkItems and Sections to TestPlan
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testPlans/{testPlanId}/workItems/withSections"
-        # data should be a list of uuid string
-        if isinstance(data, Mapping) and not isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a list of items")
-        return self.SendCommand(method, path, data)
-
-    def AddTestPointsWithSections(self, data, testPlanId):
-        """
-        Add test-points to test suite with sections
-        """
-        method = "post"
-        path = f"/api/v2/testPlans/{testPlanId}/test-points/withSections"
-        # data like a WorkItemSelectModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetAttachments(self, testResultId):
-        """
-        Get all attachments of TestResult
-
-        Use case
-        User sets testResultId
-        User runs method execution
-        System search all attachments of the test result
-        System returns attachments enumeration
-        """
-        method = "get"
-        path = f"/api/v2/testResults/{testResultId}/attachments"
-        return self.SendCommand(method, path)
-
-    def CreateAttachment(self, file, testResultId):
-        """
-        Upload and link attachment to TestResult
-
-        Use case
-        User sets testResultId
-        User attaches a file
-        System creates attachment and links it to the test result
-        System returns attachment identifier
-        """
-        method = "post"
-        path = f"/api/v2/testResults/{testResultId}/attachments"
-        if isinstance(file, str) and os.path.isfile(file):
-            request_file = open(file, mode="rb")
-        elif isinstance(file, str) and not os.path.isfile(file):
-            raise AssertionError("File object or path to file expected")
-        else:
-            request_file = file
-
-        return self.SendCommand(method, path, request_file)
-
-    def DownloadAttachment(self, attachmentId, testResultId, **parameters):
-        """
-        Get attachment of TestResult
-
-        Use case
-        User sets attachmentId and testResultId
-        [Optional] User sets resize configuration
-        User runs method execution
-        System search attachments by the attachmentId and the testResultId
-        [Optional] If resize configuration is set, System resizes the attachment according to the resize
-        configuration
-        [Optional] Otherwise, System does not resize the attachment
-        System returns attachment as a file
-        """
-        method = "get"
-        path = f"/api/v2/testResults/{testResultId}/attachments/{attachmentId}"
-        request_parameters = list()
-        for param in parameters:
-            if param == "Width":
-                # integer (int32)
-                request_parameters.append(f"Width={parameters[param]}")
-            if param == "Height":
-                # integer (int32)
-                request_parameters.append(f"Height={parameters[param]}")
-            if param == "ResizeOption":
-                if parameters[param] not in ['Crop', 'AddBackgroundStripes']:
-                    raise AssertionError("Unsupported value")
-                request_parameters.append(f"ResizeOption={parameters[param]}")
-            if param == "BackgroundColor":
-                # string
-                request_parameters.append(f"BackgroundColor={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def DeleteAttachment(self, testResultId, attachmentId):
-        """
-        Remove attachment and unlink from TestResult
-
-        Use case
-        User sets testResultId and attachmentId
-        User attaches a file
-        User runs method execution
-        System deletes attachment and unlinks it from the test result
-        System returns attachment identifier
-        """
-        method = "delete"
-        path = f"/api/v2/testResults/{testResultId}/attachments/{attachmentId}"
-        return self.SendCommand(method, path)
-
-    def GetAttachment(self, attachmentId, testResultId):
-        """
-        Get Metadata of TestResult's attachment
-
-        Use case
-        User sets attachmentId and testResultId
-        User runs method execution
-        System search attachment by the attachmentId and the testResultId
-        System returns attachment data
-        """
-        method = "get"
-        path = f"/api/v2/testResults/{testResultId}/attachments/{attachmentId}/info"
-        return self.SendCommand(method, path)
-
-    def CreateEmpty(self, data):
-        """
-        Create empty TestRun
-
-        Use case
-        User sets test run model (listed in the request example)
-        User runs method execution
-        System creates test run
-        System returns test run model
-        """
-        method = "post"
-        path = f"/api/v2/testRuns"
-        # data like a TestRunV2PostShortModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def UpdateEmpty(self, data):
-        """
-        Update empty TestRun
-
-        Use case
-        User sets test run properties (listed in the request example)
-        User runs method execution
-        System updates test run
-        System returns returns no content response
-        """
-        method = "put"
-        path = f"/api/v2/testRuns"
-        # data like a TestRunV2PutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def CreateAndFillByWorkItems(self, data):
-        """
-        Create TestRun with TestPoints selected using ConfigurationIds and WorkItem Ids
-
-        Use case
-        User sets test run properties (listed in the request example)
-        User sets relative configuration and workitem ids
-        User runs method execution
-        System creates test run
-        System finds workitems and configurations using ids listed by user
-        System creates test result by test points which use workitems and configurations
-        System returns test run model
-        """
-        method = "post"
-        path = f"/api/v2/testRuns/byWorkItems"
-        # data like a TestRunFillByWorkItemsPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def CreateAndFillByConfigurations(self, data):
-        """
-        Create TestRun with TestPointSelectors based on ConfigurationId and WorkItem Ids
-
-        Use case
-        User sets test run properties (listed in the request example)
-        User sets relative configuration and workitem ids
-        User runs method execution
-        System creates test run
-        System finds workitems and configurations using ids listed by user
-        System creates test result by test points which use workitems and configurations
-        System returns test run model
-        """
-        method = "post"
-        path = f"/api/v2/testRuns/byConfigurations"
-        # data like a TestRunFillByConfigurationsPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def CreateAndFillByAutoTests(self, data):
-        """
-        Create TestRun without TestPoints using ConfigurationIds and AutoTestIds
-
-        Use case
-        User sets test run properties (listed in the request example)
-        User sets relative configuration and workitem ids
-        User runs method execution
-        System creates test run
-        System finds autotests and configurations using ids listed by user
-        System creates test result by test points which use autotests and configurations
-        System returns test run model
-        """
-        method = "post"
-        path = f"/api/v2/testRuns/byAutoTests"
-        # data like a TestRunFillByAutoTestsPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetTestRunById(self, testRunId):
-        """
-        Get TestRun by Id
-
-        Use case
-        User sets test run identifier
-        User runs method execution
-        System finds test run
-        System returns test run
-        """
-        method = "get"
-        path = f"/api/v2/testRuns/{testRunId}"
-        return self.SendCommand(method, path)
-
-    def StartTestRun(self, testRunId):
-        """
-        Start TestRun
-
-        Use case
-        User sets test run identifier
-        User runs method execution
-        System starts test run
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testRuns/{testRunId}/start"
-        return self.SendCommand(method, path)
-
-    def StopTestRun(self, testRunId):
-        """
-        Stop TestRun
-
-        Use case
-        User sets test run identifier
-        User runs method execution
-        System stops test run
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testRuns/{testRunId}/stop"
-        return self.SendCommand(method, path)
-
-    def CompleteTestRun(self, testRunId):
-        """
-        Complete TestRun
-
-        Use case
-        User sets test run identifier
-        User runs method execution
-        System completes test run
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testRuns/{testRunId}/complete"
-        return self.SendCommand(method, path)
-
-    def SetAutoTestResultsForTestRun(self, data, testRunId):
-        """
-        Set AutoTest Results For TestRun
-
-        Use case
-        User sets test run identifier
-        User sets test result model (listed in request parameters)
-        User runs method execution
-        System sets test results of autotest listed in request in test run
-        System returns array of test results identifiers
-        """
-        method = "post"
-        path = f"/api/v2/testRuns/{testRunId}/testResults"
-        # data like a list of AutoTestResultsForTestRunModel
-        if isinstance(data, Mapping) and not isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a list of dicts")
-        return self.SendCommand(method, path, data)
-
-    def GetTestSuiteById(self, testSuiteId):
-        """
-        Get TestSuite by Id
-
-        Use case
-        User sets test suite identifier
-        User runs method execution
-        System search test suite by identifier
-        System returns test suite
-        """
-        method = "get"
-        path = f"/api/v2/testSuites/{testSuiteId}"
-        return self.SendCommand(method, path)
-
-    def DeleteTestSuite(self, testSuiteId):
-        """
-        Delete TestSuite
-
-        Use case
-        User sets test suite identifier
-        User runs method execution
-        System search test suite by identifier
-        System deletes test suite
-        System returns no content response
-        """
-        method = "delete"
-        path = f"/api/v2/testSuites/{testSuiteId}"
-        return self.SendCommand(method, path)
-
-    def CreateTestSuite(self, data):
-        """
-        Create TestSuite
-
-        Use case
-        User sets test suite model (listed in request parameters)
-        User runs method execution
-        System creates test suite
-        System returns test suite
-        """
-        method = "post"
-        path = f"/api/v2/testSuites"
-        # data like a TestSuiteV2PostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def UpdateTestSuite(self, data):
-        """
-        Update TestSuite
-
-        Use case
-        User sets test suite model (listed in request parameters)
-        User runs method execution
-        System updates test suite
-        System returns test suite
-        """
-        method = "put"
-        path = f"/api/v2/testSuites"
-        # data like a TestSuiteV2PutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetTestPointsById(self, testSuiteId):
-        """
-        Get TestPoints By Id
-
-        Use case
-        User sets test suite identifier
-        User runs method execution
-        System search test suite by identifier
-        System search test points related to the test suite
-        System returns test points array
-        """
-        method = "get"
-        path = f"/api/v2/testSuites/{testSuiteId}/testPoints"
-        return self.SendCommand(method, path)
-
-    def GetTestResultsById(self, testSuiteId):
-        """
-        Get TestResults By Id
-
-        Use case
-        User sets test suite identifier
-        User runs method execution
-        System search test suite by identifier
-        System search test points related to the test suite
-        System search test results related to the test points
-        System returns test results array
-        """
-        method = "get"
-        path = f"/api/v2/testSuites/{testSuiteId}/testResults"
-        return self.SendCommand(method, path)
-
-    def GetWorkItemsById(self, testSuiteId, **parameters):
-        """
-        Get WorkItems By Id
-
-        Use case
-        User sets test suite identifier
-        [Optional] User sets isDeleted property as true
-        User runs method execution
-        System search test suite by identifier
-        System search test points related to the test suite
-        System search workitems related to the test points
-        [Optional] User sets isDeleted property is set as true, System includes deleted workitems
-        Otherwise, system applies filter which excludes deleted workitems from all found workitems
-        System returns workitems array
-        """
-        method = "get"
-        path = f"/api/v2/testSuites/{testSuiteId}/workItems"
-        request_parameters = list()
-        for param in parameters:
-            if param == "isDeleted":
-                # Flag that defines if deleted workitems must be include in the response
-                # boolean
-                request_parameters.append(f"isDeleted={parameters[param]}")
-            if param == "tagNames":
-                # Array of workitem tag names
-                # array
-                request_parameters.append(f"tagNames={parameters[param]}")
-            if param == "Skip":
-                # Amount of items to be skipped (offset)
-                request_parameters.append(f"Skip={parameters[param]}")
-            if param == "Take":
-                # Amount of items to be taken (limit)
-                request_parameters.append(f"Take={parameters[param]}")
-            if param == "OrderBy":
-                # SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)
-                request_parameters.append(f"OrderBy={parameters[param]}")
-            if param == "SearchField":
-                # Property name for searching
-                request_parameters.append(f"SearchField={parameters[param]}")
-            if param == "SearchValue":
-                # Value for searching
-                request_parameters.append(f"SearchValue={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def SetWorkItemsByTestSuiteId(self, data, testSuiteId):
-        """
-        Set WorkItems By TestSuite Id
-
-        Use case
-        User sets test suite identifier
-        User sets collection of workitems identifiers
-        User runs method execution
-        System search test suite by identifier
-        System search test points related to the test suite
-        System search workitems
-        System restores(if exist) or creates test points with listed workitems
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testSuites/{testSuiteId}/workItems"
-        # data should be a list of uuid string
-        if isinstance(data, Mapping) and not isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a list of items")
-        return self.SendCommand(method, path, data)
-
-    def AddTestPointsToTestSuite(self, data, testSuiteId):
-        """
-        Add test-points to test suite
-        """
-        method = "post"
-        path = f"/api/v2/testSuites/{testSuiteId}/test-points"
-        # data like a WorkItemSelectModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetConfigurationsByTestSuiteId(self, testSuiteId):
-        """
-        Get Configurations By Id
-
-        Use case
-        User sets test suite identifier
-        User runs method execution
-        System search test suite by identifier
-        System search test points related to the test suite
-        System search configurations related to the test points
-        System returns configurations array
-        """
-        method = "get"
-        path = f"/api/v2/testSuites/{testSuiteId}/configurations"
-        return self.SendCommand(method, path)
-
-    def SetConfigurationsByTestSuiteId(self, data, testSuiteId):
-        """
-        Set Configurations By TestSuite Id
-
-        Use case
-        User sets test suite identifier
-        User sets collection of configuration identifiers
-        User runs method execution
-        System search test suite by identifier
-        System search test points related to the test suite
-        System search configuration
-        System restores(if exist) or creates test points with listed configuration
-        System returns no content response
-        """
-        method = "post"
-        path = f"/api/v2/testSuites/{testSuiteId}/configurations"
-        # data should be a list of uuid string
-        if isinstance(data, Mapping) and not isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a list of items")
-        return self.SendCommand(method, path, data)
-
-    def GetWorkItemById(self, workItemId, **parameters):
-        """
-        Get Test Case, Checklist or Shared Step by Id or GlobalId
-
-        Use case
-        User sets workitem identifier
-        [Optional] User sets workitem version identifier
-        [Optional] User sets workitem version number
-        User runs method execution
-        System search workitem by identifier
-        [Optional] if User sets workitem version identifier, system search workitem version by identifier.
-        [Optional] if user sets workitem version number, system search workitem version by number
-        Otherwise, system search last workitem version
-        System returns workitem
-        """
-        method = "get"
-        path = f"/api/v2/workItems/{workItemId}"
-        request_parameters = list()
-        for param in parameters:
-            if param == "versionId":
-                # WorkItem version (guid format) identifier"
-                # string (uuid)
-                request_parameters.append(f"versionId={parameters[param]}")
-            if param == "versionNumber":
-                # WorkItem version number (0 is the last version)"
-                # integer (int32)
-                request_parameters.append(f"versionNumber={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def DeleteWorkItem(self, workItemId):
-        """
-        Delete Test Case, Checklist or Shared Step by Id or GlobalId
-
-        Use case
-        User sets workitem identifier
-        User runs method execution
-        System deletes workitem
-        System returns no content response
-        """
-        method = "delete"
-        path = f"/api/v2/workItems/{workItemId}"
-        return self.SendCommand(method, path)
-
-    def GetIterations(self, workItemId, **parameters):
-        """
-        Get iterations by workitem Id or GlobalId
-        """
-        method = "get"
-        path = f"/api/v2/workItems/{workItemId}/iterations"
-        request_parameters = list()
-        for param in parameters:
-            if param == "versionId":
-                # WorkItem version (guid format) identifier
-                # string (uuid)
-                request_parameters.append(f"versionId={parameters[param]}")
-            if param == "versionNumber":
-                # WorkItem version number (0 is the last version)"
-                # integer (int32)
-                request_parameters.append(f"versionNumber={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
-
-    def CreateWorkItem(self, data):
-        """
-        Create Test Case, Checklist or Shared Step
-
-        Use case
-        User sets workitem properties (listed in request parameters)
-        User runs method execution
-        System creates workitem by identifier
-        System returns workitem model (listed in response parameters)
-        """
-        method = "post"
-        path = f"/api/v2/workItems"
-        # data like a WorkItemPostModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def UpdateWorkItem(self, data):
-        """
-        Update Test Case, Checklist or Shared Step
-
-        Use case
-        User sets workitem properties (listed in request parameters)
-        User runs method execution
-        System updates workitem by identifier
-        System returns updated workitem model (listed in response parameters)
-        """
-        method = "put"
-        path = f"/api/v2/workItems"
-        # data like a WorkItemPutModel
-        if not isinstance(data, Mapping) and isinstance(data, Sequence):
-            raise AssertionError("requestBody should be a dict")
-        return self.SendCommand(method, path, data)
-
-    def GetAutoTestsForWorkItem(self, workItemId):
-        """
-        Get all AutoTests linked to WorkItem by Id or GlobalId
-
-        Use case
-        User sets workitem identifier
-        User runs method execution
-        System search workitem by identifier
-        System search all autotests, related to found workitem
-        System returns list of found autotests
-        """
-        method = "get"
-        path = f"/api/v2/workItems/{workItemId}/autoTests"
-        return self.SendCommand(method, path)
-
-    def DeleteAllWorkItemsFromAutoTest(self, workItemId):
-        """
-        Delete all links AutoTests from WorkItem by Id or GlobalId
-
-        Use case
-        User sets workitem identifier
-        User runs method execution
-        System search workitem by identifier
-        System search and delete all autotests, related to found workitem
-        System returns no content response
-        """
-        method = "delete"
-        path = f"/api/v2/workItems/{workItemId}/autoTests"
-        return self.SendCommand(method, path)
-
-    def GetWorkItemChronology(self, workItemId):
-        """
-        Get WorkItem chronology by Id or GlobalId
-
-        Use case
-        User sets workitem identifier
-        User runs method execution
-        System search workitem by identifier
-        System search test results of all autotests, related to found workitem
-        System sort results by CompletedOn ascending, then by CreatedDate ascending
-        System returns sorted collection of test results
-        """
-        method = "get"
-        path = f"/api/v2/workItems/{workItemId}/chronology"
-        return self.SendCommand(method, path)
-
-    def GetWorkItemVersions(self, workItemId, **parameters):
-        """
-        Get WorkItem versions
-
-        Use case
-        User sets workitem identifier
-        [Optional] User sets workitem version identifier
-        User runs method execution
-        System search workitem by identifier
-        [Optional] If User set workitem version identifier, System search workitem version by version identifier
-        Otherwise, system search all version of workitem
-        System returns array of workitem version models (listed in response example)
-        """
-        method = "get"
-        path = f"/api/v2/workItems/{workItemId}/versions"
-        request_parameters = list()
-        for param in parameters:
-            if param == "workItemVersionId":
-                # WorkItem version (guid format) identifier"
-                # string (uuid)
-                request_parameters.append(f"workItemVersionId={parameters[param]}")
-            if param == "versionNumber":
-                # WorkItem version (integer format) number"
-                # integer (int32)
-                request_parameters.append(f"versionNumber={parameters[param]}")
-        if request_parameters:
-            path += "?" + "&".join(request_parameters)
-        return self.SendCommand(method, path)
+        System upload file
+        System create attachment
+        System return attachment model (listed in response parameters)
+        If attachment_cache is set for the client, file with already uploaded content is not uploaded again
+        and remembered attachment model is returned
+        """
+        endpoint = _endpoint_table()["AddAttachment"]
+        method = endpoint.method
+        path, file = endpoint.build("AddAttachment", (file,), parameters)
+        if self.attachment_cache is not None:
+            return self._add_cached_attachment(method, path, file, progress)
+        return self.SendCommand(method, path, request_file=file, progress=progress)
+
+    def _add_cached_attachment(self, method, path, file, progress=None):
+        """
+        Upload file only if attachment with the same content is not remembered in attachment cache
+        """
+        digest = self.attachment_cache.digest(file)
+        if digest is not None:
+            attachment = self.attachment_cache.get(digest)
+            if attachment is not None:
+                return attachment
+        attachment = self.SendCommand(method, path, request_file=file, progress=progress)
+        if digest is not None and isinstance(attachment, Mapping) and attachment.get('id'):
+            self.attachment_cache.put(digest, attachment)
+        return attachment
+
+    def CreateMultipleInChunks(self, data, chunk_size=500, chunk_bytes=None, max_workers=4, retries=1):
+        """
+        Create AutoTests multiple, sending them in chunks in parallel
+
+        Like CreateMultiple, but data is split to chunks of no more than chunk_size autotests
+        and (if set) no more than chunk_bytes of json, and chunks are sent by max_workers threads.
+        Chunk failed with network error or temporary TestIT error (429, 5xx) is retried (no more than retries times)
+        after RetryPolicy delay, chunk rejected by TestIT (4xx) is split in halves until bad autotests are found.
+        Return BulkResult: results - created autotest models in order of data, errors - index of autotest -> exception
+        """
+        endpoint = _endpoint_table()["CreateMultiple"]
+        method = endpoint.method
+        path, data = endpoint.build("CreateMultipleInChunks", (data,), {})
+        if self.validate:
+            import testit_validation
+            testit_validation.validate(endpoint.body, data)
+        return self._send_in_chunks(method, path, data, chunk_size, chunk_bytes, max_workers, retries)
+
+    def UpdateMultipleInChunks(self, data, chunk_size=500, chunk_bytes=None, max_workers=4, retries=1):
+        """
+        Update AutoTests multiple, sending them in chunks in parallel
+
+        Like UpdateMultiple, but data is split to chunks of no more than chunk_size autotests
+        and (if set) no more than chunk_bytes of json, and chunks are sent by max_workers threads.
+        Chunk failed with network error or temporary TestIT error (429, 5xx) is retried (no more than retries times)
+        after RetryPolicy delay, chunk rejected by TestIT (4xx) is split in halves until bad autotests are found.
+        Return BulkResult: errors - index of autotest -> exception
+        """
+        endpoint = _endpoint_table()["UpdateMultiple"]
+        method = endpoint.method
+        path, data = endpoint.build("UpdateMultipleInChunks", (data,), {})
+        if self.validate:
+            import testit_validation
+            testit_validation.validate(endpoint.body, data)
+        return self._send_in_chunks(method, path, data, chunk_size, chunk_bytes, max_workers, retries)
+
+    def ExportToFile(self, data, projectId, destination, chunk_size=1024 * 1024, atomic=True, progress=None,
+                     **parameters):
+        """
+        Export Project to file, streaming it chunk by chunk (data and parameters like in Export)
+
+        :param destination: Path to file or file object opened in binary mode
+        :param chunk_size: Size of chunks the export is written by
+        :param atomic: Write to temporary file and rename it to destination path only when export is complete
+        :param progress: Callable (bytes_received, total_bytes or None) called after every chunk
+        Return number of received bytes
+        """
+        endpoint = _endpoint_table()["Export"]
+        method = endpoint.method
+        path, data = endpoint.build("ExportToFile", (data, projectId), parameters)
+        if self.validate:
+            import testit_validation
+            testit_validation.validate(endpoint.body, data)
+        return self._download(method, path, destination, data, chunk_size, 0, atomic, progress)
+
+    def ExportWithTestPlansAndConfigurationsToFile(self, data, projectId, destination, chunk_size=1024 * 1024,
+                                                   atomic=True, progress=None, **parameters):
+        """
+        Export Project with test plans and configurations to file, streaming it chunk by chunk
+        (data and parameters like in ExportWithTestPlansAndConfigurations)
+
+        :param destination: Path to file or file object opened in binary mode
+        :param chunk_size: Size of chunks the export is written by
+        :param atomic: Write to temporary file and rename it to destination path only when export is complete
+        :param progress: Callable (bytes_received, total_bytes or None) called after every chunk
+        Return number of received bytes
+        """
+        endpoint = _endpoint_table()["ExportWithTestPlansAndConfigurations"]
+        method = endpoint.method
+        path, data = endpoint.build("ExportWithTestPlansAndConfigurationsToFile", (data, projectId), parameters)
+        if self.validate:
+            import testit_validation
+            testit_validation.validate(endpoint.body, data)
+        return self._download(method, path, destination, data, chunk_size, 0, atomic, progress)
+
+    def CreateAttachments(self, files, max_workers=8, retries=2):
+        """
+        Upload and link attachments to TestResults from a pool of worker threads
+
+        :param files: List of pairs (testResultId, path to file or file object)
+        :param max_workers: Number of files uploaded at the same time (keep pool_maxsize of the client not less)
+        :param retries: Number of times upload of one file failed with network error or temporary TestIT error
+        (429, 5xx) is repeated
+        Return BulkResult: results - attachment identifiers in order of files, errors - index of pair -> exception
+        Use dict(zip(files, result.results)) to map pairs to attachment identifiers
+        """
+        endpoint = _endpoint_table()["CreateAttachment"]
+        # (path, file) of every upload, files are checked before the first one is sent
+        uploads = [endpoint.build("CreateAttachments", (file, testResultId), {}) for testResultId, file in files]
+        result = BulkResult(len(uploads))
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="testit-attachments") as executor:
+            futures = [executor.submit(self._create_attachment_with_retry, index, endpoint.method, path, file, retries,
+                                       result)
+                       for index, (path, file) in enumerate(uploads)]
+            for future in futures:
+                future.result()
+        return result
+
+    def _create_attachment_with_retry(self, index, method, path, file, retries, result):
+        """
+        Upload one attachment for CreateAttachments, repeating it on failure
+        """
+        # file object is sent from the same position on every attempt
+        file_position = None if isinstance(file, (str, os.PathLike)) else file.tell()
+        for attempt in range(1, retries + 2):
+            if file_position is not None:
+                file.seek(file_position)
+            try:
+                response = self._send_checked(method, path, request_file=file)
+            except (TestITError, requests.RequestException, OSError) as error:
+                # file rejected by TestIT (4xx) is rejected again
+                if attempt > retries or not self._is_transient(error):
+                    result.errors[index] = error
+                    return
+                if self.retry is not None:
+                    time.sleep(self._retry_delay(attempt, error))
+                continue
+            result.results[index] = response.get('id') if isinstance(response, Mapping) else response
+            return
+
+    def DownloadAttachmentToFile(self, attachmentId, testResultId, destination, chunk_size=1024 * 1024,
+                                 resume_attempts=3, atomic=True, progress=None, **parameters):
+        """
+        Download attachment of TestResult to file, streaming it chunk by chunk (parameters like in DownloadAttachment)
+
+        :param destination: Path to file or file object opened in binary mode
+        :param chunk_size: Size of chunks the attachment is written by
+        :param resume_attempts: Number of times download is resumed from the last received byte after connection
+        is dropped
+        :param atomic: Write to temporary file and rename it to destination path only when download is complete
+        :param progress: Callable (bytes_received, total_bytes or None) called after every chunk
+        Return number of received bytes
+        """
+        endpoint = _endpoint_table()["DownloadAttachment"]
+        method = endpoint.method
+        path, _ = endpoint.build("DownloadAttachmentToFile", (attachmentId, testResultId), parameters)
+        return self._download(method, path, destination, None, chunk_size, resume_attempts, atomic, progress)
+
+
+def _endpoint_method(name, endpoint):
+    """
+    Create method of TestITClient sending request described by endpoint
+    """
+    import inspect
+    if endpoint.body == "file":
+        def method(self, *args, progress=None, **parameters):
+            if len(args) > len(endpoint.args):
+                # progress passed as positional argument after file and path arguments
+                *args, progress = args
+            path, file = endpoint.build(name, args, parameters)
+            return self.SendCommand(endpoint.method, path, request_file=file, progress=progress)
+    elif endpoint.body is not None:
+        def method(self, *args, compress=None, **parameters):
+            path, data = endpoint.build(name, args, parameters)
+            if self.validate:
+                import testit_validation
+                testit_validation.validate(endpoint.body, data)
+            return self.SendCommand(endpoint.method, path, data, compress=compress)
+    else:
+        def method(self, *args, **parameters):
+            path, _ = endpoint.build(name, args, parameters)
+            return self.SendCommand(endpoint.method, path)
+    signature = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    signature += [inspect.Parameter(arg, inspect.Parameter.POSITIONAL_OR_KEYWORD) for arg in endpoint.args]
+    if endpoint.body == "file":
+        signature.append(inspect.Parameter("progress", inspect.Parameter.POSITIONAL_OR_KEYWORD, default=None))
+    elif endpoint.body is not None:
+        signature.append(inspect.Parameter("compress", inspect.Parameter.KEYWORD_ONLY, default=None))
+    if endpoint.query:
+        signature.append(inspect.Parameter("parameters", inspect.Parameter.VAR_KEYWORD))
+    method.__signature__ = inspect.Signature(signature)
+    method.__name__ = name
+    method.__qualname__ = f"TestITClient.{name}"
+    method.__doc__ = endpoint.doc
+    if endpoint.query:
+        lines = [f"{param}: {kind} - {description}" if description else f"{param}: {kind}"
+                 for param, (kind, description) in endpoint.query.items()]
+        method.__doc__ = (endpoint.doc.rstrip() + "\n\n        Parameters:\n"
+                          + "".join(f"        {line}\n" for line in lines))
+    return method
+
+
+def _add_endpoint_method(name):
+    """
+    Build API method from the table of endpoints and add it to TestITClient, return its name
+    """
+    if name not in TestITClient.__dict__:
+        setattr(TestITClient, name, _endpoint_method(name, _endpoint_table()[name]))
+    return name
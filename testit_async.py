@@ -0,0 +1,537 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import asyncio
+import gzip
+import os
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+
+from testit_api import BulkResult, RetryPolicy, TestITClient, TestITError, _endpoint_table, _split_chunks
+from testit_codec import get_codec
+from testit_lazy import import_module, is_installed
+from testit_transfer import DownloadTarget, MultipartStream
+
+if not is_installed('aiohttp'):
+    raise ImportError("aiohttp is required for AsyncTestITClient: pip install aiohttp")
+# aiohttp is imported by the first created client
+aiohttp = None
+
+
+def _import_aiohttp():
+    """
+    Import aiohttp (once, under a lock) when the first client is created
+    """
+    global aiohttp
+    if aiohttp is None:
+        aiohttp = import_module('aiohttp')
+
+
+class AsyncTestITClient(TestITClient):
+    """
+    Realize TestIT API as python class with non-blocking methods
+
+    Every method of TestITClient is available with the same name and arguments and returns an awaitable:
+    result = await client.GetAllAutoTests(projectId=project_id)
+    """
+    def __init__(self, testit_url, secretkey, pool_limit=100, pool_limit_per_host=0, keep_alive=True,
+                 keepalive_timeout=15, verify=True, max_concurrency=100, retry=RetryPolicy(), timeout=(10, 300),
+                 raise_errors=False, rate_limiter=None, codec=None, compress_threshold=None, compress_level=6,
+                 attachment_cache=None, cache=None, validators=None, coalesce=False, validate=False,
+                 metrics=None):
+        """
+        :param testit_url: Specify url your TestIT system in format: "https://example.com"
+        :param secretkey: Use your "API secret key" from TestIT
+        :param pool_limit: Maximum number of simultaneously open connections (0 - unlimited)
+        :param pool_limit_per_host: Maximum number of simultaneously open connections to one host (0 - unlimited)
+        :param keep_alive: Keep connections (and their TLS sessions) open between requests
+        :param keepalive_timeout: Seconds an idle connection is kept in the pool
+        :param verify: Verify the TLS certificate of TestIT
+        :param max_concurrency: Maximum number of requests in flight at the same time
+        :param retry: RetryPolicy for failed requests (None - no retries)
+        :param timeout: Timeout (in seconds) for request, or tuple (connect timeout, read timeout)
+        :param raise_errors: Raise TestITError if TestIT returned error status instead of returning response content
+        :param rate_limiter: RateLimiter from testit_throttle, may be shared by several clients
+        :param codec: Json codec from testit_codec (or its name), by default the fastest installed one
+        :param compress_threshold: Compress request bodies larger than this number of bytes with gzip
+        (None - do not compress)
+        :param compress_level: Gzip compression level from 1 (fastest) to 9 (smallest)
+        :param attachment_cache: AttachmentCache from testit_attachments to upload files with the same content
+        by AddAttachment only once
+        :param cache: ResponseCache from testit_cache to keep get responses of slow-changing entities
+        :param validators: ValidatorCache from testit_cache to revalidate repeated get requests with ETag and
+        Last-Modified of previous responses instead of downloading unchanged bodies again
+        :param coalesce: Send identical get requests made at the same time only once,
+        all callers get the same response (or exception)
+        :param validate: Check request bodies against models of testit_models before sending them and raise
+        ValidationError from testit_validation instead of sending invalid body
+        :param metrics: MetricsRegistry from testit_metrics recording latency, sizes, retries and status codes
+        of requests by endpoint
+        """
+        _import_aiohttp()
+        if testit_url.endswith('/'):
+            testit_url = testit_url[:-1]
+        self.testit_url = testit_url
+        self.secretkey = secretkey
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
+        self.verify = verify
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.retry = retry
+        self.timeout = timeout
+        self.raise_errors = raise_errors
+        self.rate_limiter = rate_limiter
+        self.codec = codec if codec is not None and not isinstance(codec, str) else get_codec(codec)
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+        self.attachment_cache = attachment_cache
+        self.cache = cache
+        self.validators = validators
+        self.coalesce = coalesce
+        self.validate = validate
+        self.metrics = metrics
+        # callables (method, path, decoded response) called after every successful request, see AutoTestIndex
+        self.response_hooks = []
+        # key of get request -> task sending it
+        self._in_flight = {}
+        # aiohttp session must be created inside running event loop, so it is created on first request
+        self.session = None
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' for AsyncTestITClient")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Close all pooled connections of the client
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _get_session(self):
+        """
+        Return aiohttp session of the client, create it on first use
+        """
+        if self.session is None:
+            if self.keep_alive:
+                connector = aiohttp.TCPConnector(limit=self.pool_limit, limit_per_host=self.pool_limit_per_host,
+                                                 keepalive_timeout=self.keepalive_timeout, ssl=self.verify)
+            else:
+                connector = aiohttp.TCPConnector(limit=self.pool_limit, limit_per_host=self.pool_limit_per_host,
+                                                 force_close=True, ssl=self.verify)
+            if isinstance(self.timeout, tuple):
+                timeout = aiohttp.ClientTimeout(sock_connect=self.timeout[0], sock_read=self.timeout[1])
+            else:
+                timeout = aiohttp.ClientTimeout(sock_connect=self.timeout, sock_read=self.timeout)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                                 headers={'Authorization': 'PrivateToken ' + self.secretkey,
+                                                          'Accept': 'application/json'})
+        return self.session
+
+    async def _paginate(self, list_method, *args, page_size=100, prefetch=0, **parameters):
+        """
+        Call list_method page by page (using Skip and Take parameters) and yield found items one by one
+        If prefetch is set, next pages (no more than prefetch) are requested while current page is processed
+        Iter* methods of the client return async generators: async for item in client.IterAllAutoTests()
+        """
+        if page_size <= 0:
+            raise AssertionError("page_size should be positive")
+        skip = parameters.pop("Skip", 0)
+        parameters.pop("Take", None)
+        pending = deque()
+        try:
+            for _ in range(max(prefetch, 1)):
+                pending.append(asyncio.ensure_future(list_method(*args, Skip=skip, Take=page_size, **parameters)))
+                skip += page_size
+            while True:
+                page = await pending.popleft()
+                if not isinstance(page, list):
+                    raise TestITError(page)
+                # short page is the last one
+                if len(page) < page_size:
+                    for item in page:
+                        yield item
+                    return
+                pending.append(asyncio.ensure_future(list_method(*args, Skip=skip, Take=page_size, **parameters)))
+                skip += page_size
+                for item in page:
+                    yield item
+        finally:
+            # pages requested beyond the end (or after consumer has stopped) are dropped
+            for task in pending:
+                task.cancel()
+
+    async def SendCommand(self, method, path, data=None, request_file=None, retry=None, compress=None, progress=None):
+        """
+        Send request to TestIT and return response
+        :param request_file: Path to file or file object opened in binary mode, sent as multipart/form-data
+        :param retry: Retry this request according to RetryPolicy of the client even if method is not listed in
+        retry_methods of the policy (True) or do not retry it at all (False)
+        :param compress: Compress request body with gzip (True) or send it as is (False) regardless of
+        compress_threshold of the client
+        :param progress: Callable (bytes_sent, total_bytes) reporting upload of request_file
+        """
+        cacheable = self.cache is not None and method == 'get' and request_file is None
+        content = self.cache.get(method, path) if cacheable else None
+        if content is not None:
+            return self.codec.decode(content)
+        revalidate = self.validators is not None and method == 'get' and request_file is None
+        conditional_headers = self.validators.request_headers(path) if revalidate else None
+        if self.coalesce and method == 'get' and request_file is None:
+            status, headers, content = await self._coalesced_request(path, retry, conditional_headers)
+        else:
+            status, headers, content = await self._request(method, path, data, request_file, retry, compress,
+                                                           progress, conditional_headers)
+        if status == 304 and conditional_headers:
+            cached_content = self.validators.get(path)
+            if cached_content is not None:
+                return self.codec.decode(cached_content)
+            # response was forgotten while the request was sent, so it is requested again without validators
+            status, headers, content = await self._request(method, path, data, request_file, retry, compress,
+                                                           progress)
+        if self.cache is not None and method != 'get':
+            self.cache.invalidate(path)
+        elif cacheable and status < 400:
+            self.cache.put(method, path, content)
+        if revalidate and status < 400:
+            self.validators.put(path, headers, content)
+        if self.raise_errors and status >= 400:
+            raise TestITError(content, status_code=status, retry_after=headers.get('Retry-After'))
+        # return response
+        try:
+            result = self.codec.decode(content)
+        except ValueError:
+            return content
+        if self.response_hooks and status < 400:
+            self._run_hooks(method, path, result)
+        return result
+
+    def _coalesced_request(self, path, retry=None, headers=None):
+        """
+        Send get request or join the same request already in flight, return shared response status, headers and body
+        """
+        key = (path, tuple(sorted(headers.items())) if headers else ())
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request('get', path, retry=retry, headers=headers))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # cancellation of one caller does not cancel the request shared with others
+        return asyncio.shield(task)
+
+    async def _request(self, method, path, data=None, request_file=None, retry=None, compress=None, progress=None,
+                       headers=None):
+        """
+        Send request to TestIT through the pooled session, retrying it according to RetryPolicy,
+        and return response status, headers and body
+        :param headers: Additional headers of the request
+        """
+        # prepare target url
+        target_url = self.testit_url + path
+        headers = dict(headers or {})
+        # prepare payload to send, encoded straight to bytes (requests without data have no body)
+        if request_file is not None:
+            # file is streamed from disk chunk by chunk and closed right after the request
+            with MultipartStream(request_file, progress=progress) as stream:
+                headers.update({'Content-Type': stream.content_type, 'Content-Length': str(len(stream))})
+                return await self._send_measured(method, path, target_url, headers, stream, retry, len(stream))
+        if data is None or method == 'get':
+            return await self._send_measured(method, path, target_url, headers or None, None, retry, 0)
+        headers['Content-Type'] = 'application/json'
+        payload = self.codec.encode(data)
+        if self._should_compress(len(payload), compress):
+            headers['Content-Encoding'] = 'gzip'
+            payload = gzip.compress(payload, compresslevel=self.compress_level, mtime=0)
+        return await self._send_measured(method, path, target_url, headers, payload, retry, len(payload))
+
+    async def _send_measured(self, method, path, target_url, headers, payload, retry, request_bytes):
+        """
+        Send request with retries and record it in metrics registry of the client
+        """
+        if self.metrics is None:
+            return await self._send_with_retry(method, target_url, headers, payload, retry)
+        started = time.monotonic()
+        try:
+            result = await self._send_with_retry(method, target_url, headers, payload, retry)
+        except Exception:
+            self.metrics.observe(method, path, None, time.monotonic() - started, request_bytes)
+            raise
+        self.metrics.observe(method, path, result[0], time.monotonic() - started, request_bytes, len(result[2]))
+        return result
+
+    async def _send_with_retry(self, method, target_url, headers, payload, retry=None):
+        """
+        Send request, repeating it according to RetryPolicy of the client, and return response status,
+        headers and body
+        """
+        session = self._get_session()
+        policy = self.retry
+        if retry is None:
+            retry = policy is not None and method in policy.retry_methods
+        max_attempts = policy.max_attempts if retry and policy is not None else 1
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve())
+            if isinstance(payload, MultipartStream):
+                # streamed body is sent from the beginning on every attempt
+                payload.seek(0)
+                body = self._read_stream(payload)
+            else:
+                body = payload
+            try:
+                # send request, keeping no more than max_concurrency requests in flight
+                async with self.semaphore:
+                    async with session.request(method.upper(), target_url, headers=headers,
+                                               data=body) as response:
+                        result = response.status, response.headers, await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= max_attempts:
+                    raise
+                delay = policy.get_delay(attempt)
+            else:
+                if attempt >= max_attempts or result[0] not in policy.retry_statuses:
+                    return result
+                delay = policy.get_delay(attempt, result[1].get('Retry-After'))
+            if self.metrics is not None:
+                self.metrics.retry(method, target_url[len(self.testit_url):])
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _download(self, method, path, destination, data=None, chunk_size=1024 * 1024, resume_attempts=3,
+                        atomic=True, progress=None):
+        """
+        Stream response body to destination chunk by chunk and return number of received bytes
+        Download by get request is resumed with HTTP Range from the last received byte if connection is dropped
+        """
+        session = self._get_session()
+        loop = asyncio.get_running_loop()
+        target_url = self.testit_url + path
+        resumable = method == 'get'
+        target = await loop.run_in_executor(None, DownloadTarget, destination, atomic)
+        try:
+            attempt = 0
+            while True:
+                headers = {}
+                payload = None
+                if resumable:
+                    # ranges and length refer to not encoded body
+                    headers['Accept-Encoding'] = 'identity'
+                    if target.written:
+                        headers['Range'] = f'bytes={target.written}-'
+                if data is not None:
+                    headers['Content-Type'] = 'application/json'
+                    payload = self.codec.encode(data)
+                if self.rate_limiter is not None:
+                    await asyncio.sleep(self.rate_limiter.reserve())
+                started = time.monotonic()
+                status_code = None
+                received_from = target.written
+                try:
+                    async with self.semaphore:
+                        async with session.request(method.upper(), target_url, headers=headers,
+                                                   data=payload) as response:
+                            status_code = response.status
+                            total = await self._check_download_response(response, target)
+                            received_from = target.written
+                            try:
+                                async for chunk in response.content.iter_chunked(chunk_size):
+                                    await loop.run_in_executor(None, target.write, chunk)
+                                    if progress is not None:
+                                        progress(target.written, total)
+                            except (aiohttp.ClientPayloadError, aiohttp.ClientConnectionError):
+                                if not resumable or attempt >= resume_attempts:
+                                    raise
+                                attempt += 1
+                                continue
+                finally:
+                    self._observe_download(method, path, status_code, started, len(payload or b''),
+                                           target.written - received_from)
+                if total is not None and target.written != total:
+                    raise TestITError(f"Received {target.written} bytes of {total}")
+                break
+        except BaseException:
+            target.abort()
+            raise
+        await loop.run_in_executor(None, target.commit)
+        return target.written
+
+    @staticmethod
+    async def _check_download_response(response, target):
+        """
+        Check response of download request and return total length of the body (None if it is unknown)
+        """
+        if response.status == 206 and target.written:
+            # Content-Range: bytes start-end/total
+            content_range = response.headers.get('Content-Range', '')
+            try:
+                range_start = int(content_range.split(' ')[1].split('-')[0])
+                range_total = content_range.split('/')[1]
+            except (IndexError, ValueError):
+                raise TestITError(f"Unexpected Content-Range: {content_range}", status_code=206)
+            if range_start != target.written:
+                raise TestITError(f"Unexpected Content-Range: {content_range}", status_code=206)
+            return int(range_total) if range_total != '*' else None
+        if response.status >= 400:
+            raise TestITError(await response.read(), status_code=response.status)
+        # whole body is sent again
+        target.restart()
+        if response.headers.get('Content-Encoding') or response.headers.get('Content-Length') is None:
+            return None
+        return int(response.headers['Content-Length'])
+
+    @staticmethod
+    async def _read_stream(stream):
+        """
+        Yield chunks of MultipartStream, reading file in the default executor so the event loop is not blocked
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, stream.read, stream.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    async def CreateAttachments(self, files, max_workers=8, retries=2):
+        """
+        Upload and link attachments to TestResults, no more than max_workers at the same time
+
+        :param files: List of pairs (testResultId, path to file or file object)
+        :param max_workers: Number of files uploaded at the same time
+        :param retries: Number of times upload of one file failed with network error or temporary TestIT error
+        (429, 5xx) is repeated
+        Return BulkResult: results - attachment identifiers in order of files, errors - index of pair -> exception
+        """
+        endpoint = _endpoint_table()["CreateAttachment"]
+        # (path, file) of every upload, files are checked before the first one is sent
+        uploads = [endpoint.build("CreateAttachments", (file, testResultId), {}) for testResultId, file in files]
+        result = BulkResult(len(uploads))
+        workers = asyncio.Semaphore(max_workers)
+
+        async def upload(index, path, file):
+            async with workers:
+                await self._create_attachment_with_retry(index, endpoint.method, path, file, retries, result)
+
+        await asyncio.gather(*[upload(index, path, file) for index, (path, file) in enumerate(uploads)])
+        return result
+
+    async def _create_attachment_with_retry(self, index, method, path, file, retries, result):
+        """
+        Upload one attachment for CreateAttachments, repeating it on failure
+        """
+        # file object is sent from the same position on every attempt
+        file_position = None if isinstance(file, (str, os.PathLike)) else file.tell()
+        for attempt in range(1, retries + 2):
+            if file_position is not None:
+                file.seek(file_position)
+            try:
+                response = await self._send_checked(method, path, request_file=file)
+            except (TestITError, aiohttp.ClientError, asyncio.TimeoutError, OSError) as error:
+                # file rejected by TestIT (4xx) is rejected again
+                if attempt > retries or not self._is_transient(error):
+                    result.errors[index] = error
+                    return
+                if self.retry is not None:
+                    await asyncio.sleep(self._retry_delay(attempt, error))
+                continue
+            result.results[index] = response.get('id') if isinstance(response, Mapping) else response
+            return
+
+    async def _add_cached_attachment(self, method, path, file, progress=None):
+        """
+        Upload file only if attachment with the same content is not remembered in attachment cache
+        """
+        loop = asyncio.get_running_loop()
+        digest = await loop.run_in_executor(None, self.attachment_cache.digest, file)
+        if digest is not None:
+            attachment = self.attachment_cache.get(digest)
+            if attachment is not None:
+                return attachment
+        attachment = await self.SendCommand(method, path, request_file=file, progress=progress)
+        if digest is not None and isinstance(attachment, Mapping) and attachment.get('id'):
+            self.attachment_cache.put(digest, attachment)
+        return attachment
+
+    async def _send_checked(self, method, path, data=None, request_file=None):
+        """
+        Send request to TestIT and return response, raise TestITError if TestIT returned error status
+        """
+        status, headers, content = await self._request(method, path, data, request_file)
+        if status >= 400:
+            raise TestITError(content, status_code=status, retry_after=headers.get('Retry-After'))
+        if not content:
+            return None
+        result = self.codec.decode(content)
+        if self.response_hooks:
+            self._run_hooks(method, path, result)
+        return result
+
+    async def _send_chunk(self, method, path, start, chunk, retries, result):
+        """
+        Send one chunk of bulk request, retry it on network errors and temporary TestIT errors
+        and split it in halves to isolate bad items if TestIT rejects it
+        """
+        for attempt in range(1, retries + 2):
+            try:
+                response = await self._send_checked(method, path, chunk)
+            except (TestITError, aiohttp.ClientError) as error:
+                if self._is_transient(error):
+                    if attempt > retries:
+                        # halves of the chunk would fail the same way, so they are not sent
+                        result.errors.update(dict.fromkeys(range(start, start + len(chunk)), error))
+                        return
+                    if self.metrics is not None:
+                        self.metrics.retry(method, path)
+                    await asyncio.sleep(self._retry_delay(attempt, error))
+                    continue
+                # items rejected by TestIT (4xx) are rejected again, so the chunk is split right away
+                if len(chunk) == 1:
+                    result.errors[start] = error
+                    return
+                middle = len(chunk) // 2
+                await self._send_chunk(method, path, start, chunk[:middle], retries, result)
+                await self._send_chunk(method, path, start + middle, chunk[middle:], retries, result)
+                return
+            if isinstance(response, list) and len(response) == len(chunk):
+                result.results[start:start + len(chunk)] = response
+            return
+
+    async def _send_in_chunks(self, method, path, data, chunk_size, chunk_bytes, max_workers, retries):
+        """
+        Send bulk request in chunks, no more than max_workers chunks at the same time, and merge responses
+        into BulkResult
+        """
+        if isinstance(data, Mapping) or not isinstance(data, Sequence):
+            raise AssertionError("requestBody should be a list of dicts")
+        if chunk_size <= 0:
+            raise AssertionError("chunk_size should be positive")
+        result = BulkResult(len(data))
+        workers = asyncio.Semaphore(max_workers)
+
+        async def send(start, chunk):
+            async with workers:
+                await self._send_chunk(method, path, start, chunk, retries, result)
+
+        chunks = _split_chunks(data, chunk_size, chunk_bytes, self.codec.encode)
+        await asyncio.gather(*[send(start, chunk) for start, chunk in chunks])
+        return result
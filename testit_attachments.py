@@ -0,0 +1,160 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class AttachmentCache:
+    """
+    Remember attachments uploaded to TestIT by sha256 of their file name and content, so identical files
+    are uploaded once. TestIT keeps the name of uploaded file, so files with the same content and different names
+    are different attachments
+
+    Entries are kept in memory (least recently used are evicted) and, if path is set,
+    appended to a json lines file which is read on start
+    """
+    def __init__(self, max_entries=10000, path=None, ttl=None, max_file_size=None, chunk_size=1024 * 1024):
+        """
+        :param max_entries: Maximum number of remembered attachments
+        :param path: Path to file to keep remembered attachments between runs
+        :param ttl: Time (in seconds) attachment is remembered (None - forever)
+        :param max_file_size: Files larger than this number of bytes are always uploaded (None - no limit)
+        :param chunk_size: Size of chunks the file is hashed by
+        """
+        if max_entries <= 0:
+            raise AssertionError("max_entries should be positive")
+        self.max_entries = max_entries
+        self.path = path
+        self.ttl = ttl
+        self.max_file_size = max_file_size
+        self.chunk_size = chunk_size
+        # digest -> (time of upload, attachment model)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._log_lines = 0
+        if path is not None and os.path.isfile(path):
+            self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def digest(self, file):
+        """
+        Return sha256 of name the file is uploaded with and of content of file
+        (path or file object, read from its current position)
+        Return None if file is larger than max_file_size
+        """
+        if isinstance(file, (str, os.PathLike)):
+            if self.max_file_size is not None and os.path.getsize(file) > self.max_file_size:
+                return None
+            with open(file, mode='rb') as opened_file:
+                return self._hash(opened_file)
+        start = file.tell()
+        size = file.seek(0, os.SEEK_END) - start
+        file.seek(start)
+        if self.max_file_size is not None and size > self.max_file_size:
+            return None
+        try:
+            return self._hash(file)
+        finally:
+            file.seek(start)
+
+    def _hash(self, file):
+        sha256 = hashlib.sha256()
+        # the same name MultipartStream sends
+        name = getattr(file, 'name', None)
+        filename = os.path.basename(name) if isinstance(name, str) and name else 'file'
+        sha256.update(filename.encode('utf-8') + b'\0')
+        for chunk in iter(lambda: file.read(self.chunk_size), b''):
+            sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def get(self, digest):
+        """
+        Return remembered attachment model by digest of content or None
+        """
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.time() - entry[0] > self.ttl:
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return entry[1]
+
+    def put(self, digest, attachment):
+        """
+        Remember attachment model returned by TestIT for content with digest
+        """
+        with self._lock:
+            entry = (time.time(), attachment)
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self.path is not None:
+                self._append(digest, entry)
+
+    def clear(self):
+        """
+        Forget all attachments
+        """
+        with self._lock:
+            self._entries.clear()
+            if self.path is not None:
+                self._rewrite()
+
+    def _load(self):
+        """
+        Read remembered attachments from file, later lines override earlier ones
+        """
+        with open(self.path, encoding='utf-8') as log:
+            for line in log:
+                try:
+                    digest, uploaded, attachment = json.loads(line)
+                except ValueError:
+                    # line could be cut if process was killed while writing it
+                    continue
+                self._log_lines += 1
+                if self.ttl is not None and time.time() - uploaded > self.ttl:
+                    continue
+                self._entries[digest] = (uploaded, attachment)
+                self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _append(self, digest, entry):
+        """
+        Append entry to file, rewrite the file when it has much more lines than remembered attachments
+        """
+        if self._log_lines >= 2 * self.max_entries:
+            self._rewrite()
+            return
+        with open(self.path, mode='a', encoding='utf-8') as log:
+            log.write(json.dumps([digest, entry[0], entry[1]]) + '\n')
+        self._log_lines += 1
+
+    def _rewrite(self):
+        """
+        Write remembered attachments to file from scratch
+        """
+        temp_path = self.path + '.tmp'
+        with open(temp_path, mode='w', encoding='utf-8') as log:
+            for digest, (uploaded, attachment) in self._entries.items():
+                log.write(json.dumps([digest, uploaded, attachment]) + '\n')
+        os.replace(temp_path, self.path)
+        self._log_lines = len(self._entries)
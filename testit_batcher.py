@@ -0,0 +1,163 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import queue
+import threading
+import time
+from collections.abc import Mapping
+
+from testit_api import TestITError
+
+
+class ResultBatcher:
+    """
+    Collect autotest results from any thread and send them to TestIT test run in batches from background thread
+
+    Batch is sent by SetAutoTestResultsForTestRun when batch_size results are buffered
+    or when the oldest buffered result waits longer than flush_interval seconds
+    """
+    def __init__(self, client, testRunId, batch_size=100, flush_interval=1.0, max_buffer=10000,
+                 on_flush=None, on_error=None):
+        """
+        :param client: TestITClient object
+        :param testRunId: Test run to send results to
+        :param batch_size: Maximum number of results in one request
+        :param flush_interval: Maximum time (in seconds) result waits in buffer
+        :param max_buffer: Maximum number of buffered results, add() blocks when buffer is full
+        :param on_flush: Callable (batch, response) called after every successfully sent batch
+        :param on_error: Callable (batch, exception) called when batch is not sent, by default errors are collected
+        in errors attribute. Exceptions raised by on_flush and on_error are collected in errors too
+        """
+        if batch_size <= 0 or max_buffer < batch_size:
+            raise AssertionError("batch_size should be positive and not greater than max_buffer")
+        self.client = client
+        self.testRunId = testRunId
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.on_flush = on_flush
+        self.on_error = on_error
+        self.errors = list()
+        self._buffer = list()
+        # time when every buffered result was added
+        self._added = list()
+        # number of results which are buffered or being sent right now
+        self._pending = 0
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="testit-result-batcher", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, result, timeout=None):
+        """
+        Add result (like a AutoTestResultsForTestRunModel) to buffer
+        If buffer is full, wait until it has free space (no more than timeout seconds, then raise queue.Full)
+        """
+        if not isinstance(result, Mapping):
+            raise AssertionError("result should be a dict")
+        with self._condition:
+            if self._closed:
+                raise AssertionError("ResultBatcher is closed")
+            # back-pressure: producers wait while sender catches up
+            if not self._condition.wait_for(lambda: len(self._buffer) < self.max_buffer or self._closed, timeout):
+                raise queue.Full
+            if self._closed:
+                raise AssertionError("ResultBatcher is closed")
+            self._buffer.append(result)
+            self._added.append(time.monotonic())
+            self._pending += 1
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Send all buffered results now and wait until they are sent
+        Return False if timeout is expired before that
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout=None):
+        """
+        Send all buffered results and stop background thread
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _next_batch(self):
+        """
+        Wait until batch is ready to be sent and take it from buffer
+        Return None when batcher is closed and buffer is empty
+        """
+        with self._condition:
+            while True:
+                if self._buffer:
+                    # results left after partial batch keep their age
+                    age = time.monotonic() - self._added[0]
+                    if (len(self._buffer) >= self.batch_size or age >= self.flush_interval
+                            or self._flush_requested or self._closed):
+                        batch = self._buffer[:self.batch_size]
+                        del self._buffer[:self.batch_size]
+                        del self._added[:self.batch_size]
+                        # wake up producers waiting for free space
+                        self._condition.notify_all()
+                        return batch
+                    self._condition.wait(self.flush_interval - age)
+                elif self._closed:
+                    return None
+                else:
+                    self._flush_requested = False
+                    self._condition.wait()
+
+    def _run(self):
+        """
+        Send batches to TestIT until batcher is closed
+        """
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                response = self.client.SetAutoTestResultsForTestRun(batch, self.testRunId)
+                if not isinstance(response, list):
+                    raise TestITError(response)
+            except Exception as error:
+                if self.on_error is not None:
+                    self._call(self.on_error, batch, error)
+                else:
+                    self.errors.append((batch, error))
+            else:
+                if self.on_flush is not None:
+                    self._call(self.on_flush, batch, response)
+            finally:
+                with self._condition:
+                    self._pending -= len(batch)
+                    self._condition.notify_all()
+
+    def _call(self, callback, batch, value):
+        """
+        Call on_flush or on_error, its exception is collected in errors so that background thread keeps sending
+        """
+        try:
+            callback(batch, value)
+        except Exception as error:
+            self.errors.append((batch, error))
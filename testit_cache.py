@@ -0,0 +1,198 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# endpoints of slow-changing entities cached by default: path template -> time to live (in seconds)
+DEFAULT_TTLS = {
+    # GetProjectById
+    "/api/v2/projects/{projectId}": 300,
+    # GetConfigurationsByProjectId
+    "/api/v2/projects/{projectId}/configurations": 300,
+    # GetConfigurationById
+    "/api/v2/configurations/{configurationId}": 300,
+    # GetAttributesByProjectId
+    "/api/v2/projects/{projectId}/attributes": 300,
+    # GetSectionsByProjectId
+    "/api/v2/projects/{projectId}/sections": 60,
+}
+
+_ID_PATTERN = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$|^\d+$")
+
+
+def _compile_template(template):
+    """
+    Compile path template like "/api/v2/projects/{projectId}" to regular expression matching path with query
+    """
+    parts = re.split(r"\{[^}]+\}", template)
+    return re.compile("^" + "[^/?]+".join(re.escape(part) for part in parts) + r"(\?.*)?$")
+
+
+def _resources(path):
+    """
+    Return names of resources in path: "/api/v2/projects/<id>/sections?Skip=1" -> ["projects", "sections"]
+    """
+    return [segment for segment in path.split("?", 1)[0].split("/")[3:]
+            if segment and not _ID_PATTERN.match(segment)]
+
+
+class ResponseCache:
+    """
+    Cache of get responses of slow-changing entities with per-endpoint time to live and LRU eviction
+
+    Response is cached only if its path matches one of ttls templates.
+    Any other request (post, put, delete) sent through the same client drops cached responses of resources it changes
+    """
+    def __init__(self, ttls=None, max_entries=1024):
+        """
+        :param ttls: Dict path template -> time to live (in seconds), default DEFAULT_TTLS
+        :param max_entries: Maximum number of cached responses
+        """
+        if max_entries <= 0:
+            raise AssertionError("max_entries should be positive")
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self._templates = [(_compile_template(template), ttl) for template, ttl in self.ttls.items()]
+        # (method, path with query) -> (expiration time, response body)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, path):
+        """
+        Return time to live for response of path, None if it is not cached
+        """
+        for pattern, ttl in self._templates:
+            if pattern.match(path):
+                return ttl
+        return None
+
+    def get(self, method, path):
+        """
+        Return cached response body or None
+        """
+        key = (method, path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, method, path, content):
+        """
+        Cache response body if path matches one of templates
+        """
+        ttl = self.ttl_for(path)
+        if ttl is None:
+            return
+        key = (method, path)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):
+        """
+        Drop cached responses of resources changed by request to path:
+        response is dropped if its last resource is one of resources of path
+        ("/api/v2/projects/<id>/sections" is dropped by CreateSection, UpdateSection, DeleteSection, etc.)
+        """
+        changed = set(_resources(path))
+        with self._lock:
+            for key in list(self._entries):
+                resources = _resources(key[1])
+                if not resources or resources[-1] in changed:
+                    del self._entries[key]
+
+    def clear(self):
+        """
+        Drop all cached responses
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class ValidatorCache:
+    """
+    Validators (ETag, Last-Modified) and bodies of get responses, used to revalidate responses with
+    If-None-Match and If-Modified-Since: when TestIT answers 304 Not Modified, the remembered body is returned
+    """
+    def __init__(self, max_entries=1024):
+        """
+        :param max_entries: Maximum number of remembered responses
+        """
+        if max_entries <= 0:
+            raise AssertionError("max_entries should be positive")
+        self.max_entries = max_entries
+        # path with query -> (etag, last modified, response body)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def request_headers(self, path):
+        """
+        Return conditional headers for request to path, empty dict if there is no remembered response
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry[0] is not None:
+            headers['If-None-Match'] = entry[0]
+        if entry[1] is not None:
+            headers['If-Modified-Since'] = entry[1]
+        return headers
+
+    def get(self, path):
+        """
+        Return remembered response body for path or None
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            self._entries.move_to_end(path)
+            return entry[2]
+
+    def put(self, path, headers, content):
+        """
+        Remember response body if response has validators, otherwise forget previous response for path
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        with self._lock:
+            if etag is None and last_modified is None:
+                self._entries.pop(path, None)
+                return
+            self._entries[path] = (etag, last_modified, content)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Forget all responses
+        """
+        with self._lock:
+            self._entries.clear()
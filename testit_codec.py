@@ -0,0 +1,117 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import json
+from collections.abc import Mapping
+
+from testit_lazy import import_module, is_installed
+
+# optional libraries are imported by the first created codec using them
+orjson = None
+ujson = None
+
+
+def _default(value):
+    """
+    Convert objects unknown to json libraries: testit_objects models and other mappings
+    """
+    if hasattr(value, 'json_dict'):
+        return value.json_dict()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonCodec:
+    """
+    Encode request bodies to json bytes and decode json responses with standard json module
+    """
+    name = 'json'
+
+    @staticmethod
+    def encode(data):
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+    @staticmethod
+    def decode(content):
+        return json.loads(content)
+
+
+class OrjsonCodec:
+    """
+    Encode request bodies to json bytes and decode json responses with orjson
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        global orjson
+        orjson = import_module('orjson')
+
+    @staticmethod
+    def encode(data):
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def decode(content):
+        return orjson.loads(content)
+
+
+class UjsonCodec:
+    """
+    Encode request bodies to json bytes and decode json responses with ujson
+    """
+    name = 'ujson'
+
+    def __init__(self):
+        global ujson
+        ujson = import_module('ujson')
+
+    @staticmethod
+    def encode(data):
+        return ujson.dumps(data, ensure_ascii=False, default=_default).encode('utf-8')
+
+    @staticmethod
+    def decode(content):
+        return ujson.loads(content)
+
+
+CODECS = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': JsonCodec,
+}
+
+# name (None - the fastest installed codec) -> shared codec object
+_codecs = dict()
+
+
+def get_codec(name=None):
+    """
+    Return codec by name ('orjson', 'ujson' or 'json')
+    If name is not set, return the fastest installed one
+    Codecs have no state, so one object of every codec is created and shared
+    """
+    codec = _codecs.get(name)
+    if codec is not None:
+        return codec
+    available = {'orjson': is_installed('orjson'), 'ujson': is_installed('ujson'), 'json': True}
+    codec_name = name
+    if codec_name is None:
+        codec_name = next(codec_name for codec_name in CODECS if available[codec_name])
+    if codec_name not in CODECS:
+        raise AssertionError(f"Unsupported codec: {codec_name}")
+    if not available[codec_name]:
+        raise AssertionError(f"Codec {codec_name} is not installed")
+    codec = _codecs.get(codec_name)
+    if codec is None:
+        codec = _codecs[codec_name] = CODECS[codec_name]()
+    _codecs[name] = codec
+    return codec
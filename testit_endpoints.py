@@ -0,0 +1,1562 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import os
+import re
+from collections.abc import Mapping, Sequence
+from urllib.parse import quote, urlencode
+
+_PATH_ARGUMENT = re.compile(r"\{(\w+)\}")
+_INTEGER = re.compile(r"^-?\d+$")
+
+
+def _encoder(name, kind):
+    """
+    Return function converting value of query parameter of type kind to list of strings
+    """
+    if kind.startswith("choose one from:"):
+        allowed = [value.strip() for value in kind.split(":", 1)[1].split("|")]
+
+        def encode(value):
+            if value not in allowed:
+                raise AssertionError(f"Unsupported value of {name}: {value}")
+            return [value]
+    elif kind.startswith("boolean"):
+        def encode(value):
+            if isinstance(value, bool):
+                return ["true" if value else "false"]
+            if isinstance(value, str) and value.lower() in ("true", "false"):
+                return [value.lower()]
+            raise AssertionError(f"{name} should be boolean")
+    elif kind.startswith("integer"):
+        def encode(value):
+            if isinstance(value, int) and not isinstance(value, bool):
+                return [str(value)]
+            if isinstance(value, str) and _INTEGER.match(value):
+                return [value]
+            raise AssertionError(f"{name} should be integer")
+    elif kind.startswith("array"):
+        def encode(value):
+            # array is sent as repeated parameter: labels=a&labels=b
+            if isinstance(value, (list, tuple, set, frozenset)):
+                return [_string(item) for item in value]
+            return [_string(value)]
+    else:
+        def encode(value):
+            return [_string(value)]
+    return encode
+
+
+def _string(value):
+    # dates are sent in ISO 8601 format
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+class Endpoint:
+    """
+    Description of TestIT API method: http method, path template, arguments, query parameters and request body
+    Endpoint builds path with query and checks body of request from arguments of client method
+    """
+    def __init__(self, method, path, args=None, body=None, query=None, doc=None):
+        """
+        :param method: Http method: "get", "post", "put" or "delete"
+        :param path: Path template with arguments in braces: "/api/v2/projects/{projectId}"
+        :param args: Names of positional arguments of client method (default - "data" or "file" if request has body,
+        then arguments of path template in order of the path)
+        :param body: Request body: name of model from testit_models, "list of <model>", "list of uuid string"
+        or "file" (path to file or file object sent as multipart/form-data)
+        :param query: Dict name of query parameter -> (type, description), type like in swagger description:
+        "string", "boolean", "integer (int32)", "array", "choose one from: A | B"
+        :param doc: Docstring of client method
+        """
+        self.method = method
+        self.path = path
+        if args is None:
+            args = ([] if body is None else ["file" if body == "file" else "data"]) + _PATH_ARGUMENT.findall(path)
+        self.args = tuple(args)
+        self.body = body
+        self.query = query or {}
+        self.doc = doc
+        # literal parts of path and names of arguments between them
+        parts = _PATH_ARGUMENT.split(path)
+        self._path_parts = parts[::2]
+        self._path_args = parts[1::2]
+        for arg in self._path_args:
+            if arg not in self.args:
+                raise AssertionError(f"Argument {arg} of path {path} is not listed in args")
+        self._encoders = {name: _encoder(name, kind) for name, (kind, _) in self.query.items()}
+
+    def build(self, name, args, parameters):
+        """
+        Bind positional arguments and keyword parameters of client method name
+        Return path with url-encoded query and request body (None if request has no body)
+        """
+        if len(args) > len(self.args):
+            raise TypeError(f"{name}() takes {len(self.args)} positional arguments but {len(args)} were given")
+        values = dict(zip(self.args, args))
+        for arg in self.args[len(args):]:
+            if arg not in parameters:
+                raise TypeError(f"{name}() missing required argument: '{arg}'")
+            values[arg] = parameters[arg]
+        path = self._path_parts[0]
+        for arg, part in zip(self._path_args, self._path_parts[1:]):
+            path += quote(_string(values[arg]), safe="") + part
+        query = list()
+        for param, value in parameters.items():
+            encode = self._encoders.get(param)
+            if encode is None:
+                if param in self.args[len(args):]:
+                    continue
+                if param in self.args:
+                    raise TypeError(f"{name}() got multiple values for argument '{param}'")
+                raise AssertionError(f"Unsupported parameter of {name}: {param}")
+            if value is not None:
+                query.extend((param, item) for item in encode(value))
+        if query:
+            path += "?" + urlencode(query, quote_via=quote)
+        return path, self._check_body(values)
+
+    def _check_body(self, values):
+        if self.body is None:
+            return None
+        if self.body == "file":
+            file = values["file"]
+            if isinstance(file, str) and not os.path.isfile(file):
+                raise AssertionError("File object or path to file expected")
+            return file
+        data = values["data"]
+        if self.body.startswith("list of "):
+            if isinstance(data, Mapping) and not isinstance(data, Sequence):
+                if self.body.endswith("Model"):
+                    raise AssertionError("requestBody should be a list of dicts")
+                raise AssertionError("requestBody should be a list of items")
+        elif not isinstance(data, Mapping) and isinstance(data, Sequence):
+            raise AssertionError("requestBody should be a dict")
+        return data
+
+
+# query parameters of paginated listings
+PAGING = {
+    "Skip": ("integer", "Amount of items to be skipped (offset)"),
+    "Take": ("integer", "Amount of items to be taken (limit)"),
+    "OrderBy": ("string", "SQL-like  ORDER BY statement (column1 ASC|DESC , column2 ASC|DESC)"),
+    "SearchField": ("string", "Property name for searching"),
+    "SearchValue": ("string", "Value for searching"),
+}
+
+# name of TestITClient method -> Endpoint
+ENDPOINTS = {
+    "AddAttachment": Endpoint(
+        "post", "/api/v2/attachments",
+        body="file",
+        query={
+            "apiVersion": ("string", ""),
+        },
+        doc="""
+        Create attachment
+
+        Use case
+        User send file
+        User runs method execution
+        System upload file
+        System create attachment
+        System return attachment model (listed in response parameters)
+        If attachment_cache is set for the client, file with already uploaded content is not uploaded again
+        and remembered attachment model is returned
+        """),
+    "GetAllAutoTests": Endpoint(
+        "get", "/api/v2/autoTests",
+        query={
+            "projectId": ("string (uuid)", "Project internal identifier"),
+            "externalId": ("string", "Autotest external identifier"),
+            "globalId": ("integer (int64)", "Autotest global identifier"),
+            "Namespace": ("string", "Name of abstract storage where autotest is located"),
+            "isNamespaceNull": ("boolean", "Boolean flag which defines if search must include autotests with null "
+                                           "value Namespace attribute"),
+            "classname": ("string", "Name of the class where autotest is located"),
+            "isClassnameNull": ("boolean", "Boolean flag which defines if search must include autotests with null "
+                                           "value Classname attribute"),
+            "isDeleted": ("boolean", "Boolean flag which defines if search must include deleted autotests"),
+            "labels": ("array", "List of autotests labels to filter by"),
+            "stabilityMinimal": ("integer (int32)", "Minimal stability value to filter by"),
+            "stabilityMaximal": ("integer (int32)", "Maximal stability value to filter by"),
+            "isFlaky": ("boolean", "[Optional] If flaky is set"),
+            "includeSteps": ("boolean", "Boolean flag which defines if setup, steps and teardown fields must be "
+                                        "included"),
+            "includeLabels": ("boolean", "Boolean flag which defines if labels field must be included"),
+            **PAGING,
+        },
+        doc="""
+        Get all AutoTests (if parameters are specified, then it's filtered by them.)
+
+        Use case
+        [Optional] User sets search parameters (listed in request parameters) and runs method execution
+        System returns all autotests, matching search criteria
+        """),
+    "CreateAutoTest": Endpoint(
+        "post", "/api/v2/autoTests",
+        body="AutoTestPostModel",
+        doc="""
+        Create AutoTest
+
+        Use case
+        User sets autotest parameters (listed in the example) and runs method execution
+        System creates autotest
+        [Optional] If steps enumeration is set, system creates step items and relates them to autotest
+        [Optional] If setup enumeration is set, system creates setup items and relates them to autotest
+        [Optional] If teardown enumeration is set, system creates teardown items and relates them to autotest
+        [Optional] If label enumeration is set, system creates labels and relates them to autotest
+        [Optional] If link enumeration is set, system creates links and relates them to autotest
+        System returns autotest model (example listed in response parameters)
+        """),
+    "UpdateAutoTest": Endpoint(
+        "put", "/api/v2/autoTests",
+        body="AutoTestPutModel",
+        doc="""
+        Update AutoTest
+
+        Use case
+        User sets autotest updated parameters values (listed in the example) and runs method execution
+        System finds the autotest by the identifier
+        System updates autotest parameters
+        [Optional] If steps enumeration is set, system creates step items, relates them to autotest
+        and deletes relations with current steps( if exist)
+        [Optional] If Setup enumeration is set, system creates setup items and relates them to autotest
+        and deletes relations with current Setup items (if exist)
+        [Optional] If teardown enumeration is set, system creates teardown items and relates them to autotest
+        and deletes relations with current teardown items (if exist)
+        [Optional] If label enumeration is set, system creates labels and relates them to autotest
+        and deletes relations with current Labels (if exist)
+        [Optional] If link enumeration is set, system creates links and relates them to autotest
+        and deletes relations with current Links (if exist)
+        System updates autotest and returns no content response
+        """),
+    "GetAutoTestById": Endpoint(
+        "get", "/api/v2/autoTests/{autoTestId}",
+        doc="""
+        Get AutoTest by Id or GlobalId
+
+        Use case
+        User sets autotest internal or global identifier and runs method execution
+        System returns autotest, which internal or global identifier equals the identifier value set in the previous
+        action
+        """),
+    "DeleteAutoTest": Endpoint(
+        "delete", "/api/v2/autoTests/{autoTestId}",
+        doc="""
+        Delete AutoTest by Id or GlobalId
+
+        Use case
+        User sets autotest internal (guid format) or global (integer format) identifier and runs method execution
+        System finds the autotest by the identifier
+        System deletes autotest and returns no content response
+        """),
+    "CreateMultiple": Endpoint(
+        "post", "/api/v2/autoTests/bulk",
+        body="list of AutoTestPostModel",
+        doc="""
+        Create AutoTests multiple
+
+        Use case
+        User sets autotest parameters (listed in the example) and runs method execution
+        System creates autotest
+        [Optional] If steps enumeration is set, system creates step items and relates them to autotest
+        [Optional] If setup enumeration is set, system creates setup items and relates them to autotest
+        [Optional] If teardown enumeration is set, system creates teardown items and relates them to autotest
+        [Optional] If label enumeration is set, system creates labels and relates them to autotest
+        [Optional] If link enumeration is set, system creates links and relates them to autotest
+        System returns autotest model (example listed in response parameters)
+        """),
+    "UpdateMultiple": Endpoint(
+        "put", "/api/v2/autoTests/bulk",
+        body="list of AutoTestPutModel",
+        doc="""
+        Update AutoTests multiple
+
+        Use case
+        User sets autotest updated parameters values (listed in the example) and runs method execution
+        System finds the autotest by the identifier
+        System updates autotest parameters
+        [Optional] If steps enumeration is set, system creates step items, relates them to autotest
+        and deletes relations with current steps( if exist)
+        [Optional] If Setup enumeration is set, system creates setup items and relates them to autotest
+        and deletes relations with current Setup items (if exist)
+        [Optional] If teardown enumeration is set, system creates teardown items and relates them to autotest
+        and deletes relations with current teardown items (if exist)
+        [Optional] If label enumeration is set, system creates labels and relates them to autotest
+        and deletes relations with current Labels (if exist)
+        [Optional] If link enumeration is set, system creates links and relates them to autotest
+        and deletes relations with current Links (if exist)
+        System updates autotest and returns no content response
+        """),
+    "GetWorkItemsLinkedToAutoTest": Endpoint(
+        "get", "/api/v2/autoTests/{autoTestId}/workItems",
+        query={
+            "isWorkItemDeleted": ("boolean", "Boolean flag which defines if search must include deleted worItems"),
+        },
+        doc="""
+        Get all WorkItems Ids linked to AutoTest by Id or GlobalId
+
+        Use case
+        User sets autotest internal (guid format) or global (integer format) identifier and runs method execution
+        System finds the autotest by the identifier
+        System finds all actual and not deleted WorkItems related to the found autotest
+        System returns the enumeration of WorkItems
+        """),
+    "LinkAutoTestToWorkItem": Endpoint(
+        "post", "/api/v2/autoTests/{autoTestId}/workItems",
+        body="WorkItemIdModel",
+        doc="""
+        Link AutoTest to WorkItem by Id or GlobalId
+
+        Use case
+        User sets autotest internal (guid format) or global (integer format) identifier
+        User sets workitem internal (guid format) or global (integer format) identifier
+        User runs method execution
+        System finds the autotest by the autotest identifier
+        System finds the workitem by the workitem identifier
+        System relates the workitem with the autotest and returns no content response
+        """),
+    "DeleteAutoTestLinkFromWorkItem": Endpoint(
+        "delete", "/api/v2/autoTests/{autoTestId}/workItems",
+        query={
+            "workItemId": ("string", "workItem internal (guid format) or global (integer format) identifier"),
+        },
+        doc="""
+        Delete AutoTest link from WorkItem by Id or GlobalId
+        (if workItemId is not specified, then remove all links WorkItems to AutoTest)
+
+        Use case
+        User sets autotest internal (guid format) or global (integer format) identifier
+        [Optional] User sets workitem internal (guid format) or global (integer format) identifier
+        User runs method execution
+        System finds the autotest by the autotest identifier
+        [Optional] if workitem id is set by User, System finds the workitem by the workitem identifier and unlinks it
+        from autotest.
+        [Optional] Otherwise, if workitem id is not specified, System unlinks all workitems linked to autotest.
+        System returns no content response
+        """),
+    "GetWorkItemResults": Endpoint(
+        "get", "/api/v2/autoTests/{autoTestId}/testResultHistory",
+        query={
+            "From": ("string (date-time)", ""),
+            "To": ("string (date-time)", ""),
+            "ConfigurationIds": ("array", ""),
+            "TestPlanIds": ("array", ""),
+            "UserIds": ("array", ""),
+            "Outcomes": ("array", ""),
+            "IsAutomated": ("boolean", ""),
+            "TestRunIds": ("array", ""),
+            **PAGING,
+        },
+        doc="""
+        History of TestResults for AutoTest by Id or GlobalId
+
+        Use case
+        User sets autotest internal (guid format) or global (integer format) identifier
+        User sets getTestResultHistoryReportQuery (listed in the example)
+        User runs method execution
+        System search for test results using filters set by user in getTestResultHistoryReportQuery and autoTestId
+        System returns the enumeration of test results
+        """),
+    "GetTestRuns": Endpoint(
+        "get", "/api/v2/autoTests/{autoTestId}/testRuns",
+        doc="""
+        Stopped and completed TestRuns which contain AutoTest by Id or GlobalId
+
+        Use case
+        User sets autotest internal (guid format) or global (integer format) identifier
+        User runs method execution
+        System search for all test runs related to the autotest
+        System returns the enumeration of test runs
+        """),
+    "GetAutoTestAverageDuration": Endpoint(
+        "get", "/api/v2/autoTests/{autoTestId}/averageDuration",
+        doc="""
+        Get AutoTest average duration by Id or GlobalId
+
+        Use case
+        User sets autotest internal (guid format) or global (integer format) identifier
+        User runs method execution
+        System calculates pass average duration and fail average duration of autotest from all related test results
+        System returns pass average duration and fail average duration for autotest
+        """),
+    "GetAutoTestChronology": Endpoint(
+        "get", "/api/v2/autoTests/{autoTestId}/chronology",
+        doc="""
+        Get AutoTest chronology by Id or GlobalId
+
+        Use case
+        User sets autotest internal (guid format) or global (integer format) identifier
+        User runs method execution
+        System search all test results related to autotest (with default limit equal 100)
+        System orders the test results by CompletedOn property descending and then orders by CreatedDate property
+        descending
+        System returns test result chronology for autotest
+        """),
+    "GetConfigurationById": Endpoint(
+        "get", "/api/v2/configurations/{configurationId}",
+        doc="""
+        Get Configuration by Id or GlobalId
+
+        Use case
+        User sets configuration internal (guid format) or global (integer format) identifier
+        User runs method execution
+        System search configuration using the identifier
+        System returns configuration
+        """),
+    "CreateConfiguration": Endpoint(
+        "post", "/api/v2/configurations",
+        body="ConfigurationPostModel",
+        doc="""
+        Create Configuration
+
+        Use case
+        User sets configuration model (listed in the request example)
+        User runs method execution
+        System creates configuration
+        System returns created configuration (listed in the response example)
+        """),
+    "UpdateConfiguration": Endpoint(
+        "put", "/api/v2/configurations",
+        body="ConfigurationPutModel",
+        doc="""
+        Update Configuration
+
+        Use case
+        User sets configuration updated properties(listed in the request example)
+        User runs method execution
+        System updated configuration using updated properties
+        System returns no content response
+        """),
+    "GetAllParameters": Endpoint(
+        "get", "/api/v2/parameters",
+        query={
+            "isDeleted": ("boolean", "Boolean flag which defines if search must include deleted parameters"),
+            **PAGING,
+        },
+        doc="""
+        Get all parameters (if isDeleted is true, return deleted parameters)
+
+        Use case
+        [Optional] User sets isDeleted field value
+        [Optional] If User sets isDeleted field value as true, System search all deleted parameters
+        [Optional] If User sets isDeleted field value as false, System search all parameters which are not deleted
+        If User did not set isDeleted field value, System search all parameters
+        System returns array of all found parameters(listed in response model)
+        """),
+    "CreateParameter": Endpoint(
+        "post", "/api/v2/parameters",
+        body="ParameterPostModel",
+        doc="""
+        Create parameter
+
+        Use case
+        User sets parameter model (listed in the request example)
+        User runs method execution
+        System creates parameter
+        System returns parameter model
+        """),
+    "UpdateParameter": Endpoint(
+        "put", "/api/v2/parameters",
+        body="ParameterPutModel",
+        doc="""
+        Update parameter
+
+        Use case
+        User sets parameter updated properties(listed in the request example)
+        User runs method execution
+        System updated parameter using updated properties
+        System returns no content response
+        """),
+    "GetParameterById": Endpoint(
+        "get", "/api/v2/parameters/{parameterId}",
+        doc="""
+        Get parameter by id
+
+        Use case
+        User sets parameter internal (guid format) identifier
+        User runs method execution
+        System search parameter using the identifier
+        System returns parameter
+        """),
+    "DeleteParameter": Endpoint(
+        "delete", "/api/v2/parameters/{parameterId}",
+        doc="""
+        Delete parameter by id
+
+        Use case
+        User sets parameter internal (guid format) identifier
+        System search and delete parameter
+        System returns deleted parameter
+        """),
+    "DeleteByName": Endpoint(
+        "delete", "/api/v2/parameters/name/{name}",
+        doc="""
+        Delete parameter by name
+
+        Deletes parameter and all it's values
+        """),
+    "GetAllProjects": Endpoint(
+        "get", "/api/v2/projects",
+        query={
+            "isDeleted": ("boolean", "Boolean flag which defines if search must include deleted projects"),
+            "projectName": ("string", ""),
+            **PAGING,
+        },
+        doc="""
+        Get all Projects (if isDeleted is true, return deleted Projects)
+
+        Use case
+        [Optional] User sets isDeleted field value
+        [Optional] If User sets isDeleted field value as true, System search all deleted projects
+        [Optional] If User sets isDeleted field value as false, System search all projects which are not deleted
+        If User did not set isDeleted field value, System search all projects
+        System returns array of all found projects(listed in response model)
+        """),
+    "CreateProject": Endpoint(
+        "post", "/api/v2/projects",
+        body="ProjectPostModel",
+        doc="""
+        Create Project
+
+        Use case
+        User sets project parameters (listed in request example) and runs method execution
+        System creates project
+        System returns project model (example listed in response parameters)
+        """),
+    "UpdateProject": Endpoint(
+        "put", "/api/v2/projects",
+        body="ProjectPutModel",
+        doc="""
+        Update Project
+
+        Use case
+        User sets project parameters (listed in request example) and runs method execution
+        System updates project
+        System returns updated project model (example listed in response parameters)
+        """),
+    "GetProjectById": Endpoint(
+        "get", "/api/v2/projects/{projectId}",
+        doc="""
+        Get Project by Id or GlobalId
+
+        Use case
+        User sets project internal or global identifier and runs method execution
+        System search project
+        System returns project (example listed in response parameters)
+        """),
+    "DeleteProject": Endpoint(
+        "delete", "/api/v2/projects/{projectId}",
+        doc="""
+        Delete Project by Id or GlobalId
+
+        Use case
+        User sets project internal or global identifier and runs method execution
+        System search and delete project
+        System returns no content response
+        """),
+    "RestoreProject": Endpoint(
+        "post", "/api/v2/projects/{projectId}/restore",
+        doc="""
+        Restore Project by Id or GlobalId
+
+        Use case
+        User sets project internal or global identifier and runs method execution
+        System search and restores deleted project
+        System returns no content response
+        """),
+    "GetSectionsByProjectId": Endpoint(
+        "get", "/api/v2/projects/{projectId}/sections",
+        query={
+            **PAGING,
+        },
+        doc="""
+        Get Sections for Project by Id or GlobalId
+
+        Use case
+        User sets project internal or global identifier and runs method execution
+        System search project
+        System search all sections related to the project
+        System returns array of sections (listed in response)
+        """),
+    "GetAutoTestsNamespaces": Endpoint(
+        "get", "/api/v2/projects/{projectId}/autoTestsNamespaces",
+        doc="""
+        Get AutoTests Namespaces for Project by Id or GlobalId
+
+        Use case
+        User sets project internal or global identifier and runs method execution
+        System search project
+        System search all autotest related to the project
+        System returns array of autotest with namespaces and classnames (listed in response)
+        """),
+    "GetWorkItemsByProjectId": Endpoint(
+        "get", "/api/v2/projects/{projectId}/workItems",
+        query={
+            "isDeleted": ("boolean", "Boolean flag which defines if search must include deleted workitems"),
+            "tagNames": ("array", "Array of workitem tag names"),
+            "includeIterations": ("boolean", ""),
+            **PAGING,
+        },
+        doc="""
+        Get WorkItems for Project by Id or GlobalId (if isDeleted is true, return deleted WorkItems)
+
+        Use case
+        User sets project internal or global identifier
+        [Optional] User sets isDeleted field value
+        User runs method execution
+        System search project
+        [Optional] If User sets isDeleted field value as true, System search all deleted workitems related to project
+        [Optional] If User sets isDeleted field value as false, System search all workitems related to project which
+        are not deleted
+        If User did not set isDeleted field value, System search all  workitems related to project
+        System returns array of found workitems (listed in response model)
+        """),
+    "GetConfigurationsByProjectId": Endpoint(
+        "get", "/api/v2/projects/{projectId}/configurations",
+        doc="""
+        Get Configurations for Project by Id or GlobalId
+
+        Use case
+        User sets project internal or global identifier
+        User runs method execution
+        System search project
+        System search all configurations related to project
+        System returns array of found configurations (listed in response model)
+        """),
+    "GetAttributesByProjectId": Endpoint(
+        "get", "/api/v2/projects/{projectId}/attributes",
+        query={
+            "isDeleted": ("boolean", "Boolean flag which defines if search must include deleted attributes"),
+        },
+        doc="""
+        Get Projects Attributes by Id or GlobalId
+
+        Use case
+        User sets project internal or global identifier
+        [Optional] User sets isDeleted field value
+        User runs method execution
+        System search project
+        [Optional] If User sets isDeleted field value as true, System search all deleted attributes related to
+        project
+        [Optional] If User sets isDeleted field value as false, System search all attributes related to project which
+        are not deleted
+        [Optional] If User did not set isDeleted field value, System search all attributes related to project
+        System returns array of found attributes (listed in response model)
+        """),
+    "CreateProjectsAttribute": Endpoint(
+        "post", "/api/v2/projects/{projectId}/attributes",
+        body="CustomAttributePostModel",
+        doc="""
+        Create Projects Attribute
+
+        Use case
+        User sets attribute parameters (listed in request example) and runs method execution
+        System search project
+        System creates attribute and relates it to the project
+        System returns project attribute properties (example listed in response parameters)
+        """),
+    "UpdateProjectsAttribute": Endpoint(
+        "put", "/api/v2/projects/{projectId}/attributes",
+        body="CustomAttributeModel",
+        doc="""
+        Update Projects Attribute
+
+        Use case
+        User sets project parameters (listed in request example) and runs method execution
+        System updates project
+        System updates attribute related to the project
+        System returns no content response
+        """),
+    "GetAttributeByProjectId": Endpoint(
+        "get", "/api/v2/projects/{projectId}/attributes/{attributeId}",
+        doc="""
+        Get Projects Attribute by Id
+
+        Use case
+        User sets project internal or global identifier
+        User sets project attribute identifier
+        User runs method execution
+        System search project
+        System search project attribute
+        System returns project attribute (listed in response model)
+        """),
+    "DeleteProjectsAttribute": Endpoint(
+        "delete", "/api/v2/projects/{projectId}/attributes/{attributeId}",
+        doc="""
+        Delete Projects Attribute by Id
+
+        Use case
+        User sets project identifier and runs method execution
+        User sets attribute identifier
+        User runs method execution
+        System search project
+        System search and delete attribute
+        System returns no content response
+        """),
+    "GetTestPlansByProjectId": Endpoint(
+        "get", "/api/v2/projects/{projectId}/testPlans",
+        query={
+            "isDeleted": ("boolean", "Boolean flag which defines if search must include deleted test plans"),
+        },
+        doc="""
+        Get TestPlans for Project by Id or GlobalId (if isDeleted is true, return deleted TestPlans)
+
+        Use case
+        User sets project internal or global identifier
+        [Optional] User sets isDeleted field value
+        User runs method execution
+        System search project
+        [Optional] If User sets isDeleted field value as true, System search all deleted test plans related to
+        project
+        [Optional] If User sets isDeleted field value as false, System search all test plans related to project which
+        are not deleted
+        [Optional] If User did not set isDeleted field value, System search all v related to project
+        System returns array of found test plans (listed in response model)
+        """),
+    "GetTestRunsByProjectId": Endpoint(
+        "get", "/api/v2/projects/{projectId}/testRuns",
+        query={
+            "NotStarted": ("boolean", ""),
+            "InProgress": ("boolean", ""),
+            "Stopped": ("boolean", ""),
+            "Completed": ("boolean", ""),
+            "CreatedDateFrom": ("string (date-time)", ""),
+            "CreatedDateTo": ("string (date-time)", ""),
+            "TestPlanId": ("string (uuid)", ""),
+            **PAGING,
+        },
+        doc="""
+        Get TestRuns for Project by Id or GlobalId
+
+        Use case
+        User sets project internal or global identifier
+        User runs method execution
+        System search project
+        System search all test runs related to project
+        System returns array of found test runs (listed in response model)
+        """),
+    "Export": Endpoint(
+        "post", "/api/v2/projects/{projectId}/export",
+        body="ProjectExportQueryModel",
+        query={
+            "includeAttachments": ("boolean", ""),
+        },
+        doc="""
+        Export Project with tests, sections and configurations in json file
+
+        Use case
+        User sets project internal or global identifier
+        User runs method execution
+        System search project
+        System returns project data as json file, containing project data, related attributes, sections and
+        workitems
+        """),
+    "ExportWithTestPlansAndConfigurations": Endpoint(
+        "post", "/api/v2/projects/{projectId}/export-by-testPlans",
+        body="ProjectExportWithTestPlansPostModel",
+        query={
+            "includeAttachments": ("boolean", ""),
+        },
+        doc="""
+        Export Project with tests, sections, configurations, testPlans, testSuites and testPoints as json file
+
+        Use case
+        User sets project internal or global identifier
+        User runs method execution
+        System search project
+        System returns project data as json file, containing project data, related attributes, sections, workitems,
+        test plans, test suites, test points and configurations
+        """),
+    "Import": Endpoint(
+        "post", "/api/v2/projects/import",
+        body="file",
+        query={
+            "apiVersion": ("string", ""),
+            "includeAttachments": ("boolean", ""),
+        },
+        doc="""
+        Import Project from json file
+        Project can be imported only once (this method or ImportToExistingProject)
+        Next import will sync content in previously imported project.
+
+        Use case
+        User attaches project as json file taken from export or export-by-testPlans method
+        User runs method execution
+        System creates project
+        System returns no content response
+        """),
+    "ImportToExistingProject": Endpoint(
+        "post", "/api/v2/projects/{projectId}/import",
+        body="file",
+        query={
+            "apiVersion": ("string", ""),
+            "includeAttachments": ("boolean", ""),
+        },
+        doc="""
+        Import to existing Project from json file.
+        Sections can be imported in only one target project!
+
+        Use case
+        User attaches project as json file taken from export or export-by-testPlans method
+        User runs method execution
+        System updates project
+        System returns no content response
+        """),
+    "GetCustomAttributeTestPlanProjectRelations": Endpoint(
+        "get", "/api/v2/projects/{projectId}/testPlans/attributes",
+        doc="""
+        Get project for test plans attributes
+
+        Use case
+        User runs method execution
+        System returns project for test plans attributes by project identifier
+        """),
+    "CreateCustomAttributeTestPlanProjectRelations": Endpoint(
+        "post", "/api/v2/projects/{projectId}/testPlans/attributes",
+        body="list of uuid string",
+        doc="""
+        Add attributes to project for test plans
+
+        Use case
+        User sets project internal or global identifier and attributes identifiers
+        User runs method execution
+        System updates project and add attributes to project for test plans
+        System returns no content response
+        """),
+    "DeleteCustomAttributeTestPlanProjectRelations": Endpoint(
+        "delete", "/api/v2/projects/{projectId}/testPlans/attribute/{attributeId}",
+        doc="""
+        Delete attribute from project for test plans
+
+        Use case
+        User sets project internal or global identifier and attribute identifier
+        User runs method execution
+        System updates project and delete attribute from project for test plans
+        System returns no content response
+        """),
+    "UpdateCustomAttributeTestPlanProjectRelations": Endpoint(
+        "put", "/api/v2/projects/{projectId}/testPlans/attribute",
+        body="CustomAttributeTestPlanProjectRelationPutModel",
+        doc="""
+        Update project attribute for test plan
+
+        Use case
+        User sets project internal or global identifier and attribute model
+        User runs method execution
+        System updates project and project attribute for test plan
+        System returns no content response
+        """),
+    "DeleteProjectAutoTests": Endpoint(
+        "delete", "/api/v2/projects/{projectId}/autoTests",
+        doc="""
+        Delete all AutoTests from Project
+
+        Use case
+        User sets project internal or global identifier
+        User runs method execution
+        System delete all autotests from project
+        System returns no content response
+        """),
+    "GetSectionById": Endpoint(
+        "get", "/api/v2/sections/{sectionId}",
+        query={
+            "isDeleted": ("boolean", "Flag that defines if deleted section must be include in the response"),
+        },
+        doc="""
+        Get Section by id
+
+        Use case
+        User sets section internal (guid format) identifier
+        User runs method execution
+        System search section by the section identifier
+        [Optional] If isDeleted flag equals false, deleted workitems are not being searched.
+        If true, deleted workitems are also being searched, null for all workitems.
+        System returns section
+        """),
+    "DeleteSection": Endpoint(
+        "delete", "/api/v2/sections/{sectionId}",
+        doc="""
+        Delete Section by id
+
+        Use case
+        User sets section identifier
+        User runs method execution
+        System search section by the identifier
+        System search and delete nested sections of the found section
+        System search and delete workitems related to the found nested sections
+        System deletes initial section and related workitem
+        System returns no content response
+        """),
+    "CreateSection": Endpoint(
+        "post", "/api/v2/sections",
+        body="SectionPostModel",
+        doc="""
+        Create Section
+
+        Use case
+        User sets section properties (listed in request example)
+        User runs method execution
+        System creates section property values
+        System returns section (listed in response example)
+        """),
+    "UpdateSection": Endpoint(
+        "put", "/api/v2/sections",
+        body="SectionPutModel",
+        doc="""
+        Update Section
+
+        Use case
+        User sets section properties (listed in request example)
+        User runs method execution
+        System search section by the identifier
+        System updates section using the property values
+        System returns no content response
+        """),
+    "Rename": Endpoint(
+        "post", "/api/v2/sections/rename",
+        body="SectionRenameModel",
+        doc="""
+        Rename Section
+
+        Use case
+        User sets section identifier and new name (listed in request example)
+        User runs method execution
+        System search section by the identifier
+        System updates section name using the new name
+        System returns no content response
+        """),
+    "Move": Endpoint(
+        "post", "/api/v2/sections/move",
+        body="SectionMoveModel",
+        doc="""
+        Move Section. Can be moved inside another section. It is possible to indicate a project
+
+        Use case
+        User sets section identifier, old parent identifier, parent identifier and  next section identifier (listed
+        in request example)
+        User runs method execution
+        System search section by the identifier
+        System unlink section from the old parent and links to the new one
+        System updates section rank using the next section identifier
+        System returns no content response
+        """),
+    "GetWorkItemsBySectionId": Endpoint(
+        "get", "/api/v2/sections/{sectionId}/workItems",
+        query={
+            "isDeleted": ("boolean", "Flag that defines if deleted workitems must be include in the response"),
+            "tagNames": ("array", "Array of workitem tag names"),
+            "includeIterations": ("boolean", ""),
+            **PAGING,
+        },
+        doc="""
+        Get WorkItems for Section (if isDeleted is true, return deleted WorkItems)
+
+        Use case
+        User sets section identifier
+        User runs method execution
+        System search section by the identifier
+        System search workitems related to the section
+        [Optional] If isDeleted flag equals false, deleted workitems are not being searched.
+        If true, deleted workitems are also being searched, null for all workitems.
+        System returns workitem collection
+        """),
+    "GetTestPlanById": Endpoint(
+        "get", "/api/v2/testPlans/{testPlanId}",
+        doc="""
+        Get TestPlan by Id
+
+        Use case
+        User sets test plan identifier
+        User runs method execution
+        System search  test plan by the identifier
+        System returns test plan
+        """),
+    "DeleteTestPlan": Endpoint(
+        "delete", "/api/v2/testPlans/{testPlanId}",
+        doc="""
+        Delete TestPlan
+
+        Use case
+        User sets test plan identifier
+        User runs method execution
+        System delete test plan
+        System returns no content response
+        """),
+    "CreateTestPlan": Endpoint(
+        "post", "/api/v2/testPlans",
+        body="TestPlanPostModel",
+        doc="""
+        Create TestPlan
+
+        Use case
+        User sets test plan properties (listed in request example)
+        User runs method execution
+        System creates test plan
+        System returns test plan (listed in response example)
+        """),
+    "UpdateTestPlan": Endpoint(
+        "put", "/api/v2/testPlans",
+        body="TestPlanPutModel",
+        doc="""
+        Update TestPlan
+
+        Use case
+        User sets test plan properties(listed in request example)
+        User runs method execution
+        System updates test plan
+        System returns no content response
+        """),
+    "RestoreTestPlan": Endpoint(
+        "post", "/api/v2/testPlans/{testPlanId}/restore",
+        doc="""
+        Restore TestPlan
+
+        Use case
+        User sets test plan identifier
+        User runs method execution
+        System restores test plan
+        System returns no content response
+        """),
+    "Clone": Endpoint(
+        "post", "/api/v2/testPlans/{testPlanId}/clone",
+        doc="""
+        Clone TestPlan
+
+        Use case
+        User sets test plan identifier
+        User runs method execution
+        System clones test plan
+        System returns test plan (listed in response example)
+        """),
+    "Start": Endpoint(
+        "post", "/api/v2/testPlans/{testPlanId}/start",
+        doc="""
+        Start TestPlan
+
+        Use case
+        User sets test plan identifier
+        User runs method execution
+        System starts the test plan and updates test plan status
+        System returns no content response
+        """),
+    "Pause": Endpoint(
+        "post", "/api/v2/testPlans/{testPlanId}/pause",
+        doc="""
+        Pause TestPlan
+
+        Use case
+        User sets test plan identifier
+        User runs method execution
+        System pauses the test plan and updates test plan status
+        System returns no content response
+        """),
+    "Complete": Endpoint(
+        "post", "/api/v2/testPlans/{testPlanId}/complete",
+        doc="""
+        Complete TestPlan
+
+        Use case
+        User sets test plan identifier
+        User runs method execution
+        System completes the test plan and updates test plan status
+        System returns no content response
+        """),
+    "GetTestSuitesById": Endpoint(
+        "get", "/api/v2/testPlans/{testPlanId}/testSuites",
+        doc="""
+        Get TestSuites Tree By Id
+
+        Use case
+        User sets test plan identifier
+        User runs method execution
+        System finds test suites related to the test plan
+        System returns test suites as a tree model (listed in response example)
+        """),
+    "AddWorkItemsWithSections": Endpoint(
+        "post", "/api/v2/testPlans/{testPlanId}/workItems/withSections",
+        body="list of uuid string",
+        doc="""
+        Add WorkItems to TestPlan with Sections as TestSuites
+
+        Use case
+        User sets TestPlan identifier
+        User sets WorkItem identifiers (listed in request example)
+        User runs method execution
+        System added WorkItems and Sections to TestPlan
+        System returns no content response
+        """),
+    "AddTestPointsWithSections": Endpoint(
+        "post", "/api/v2/testPlans/{testPlanId}/test-points/withSections",
+        body="WorkItemSelectModel",
+        doc="""
+        Add test-points to test suite with sections
+        """),
+    "GetAttachments": Endpoint(
+        "get", "/api/v2/testResults/{testResultId}/attachments",
+        doc="""
+        Get all attachments of TestResult
+
+        Use case
+        User sets testResultId
+        User runs method execution
+        System search all attachments of the test result
+        System returns attachments enumeration
+        """),
+    "CreateAttachment": Endpoint(
+        "post", "/api/v2/testResults/{testResultId}/attachments",
+        body="file",
+        doc="""
+        Upload and link attachment to TestResult
+
+        Use case
+        User sets testResultId
+        User attaches a file
+        System creates attachment and links it to the test result
+        System returns attachment identifier
+        """),
+    "DownloadAttachment": Endpoint(
+        "get", "/api/v2/testResults/{testResultId}/attachments/{attachmentId}",
+        args=("attachmentId", "testResultId"),
+        query={
+            "Width": ("integer (int32)", ""),
+            "Height": ("integer (int32)", ""),
+            "ResizeOption": ("choose one from: Crop | AddBackgroundStripes", ""),
+            "BackgroundColor": ("string", ""),
+        },
+        doc="""
+        Get attachment of TestResult
+
+        Use case
+        User sets attachmentId and testResultId
+        [Optional] User sets resize configuration
+        User runs method execution
+        System search attachments by the attachmentId and the testResultId
+        [Optional] If resize configuration is set, System resizes the attachment according to the resize
+        configuration
+        [Optional] Otherwise, System does not resize the attachment
+        System returns attachment as a file
+        """),
+    "DeleteAttachment": Endpoint(
+        "delete", "/api/v2/testResults/{testResultId}/attachments/{attachmentId}",
+        doc="""
+        Remove attachment and unlink from TestResult
+
+        Use case
+        User sets testResultId and attachmentId
+        User attaches a file
+        User runs method execution
+        System deletes attachment and unlinks it from the test result
+        System returns attachment identifier
+        """),
+    "GetAttachment": Endpoint(
+        "get", "/api/v2/testResults/{testResultId}/attachments/{attachmentId}/info",
+        args=("attachmentId", "testResultId"),
+        doc="""
+        Get Metadata of TestResult's attachment
+
+        Use case
+        User sets attachmentId and testResultId
+        User runs method execution
+        System search attachment by the attachmentId and the testResultId
+        System returns attachment data
+        """),
+    "CreateEmpty": Endpoint(
+        "post", "/api/v2/testRuns",
+        body="TestRunV2PostShortModel",
+        doc="""
+        Create empty TestRun
+
+        Use case
+        User sets test run model (listed in the request example)
+        User runs method execution
+        System creates test run
+        System returns test run model
+        """),
+    "UpdateEmpty": Endpoint(
+        "put", "/api/v2/testRuns",
+        body="TestRunV2PutModel",
+        doc="""
+        Update empty TestRun
+
+        Use case
+        User sets test run properties (listed in the request example)
+        User runs method execution
+        System updates test run
+        System returns returns no content response
+        """),
+    "CreateAndFillByWorkItems": Endpoint(
+        "post", "/api/v2/testRuns/byWorkItems",
+        body="TestRunFillByWorkItemsPostModel",
+        doc="""
+        Create TestRun with TestPoints selected using ConfigurationIds and WorkItem Ids
+
+        Use case
+        User sets test run properties (listed in the request example)
+        User sets relative configuration and workitem ids
+        User runs method execution
+        System creates test run
+        System finds workitems and configurations using ids listed by user
+        System creates test result by test points which use workitems and configurations
+        System returns test run model
+        """),
+    "CreateAndFillByConfigurations": Endpoint(
+        "post", "/api/v2/testRuns/byConfigurations",
+        body="TestRunFillByConfigurationsPostModel",
+        doc="""
+        Create TestRun with TestPointSelectors based on ConfigurationId and WorkItem Ids
+
+        Use case
+        User sets test run properties (listed in the request example)
+        User sets relative configuration and workitem ids
+        User runs method execution
+        System creates test run
+        System finds workitems and configurations using ids listed by user
+        System creates test result by test points which use workitems and configurations
+        System returns test run model
+        """),
+    "CreateAndFillByAutoTests": Endpoint(
+        "post", "/api/v2/testRuns/byAutoTests",
+        body="TestRunFillByAutoTestsPostModel",
+        doc="""
+        Create TestRun without TestPoints using ConfigurationIds and AutoTestIds
+
+        Use case
+        User sets test run properties (listed in the request example)
+        User sets relative configuration and workitem ids
+        User runs method execution
+        System creates test run
+        System finds autotests and configurations using ids listed by user
+        System creates test result by test points which use autotests and configurations
+        System returns test run model
+        """),
+    "GetTestRunById": Endpoint(
+        "get", "/api/v2/testRuns/{testRunId}",
+        doc="""
+        Get TestRun by Id
+
+        Use case
+        User sets test run identifier
+        User runs method execution
+        System finds test run
+        System returns test run
+        """),
+    "StartTestRun": Endpoint(
+        "post", "/api/v2/testRuns/{testRunId}/start",
+        doc="""
+        Start TestRun
+
+        Use case
+        User sets test run identifier
+        User runs method execution
+        System starts test run
+        System returns no content response
+        """),
+    "StopTestRun": Endpoint(
+        "post", "/api/v2/testRuns/{testRunId}/stop",
+        doc="""
+        Stop TestRun
+
+        Use case
+        User sets test run identifier
+        User runs method execution
+        System stops test run
+        System returns no content response
+        """),
+    "CompleteTestRun": Endpoint(
+        "post", "/api/v2/testRuns/{testRunId}/complete",
+        doc="""
+        Complete TestRun
+
+        Use case
+        User sets test run identifier
+        User runs method execution
+        System completes test run
+        System returns no content response
+        """),
+    "SetAutoTestResultsForTestRun": Endpoint(
+        "post", "/api/v2/testRuns/{testRunId}/testResults",
+        body="list of AutoTestResultsForTestRunModel",
+        doc="""
+        Set AutoTest Results For TestRun
+
+        Use case
+        User sets test run identifier
+        User sets test result model (listed in request parameters)
+        User runs method execution
+        System sets test results of autotest listed in request in test run
+        System returns array of test results identifiers
+        """),
+    "GetTestSuiteById": Endpoint(
+        "get", "/api/v2/testSuites/{testSuiteId}",
+        doc="""
+        Get TestSuite by Id
+
+        Use case
+        User sets test suite identifier
+        User runs method execution
+        System search test suite by identifier
+        System returns test suite
+        """),
+    "DeleteTestSuite": Endpoint(
+        "delete", "/api/v2/testSuites/{testSuiteId}",
+        doc="""
+        Delete TestSuite
+
+        Use case
+        User sets test suite identifier
+        User runs method execution
+        System search test suite by identifier
+        System deletes test suite
+        System returns no content response
+        """),
+    "CreateTestSuite": Endpoint(
+        "post", "/api/v2/testSuites",
+        body="TestSuiteV2PostModel",
+        doc="""
+        Create TestSuite
+
+        Use case
+        User sets test suite model (listed in request parameters)
+        User runs method execution
+        System creates test suite
+        System returns test suite
+        """),
+    "UpdateTestSuite": Endpoint(
+        "put", "/api/v2/testSuites",
+        body="TestSuiteV2PutModel",
+        doc="""
+        Update TestSuite
+
+        Use case
+        User sets test suite model (listed in request parameters)
+        User runs method execution
+        System updates test suite
+        System returns test suite
+        """),
+    "GetTestPointsById": Endpoint(
+        "get", "/api/v2/testSuites/{testSuiteId}/testPoints",
+        doc="""
+        Get TestPoints By Id
+
+        Use case
+        User sets test suite identifier
+        User runs method execution
+        System search test suite by identifier
+        System search test points related to the test suite
+        System returns test points array
+        """),
+    "GetTestResultsById": Endpoint(
+        "get", "/api/v2/testSuites/{testSuiteId}/testResults",
+        doc="""
+        Get TestResults By Id
+
+        Use case
+        User sets test suite identifier
+        User runs method execution
+        System search test suite by identifier
+        System search test points related to the test suite
+        System search test results related to the test points
+        System returns test results array
+        """),
+    "GetWorkItemsById": Endpoint(
+        "get", "/api/v2/testSuites/{testSuiteId}/workItems",
+        query={
+            "isDeleted": ("boolean", "Flag that defines if deleted workitems must be include in the response"),
+            "tagNames": ("array", "Array of workitem tag names"),
+            **PAGING,
+        },
+        doc="""
+        Get WorkItems By Id
+
+        Use case
+        User sets test suite identifier
+        [Optional] User sets isDeleted property as true
+        User runs method execution
+        System search test suite by identifier
+        System search test points related to the test suite
+        System search workitems related to the test points
+        [Optional] User sets isDeleted property is set as true, System includes deleted workitems
+        Otherwise, system applies filter which excludes deleted workitems from all found workitems
+        System returns workitems array
+        """),
+    "SetWorkItemsByTestSuiteId": Endpoint(
+        "post", "/api/v2/testSuites/{testSuiteId}/workItems",
+        body="list of uuid string",
+        doc="""
+        Set WorkItems By TestSuite Id
+
+        Use case
+        User sets test suite identifier
+        User sets collection of workitems identifiers
+        User runs method execution
+        System search test suite by identifier
+        System search test points related to the test suite
+        System search workitems
+        System restores(if exist) or creates test points with listed workitems
+        System returns no content response
+        """),
+    "AddTestPointsToTestSuite": Endpoint(
+        "post", "/api/v2/testSuites/{testSuiteId}/test-points",
+        body="WorkItemSelectModel",
+        doc="""
+        Add test-points to test suite
+        """),
+    "GetConfigurationsByTestSuiteId": Endpoint(
+        "get", "/api/v2/testSuites/{testSuiteId}/configurations",
+        doc="""
+        Get Configurations By Id
+
+        Use case
+        User sets test suite identifier
+        User runs method execution
+        System search test suite by identifier
+        System search test points related to the test suite
+        System search configurations related to the test points
+        System returns configurations array
+        """),
+    "SetConfigurationsByTestSuiteId": Endpoint(
+        "post", "/api/v2/testSuites/{testSuiteId}/configurations",
+        body="list of uuid string",
+        doc="""
+        Set Configurations By TestSuite Id
+
+        Use case
+        User sets test suite identifier
+        User sets collection of configuration identifiers
+        User runs method execution
+        System search test suite by identifier
+        System search test points related to the test suite
+        System search configuration
+        System restores(if exist) or creates test points with listed configuration
+        System returns no content response
+        """),
+    "GetWorkItemById": Endpoint(
+        "get", "/api/v2/workItems/{workItemId}",
+        query={
+            "versionId": ("string (uuid)", "WorkItem version (guid format) identifier"),
+            "versionNumber": ("integer (int32)", "WorkItem version number (0 is the last version)"),
+        },
+        doc="""
+        Get Test Case, Checklist or Shared Step by Id or GlobalId
+
+        Use case
+        User sets workitem identifier
+        [Optional] User sets workitem version identifier
+        [Optional] User sets workitem version number
+        User runs method execution
+        System search workitem by identifier
+        [Optional] if User sets workitem version identifier, system search workitem version by identifier.
+        [Optional] if user sets workitem version number, system search workitem version by number
+        Otherwise, system search last workitem version
+        System returns workitem
+        """),
+    "DeleteWorkItem": Endpoint(
+        "delete", "/api/v2/workItems/{workItemId}",
+        doc="""
+        Delete Test Case, Checklist or Shared Step by Id or GlobalId
+
+        Use case
+        User sets workitem identifier
+        User runs method execution
+        System deletes workitem
+        System returns no content response
+        """),
+    "GetIterations": Endpoint(
+        "get", "/api/v2/workItems/{workItemId}/iterations",
+        query={
+            "versionId": ("string (uuid)", "WorkItem version (guid format) identifier"),
+            "versionNumber": ("integer (int32)", "WorkItem version number (0 is the last version)"),
+        },
+        doc="""
+        Get iterations by workitem Id or GlobalId
+        """),
+    "CreateWorkItem": Endpoint(
+        "post", "/api/v2/workItems",
+        body="WorkItemPostModel",
+        doc="""
+        Create Test Case, Checklist or Shared Step
+
+        Use case
+        User sets workitem properties (listed in request parameters)
+        User runs method execution
+        System creates workitem by identifier
+        System returns workitem model (listed in response parameters)
+        """),
+    "UpdateWorkItem": Endpoint(
+        "put", "/api/v2/workItems",
+        body="WorkItemPutModel",
+        doc="""
+        Update Test Case, Checklist or Shared Step
+
+        Use case
+        User sets workitem properties (listed in request parameters)
+        User runs method execution
+        System updates workitem by identifier
+        System returns updated workitem model (listed in response parameters)
+        """),
+    "GetAutoTestsForWorkItem": Endpoint(
+        "get", "/api/v2/workItems/{workItemId}/autoTests",
+        doc="""
+        Get all AutoTests linked to WorkItem by Id or GlobalId
+
+        Use case
+        User sets workitem identifier
+        User runs method execution
+        System search workitem by identifier
+        System search all autotests, related to found workitem
+        System returns list of found autotests
+        """),
+    "DeleteAllWorkItemsFromAutoTest": Endpoint(
+        "delete", "/api/v2/workItems/{workItemId}/autoTests",
+        doc="""
+        Delete all links AutoTests from WorkItem by Id or GlobalId
+
+        Use case
+        User sets workitem identifier
+        User runs method execution
+        System search workitem by identifier
+        System search and delete all autotests, related to found workitem
+        System returns no content response
+        """),
+    "GetWorkItemChronology": Endpoint(
+        "get", "/api/v2/workItems/{workItemId}/chronology",
+        doc="""
+        Get WorkItem chronology by Id or GlobalId
+
+        Use case
+        User sets workitem identifier
+        User runs method execution
+        System search workitem by identifier
+        System search test results of all autotests, related to found workitem
+        System sort results by CompletedOn ascending, then by CreatedDate ascending
+        System returns sorted collection of test results
+        """),
+    "GetWorkItemVersions": Endpoint(
+        "get", "/api/v2/workItems/{workItemId}/versions",
+        query={
+            "workItemVersionId": ("string (uuid)", "WorkItem version (guid format) identifier"),
+            "versionNumber": ("integer (int32)", "WorkItem version (integer format) number"),
+        },
+        doc="""
+        Get WorkItem versions
+
+        Use case
+        User sets workitem identifier
+        [Optional] User sets workitem version identifier
+        User runs method execution
+        System search workitem by identifier
+        [Optional] If User set workitem version identifier, System search workitem version by version identifier
+        Otherwise, system search all version of workitem
+        System returns array of workitem version models (listed in response example)
+        """),
+}
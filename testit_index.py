@@ -0,0 +1,144 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import json
+import os
+import threading
+
+_AUTOTEST_PATHS = ("/api/v2/autoTests", "/api/v2/autoTests/bulk")
+
+
+class AutoTestIndex:
+    """
+    Map externalId of AutoTests of one project to their identifiers in TestIT
+
+    The index is loaded page by page with GetAllAutoTests without steps and labels, ordered by creation date,
+    so refresh loads only AutoTests created after the previous one.
+    AutoTests created by CreateAutoTest, CreateMultiple and CreateMultipleInChunks of the client are added
+    to the index as soon as TestIT returns them
+    """
+    def __init__(self, client, projectId, path=None, page_size=1000, prefetch=0):
+        """
+        :param client: TestITClient used to load the index
+        :param projectId: Project internal identifier
+        :param path: Path to json file to keep the index between runs
+        :param page_size: Number of AutoTests requested at once
+        :param prefetch: Number of pages requested in advance in worker threads
+        """
+        self.client = client
+        self.projectId = projectId
+        self.path = path
+        self.page_size = page_size
+        self.prefetch = prefetch
+        # externalId -> id
+        self._ids = {}
+        # number of AutoTests of the project already read from ordered listing
+        self._loaded = 0
+        self._lock = threading.Lock()
+        if path is not None and os.path.isfile(path):
+            self._load()
+        client.response_hooks.append(self._on_response)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, externalId):
+        return externalId in self._ids
+
+    def __getitem__(self, externalId):
+        return self._ids[externalId]
+
+    def get(self, externalId, default=None):
+        """
+        Return identifier of AutoTest by externalId or default
+        """
+        return self._ids.get(externalId, default)
+
+    def items(self):
+        """
+        Return list of pairs (externalId, id)
+        """
+        with self._lock:
+            return list(self._ids.items())
+
+    def add(self, autotest):
+        """
+        Add AutoTest model (dict with externalId and id) to the index
+        """
+        if autotest.get("projectId", self.projectId) != self.projectId or not autotest.get("externalId"):
+            return
+        with self._lock:
+            self._ids[autotest["externalId"]] = autotest["id"]
+
+    def refresh(self, full=False):
+        """
+        Load AutoTests created after previous refresh (or all AutoTests if full is set) and save the index to path
+        Last loaded page is requested again, so AutoTests deleted since previous refresh shift no new ones out of it
+        """
+        with self._lock:
+            if full:
+                self._ids.clear()
+                self._loaded = 0
+            skip = max(self._loaded - self.page_size, 0)
+        loaded = skip
+        for autotest in self.client.IterAllAutoTests(page_size=self.page_size, prefetch=self.prefetch, Skip=skip,
+                                                     projectId=self.projectId, isDeleted=False, includeSteps=False,
+                                                     includeLabels=False, OrderBy="createdDate asc"):
+            self.add(autotest)
+            loaded += 1
+        with self._lock:
+            self._loaded = loaded
+        if self.path is not None:
+            self.save()
+
+    def detach(self):
+        """
+        Stop adding AutoTests created by the client
+        """
+        if self._on_response in self.client.response_hooks:
+            self.client.response_hooks.remove(self._on_response)
+
+    def save(self):
+        """
+        Write the index to path
+        """
+        if self.path is None:
+            raise AssertionError("path of the index is not set")
+        with self._lock:
+            state = {"projectId": self.projectId, "loaded": self._loaded, "ids": dict(self._ids)}
+        temp_path = self.path + ".tmp"
+        with open(temp_path, mode="w", encoding="utf-8") as file:
+            json.dump(state, file, separators=(",", ":"))
+        os.replace(temp_path, self.path)
+
+    def _load(self):
+        """
+        Read the index from path, ignore the file if it was written for another project
+        """
+        with open(self.path, encoding="utf-8") as file:
+            try:
+                state = json.load(file)
+            except ValueError:
+                return
+        if state.get("projectId") != self.projectId:
+            return
+        self._ids = state["ids"]
+        self._loaded = state["loaded"]
+
+    def _on_response(self, method, path, result):
+        """
+        Add AutoTests returned by CreateAutoTest and CreateMultiple to the index
+        """
+        if method != "post" or path not in _AUTOTEST_PATHS:
+            return
+        for autotest in result if isinstance(result, list) else [result]:
+            if isinstance(autotest, dict) and "id" in autotest:
+                self.add(autotest)
@@ -0,0 +1,41 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import importlib
+import importlib.util
+import threading
+
+_lock = threading.RLock()
+# name -> result of find_spec check
+_installed = dict()
+
+
+def is_installed(name):
+    """
+    Check if module can be imported without importing it
+    """
+    installed = _installed.get(name)
+    if installed is None:
+        installed = _installed[name] = importlib.util.find_spec(name) is not None
+    return installed
+
+
+def import_module(name):
+    """
+    Import module on first use instead of import of testit modules
+
+    Used for heavy dependencies (requests, aiohttp, orjson), so importing testit modules stays fast
+    for short-lived scripts which send few requests or none at all.
+    Module is imported completely under a lock before it is returned, so threads sending their first requests
+    at the same time never see partly initialized module
+    """
+    with _lock:
+        return importlib.import_module(name)
@@ -0,0 +1,221 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import bisect
+import re
+import threading
+
+from testit_cache import _compile_template
+
+# upper bounds (in seconds) of buckets of request latency histogram
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# segments of paths not described by endpoint table which look like identifiers
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12})$")
+
+
+class _Endpoint:
+    """
+    Metrics of requests to one endpoint template with one http method
+    """
+    def __init__(self, buckets):
+        self.requests = 0
+        # status code (or "error" for requests failed without response) -> number of requests
+        self.statuses = dict()
+        # number of requests with latency not larger than bucket bound, the last one is +Inf
+        self.latency_buckets = [0] * (len(buckets) + 1)
+        self.latency_sum = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+
+
+class MetricsRegistry:
+    """
+    In-process metrics of requests sent by TestIT clients: number of requests by status code, latency histogram,
+    request and response body sizes and retries for every endpoint template ("/api/v2/projects/{projectId}")
+
+    One registry may be shared by several clients, all methods are thread-safe
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS, templates=None, max_endpoints=1000):
+        """
+        :param buckets: Upper bounds (in seconds) of buckets of latency histogram
+        :param templates: Path templates requests are grouped by (default - paths of testit_endpoints.ENDPOINTS)
+        :param max_endpoints: Maximum number of (method, template) pairs kept, requests to other endpoints
+        are counted as "other" so that unexpected paths can not grow the registry without bound
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.max_endpoints = max_endpoints
+        self._templates = templates
+        self._patterns = None
+        # path -> template, paths with different ids are not kept
+        self._resolved = dict()
+        # (method, template) -> _Endpoint
+        self._endpoints = dict()
+        self._lock = threading.Lock()
+
+    def template(self, path):
+        """
+        Return endpoint template of request path: "/api/v2/projects/<id>?Skip=0" -> "/api/v2/projects/{projectId}"
+        """
+        path = path.split("?", 1)[0]
+        template = self._resolved.get(path)
+        if template is not None:
+            return template
+        if self._patterns is None:
+            templates = self._templates
+            if templates is None:
+                import testit_endpoints
+                templates = {endpoint.path for endpoint in testit_endpoints.ENDPOINTS.values()}
+            # literal segments win over arguments: "/api/v2/autoTests/bulk" before "/api/v2/autoTests/{id}"
+            self._patterns = [(_compile_template(template), template)
+                              for template in sorted(templates, key=lambda template: template.count("{"))]
+        template = next((template for pattern, template in self._patterns if pattern.match(path)), None)
+        if template is None:
+            template = "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+        elif "{" not in template:
+            # paths without arguments repeat, so their templates are remembered
+            self._resolved[path] = template
+        return template
+
+    def _endpoint(self, method, path):
+        key = (method.upper(), self.template(path))
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            if len(self._endpoints) >= self.max_endpoints:
+                key = (key[0], "other")
+                endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = _Endpoint(self.buckets)
+        return endpoint
+
+    def observe(self, method, path, status, seconds, request_bytes=0, response_bytes=0):
+        """
+        Record request sent to path: status code of response (None if request failed without response),
+        latency (in seconds, retries included) and sizes of request and response bodies
+        """
+        status = "error" if status is None else str(status)
+        with self._lock:
+            endpoint = self._endpoint(method, path)
+            endpoint.requests += 1
+            endpoint.statuses[status] = endpoint.statuses.get(status, 0) + 1
+            endpoint.latency_buckets[bisect.bisect_left(self.buckets, seconds)] += 1
+            endpoint.latency_sum += seconds
+            endpoint.request_bytes += request_bytes
+            endpoint.response_bytes += response_bytes
+
+    def retry(self, method, path):
+        """
+        Record repeated attempt of request to path
+        """
+        with self._lock:
+            self._endpoint(method, path).retries += 1
+
+    def reset(self):
+        """
+        Forget all recorded metrics
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self):
+        """
+        Return list of dicts with metrics of every endpoint:
+        method, endpoint, requests, statuses (status -> count), latency (sum, count, buckets: bound -> cumulative
+        count), request_bytes, response_bytes, retries
+        """
+        result = list()
+        with self._lock:
+            for (method, template), endpoint in sorted(self._endpoints.items(), key=lambda item: item[0][::-1]):
+                cumulative = 0
+                buckets = dict()
+                for bound, count in zip([*self.buckets, float("inf")], endpoint.latency_buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                result.append({
+                    "method": method,
+                    "endpoint": template,
+                    "requests": endpoint.requests,
+                    "statuses": dict(endpoint.statuses),
+                    "latency": {"sum": endpoint.latency_sum, "count": endpoint.requests, "buckets": buckets},
+                    "request_bytes": endpoint.request_bytes,
+                    "response_bytes": endpoint.response_bytes,
+                    "retries": endpoint.retries,
+                })
+        return result
+
+    def render_prometheus(self, prefix="testit_client"):
+        """
+        Return metrics in Prometheus text exposition format
+        """
+        snapshot = self.snapshot()
+        lines = list()
+
+        def family(name, kind, description):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def labels(item, **extra):
+            values = {"method": item["method"], "endpoint": item["endpoint"], **extra}
+            return "{" + ",".join(f'{label}="{_escape(value)}"' for label, value in values.items()) + "}"
+
+        family("requests_total", "counter", "Requests sent to TestIT by status code")
+        for item in snapshot:
+            for status, count in sorted(item["statuses"].items()):
+                lines.append(f"{prefix}_requests_total{labels(item, status=status)} {count}")
+        family("request_duration_seconds", "histogram", "Latency of requests to TestIT, retries included")
+        for item in snapshot:
+            for bound, count in item["latency"]["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{prefix}_request_duration_seconds_bucket{labels(item, le=le)} {count}")
+            lines.append(f"{prefix}_request_duration_seconds_sum{labels(item)} {item['latency']['sum']!r}")
+            lines.append(f"{prefix}_request_duration_seconds_count{labels(item)} {item['latency']['count']}")
+        family("request_bytes_total", "counter", "Bytes of request bodies sent to TestIT")
+        for item in snapshot:
+            lines.append(f"{prefix}_request_bytes_total{labels(item)} {item['request_bytes']}")
+        family("response_bytes_total", "counter", "Bytes of response bodies received from TestIT")
+        for item in snapshot:
+            lines.append(f"{prefix}_response_bytes_total{labels(item)} {item['response_bytes']}")
+        family("retries_total", "counter", "Repeated attempts of requests to TestIT")
+        for item in snapshot:
+            lines.append(f"{prefix}_retries_total{labels(item)} {item['retries']}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def start_http_server(registry, port=9464, host="127.0.0.1", prefix="testit_client"):
+    """
+    Serve metrics of registry in Prometheus text format at http://host:port/metrics from a daemon thread
+    Return the server, stop it with shutdown()
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render_prometheus(prefix).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="testit-metrics", daemon=True).start()
+    return server
@@ -658,3 +658,5 @@ WorkItemSelectModel = {
     ]
   }
 }
+
+__all__ = [name for name in dir() if name.endswith("Model")]
@@ -0,0 +1,168 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+from collections.abc import Mapping
+
+import testit_models
+from testit_codec import get_codec
+
+
+class Model(Mapping):
+    """
+    Base class of request body models with __slots__ generated from templates of testit_models
+
+    Fields are keyword arguments of constructor, unset fields are None and are not sent.
+    Nested dicts and lists of dicts given to constructor are converted to nested models, lists and dicts are copied,
+    so objects never share containers. Model is read-only Mapping of its set fields, so it is accepted
+    by client methods everywhere dict is
+    """
+    __slots__ = ()
+    # names of fields
+    _fields = ()
+    _field_set = frozenset()
+    # field -> (model class, True if field is list of models)
+    _nested = {}
+
+    def __init__(self, **fields):
+        for field in self._fields:
+            setattr(self, field, None)
+        for field, value in fields.items():
+            if field not in self._field_set:
+                raise TypeError(f"{type(self).__name__} got an unexpected field '{field}'")
+            setattr(self, field, self._convert(field, value))
+
+    @classmethod
+    def _convert(cls, field, value):
+        if value is None:
+            return None
+        if field in cls._nested:
+            model, many = cls._nested[field]
+            if many:
+                return [model._coerce(item) for item in value]
+            return model._coerce(value)
+        if isinstance(value, list):
+            return list(value)
+        if isinstance(value, dict):
+            return dict(value)
+        return value
+
+    @classmethod
+    def _coerce(cls, value):
+        if isinstance(value, cls) or not isinstance(value, Mapping):
+            return value
+        return cls.from_dict(value)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create model from dict (for example, TestIT response), keys which are not fields of the model are ignored
+        """
+        return cls(**{field: value for field, value in data.items() if field in cls._field_set})
+
+    def json_dict(self):
+        """
+        Return dict of set fields, nested models are not converted
+        """
+        result = dict()
+        for field in self._fields:
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = value
+        return result
+
+    def to_dict(self):
+        """
+        Return dict of set fields with nested models converted to dicts
+        """
+        return {field: _to_dict(value) for field, value in self.json_dict().items()}
+
+    def to_json_bytes(self, codec=None):
+        """
+        Return json of the model encoded to bytes
+        :param codec: Name of json codec ('orjson', 'ujson' or 'json'), the fastest installed one by default
+        """
+        return get_codec(codec).encode(self)
+
+    def copy(self):
+        """
+        Return deep copy of the model
+        """
+        return type(self).from_dict(self.to_dict())
+
+    def __getitem__(self, field):
+        if field in self._field_set:
+            value = getattr(self, field)
+            if value is not None:
+                return value
+        raise KeyError(field)
+
+    def __iter__(self):
+        return iter(self.json_dict())
+
+    def __len__(self):
+        return len(self.json_dict())
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={value!r}" for field, value in self.json_dict().items())
+        return f"{type(self).__name__}({fields})"
+
+
+def _to_dict(value):
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_dict(item) for item in value]
+    return value
+
+
+def _build(name, template):
+    """
+    Create Model subclass with fields of template and register it in the module
+    Nested models are named after their path: AutoTestPostModel_links, so that pickle finds them
+    """
+    nested = dict()
+    for field, value in template.items():
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            nested[field] = (_build(f"{name}_{field}", value[0]), True)
+        elif isinstance(value, dict) and "additionalProp" not in value:
+            nested[field] = (_build(f"{name}_{field}", value), False)
+    fields = tuple(template)
+    namespace = {
+        "__slots__": fields,
+        "__module__": __name__,
+        "__qualname__": name,
+        "__doc__": f"{name.replace('_', '.')} model: {', '.join(fields)}",
+        "_fields": fields,
+        "_field_set": frozenset(fields),
+        "_nested": nested,
+    }
+    model = type(Model)(name, (Model,), namespace)
+    globals()[name] = model
+    return model
+
+
+__all__ = ["Model", *testit_models.__all__]
+
+
+def __getattr__(name):
+    # classes are built on first access: testit_objects.AutoTestResultsForTestRunModel,
+    # nested ones with their top model: testit_objects.AutoTestResultsForTestRunModel_links (used by pickle)
+    top = name.split("_", 1)[0]
+    if top not in testit_models.__all__ or top in globals():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _build(top, getattr(testit_models, top))
+    if name not in globals():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals()[name]
+
+
+def __dir__():
+    return sorted([*globals(), *testit_models.__all__])
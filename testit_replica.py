@@ -0,0 +1,304 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import itertools
+import json
+import re
+import sqlite3
+from datetime import datetime, timezone
+
+from testit_api import TestITError
+
+# table -> indexed columns: column name -> field of TestIT model
+TABLES = {
+    "work_items": {
+        "global_id": "globalId",
+        "name": "name",
+        "section_id": "sectionId",
+        "state": "state",
+        "priority": "priority",
+        "entity_type_name": "entityTypeName",
+    },
+    "sections": {
+        "parent_id": "parentId",
+        "name": "name",
+    },
+    "autotests": {
+        "global_id": "globalId",
+        "external_id": "externalId",
+        "name": "name",
+        "namespace": "namespace",
+        "classname": "classname",
+    },
+    "test_plans": {
+        "global_id": "globalId",
+        "name": "name",
+        "status": "status",
+    },
+    "test_runs": {
+        "name": "name",
+        "state_name": "stateName",
+        "test_plan_id": "testPlanId",
+    },
+}
+
+_FRACTION_PATTERN = re.compile(r"\.(\d+)")
+
+
+def _parse_date(value):
+    """
+    Parse date of TestIT model ("2022-01-31T10:00:00.1234567Z") to aware datetime
+    """
+    value = value.replace("Z", "+00:00")
+    # TestIT sends up to 7 digits of fraction of second, datetime accepts no more than 6
+    value = _FRACTION_PATTERN.sub(lambda match: "." + match.group(1)[:6].ljust(6, "0"), value, count=1)
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _changed_date(item):
+    """
+    Return date of the last change of TestIT model
+    """
+    dates = [_parse_date(item[field]) for field in ("createdDate", "modifiedDate") if item.get(field)]
+    return max(dates) if dates else None
+
+
+class ProjectReplica:
+    """
+    Copy of work items, sections, autotests, test plans and test runs of one project in local SQLite database
+
+    The first sync downloads the whole project, next ones request listings ordered by createdDate and modifiedDate
+    (newest first) and stop at items not changed since the previous sync, skipping items without dates by probing
+    pages if TestIT lists them first.
+    Items deleted in TestIT are removed from the replica only by full sync.
+    Every table has columns id, data (json of TestIT model), changed (date of last change) and indexed columns
+    listed in TABLES
+    """
+    def __init__(self, client, projectId, path, page_size=1000, prefetch=0):
+        """
+        :param client: TestITClient
+        :param projectId: Project internal identifier
+        :param path: Path to SQLite database file (":memory:" - keep replica in memory)
+        :param page_size: Number of items requested at once
+        :param prefetch: Number of pages requested in advance in worker threads
+        """
+        self.client = client
+        self.projectId = projectId
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.connection = sqlite3.connect(path)
+        self._create_tables()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the database
+        """
+        self.connection.close()
+
+    def _create_tables(self):
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS sync_state "
+                                    "(project_id TEXT, name TEXT, synced TEXT, PRIMARY KEY (project_id, name))")
+            for table, columns in TABLES.items():
+                definitions = "".join(f", {column}" for column in columns)
+                self.connection.execute(f"CREATE TABLE IF NOT EXISTS {table} "
+                                        f"(id TEXT PRIMARY KEY, project_id TEXT, changed TEXT{definitions}, data TEXT)")
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_project_id ON {table} (project_id)")
+                for column in columns:
+                    self.connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column})")
+
+    def _listing(self, table):
+        """
+        Return function (**parameters) iterating over items of table in TestIT and flag if it supports paging
+        """
+        iterate = dict(page_size=self.page_size, prefetch=self.prefetch)
+        if table == "work_items":
+            return lambda **parameters: self.client.IterWorkItemsByProjectId(self.projectId, **iterate,
+                                                                             **parameters), True
+        if table == "sections":
+            return lambda **parameters: self.client.IterSectionsByProjectId(self.projectId, **iterate,
+                                                                            **parameters), True
+        if table == "autotests":
+            return lambda **parameters: self.client.IterAllAutoTests(projectId=self.projectId, isDeleted=False,
+                                                                     **iterate, **parameters), True
+        if table == "test_runs":
+            return lambda **parameters: self.client.IterTestRunsByProjectId(self.projectId, **iterate,
+                                                                            **parameters), True
+        # test plans are listed without paging
+        return lambda: self._get_list(self.client.GetTestPlansByProjectId(self.projectId)), False
+
+    @staticmethod
+    def _get_list(response):
+        if not isinstance(response, list):
+            raise TestITError(response)
+        return response
+
+    def sync(self, full=False, tables=None):
+        """
+        Download changes of the project since the previous sync (or the whole project if full is set)
+        Return dict table -> number of written items
+        :param tables: Names of tables to sync (default - all tables)
+        """
+        written = dict()
+        for table in tables or TABLES:
+            if table not in TABLES:
+                raise AssertionError(f"Unknown table: {table}")
+            listing, paged = self._listing(table)
+            synced = None if full or not paged else self._synced(table)
+            if synced is None:
+                # stable order between pages, item skipped between them would be dropped from the replica
+                items = list(listing(OrderBy="createdDate asc") if paged else listing())
+            else:
+                items = list(self._changed_since(listing, synced, self.page_size))
+            written[table] = self._write(table, items, replace=synced is None, synced=synced)
+        return written
+
+    @classmethod
+    def _changed_since(cls, listing, synced, page_size):
+        """
+        Yield items created or modified after synced date, reading listings ordered by dates from the newest
+
+        Items never modified have no modifiedDate, they are reported by createdDate listing
+        """
+        for field in ("createdDate", "modifiedDate"):
+            skip = yield from cls._newer(listing, field, synced, page_size, 0)
+            if skip is not None:
+                yield from cls._newer(listing, field, synced, page_size, skip)
+
+    @classmethod
+    def _newer(cls, listing, field, synced, page_size, skip):
+        """
+        Yield items with field not older than synced from listing ordered by field from the newest, starting at skip
+        If the listing starts with a page of items without field (TestIT sorts them first), stop and return
+        position of the first item with field
+        """
+        undated = 0
+        dated = False
+        for item in listing(OrderBy=f"{field} desc", Skip=skip):
+            if not item.get(field):
+                if dated:
+                    # items without field are sorted last, all items with field are read
+                    return None
+                undated += 1
+                if undated < page_size:
+                    continue
+                return cls._first_dated(listing, field, page_size, skip + page_size)
+            dated = True
+            # items changed at the same moment as the previous sync are read again
+            if _parse_date(item[field]) < synced:
+                return None
+            yield item
+        return None
+
+    @staticmethod
+    def _first_dated(listing, field, page_size, low):
+        """
+        Return position of the first item with field in listing ordered by field from the newest, where items
+        before low have no field, probing pages at doubling and then halving positions (None if there is no such item)
+        """
+        high = None
+        while high is None or low < high:
+            skip = 2 * low if high is None else (low + high) // 2
+            page = list(itertools.islice(listing(OrderBy=f"{field} desc", Skip=skip), page_size))
+            first = next((index for index, item in enumerate(page) if item.get(field)), None)
+            if first is not None and first > 0:
+                return skip + first
+            if first == 0 or not page:
+                high = skip
+            elif len(page) < page_size:
+                # the last page has no items with field
+                return None
+            else:
+                low = skip + page_size
+        return high
+
+    def _synced(self, table):
+        row = self.connection.execute("SELECT synced FROM sync_state WHERE project_id = ? AND name = ?",
+                                      (self.projectId, table)).fetchone()
+        return _parse_date(row[0]) if row is not None else None
+
+    def _write(self, table, items, replace, synced):
+        """
+        Write items to table in one transaction, drop all previous items of the project if replace is set
+        """
+        columns = TABLES[table]
+        names = ", ".join(["id", "project_id", "changed", *columns, "data"])
+        placeholders = ", ".join("?" * (len(columns) + 4))
+        rows = dict()
+        for item in items:
+            changed = _changed_date(item)
+            if changed is not None and (synced is None or changed > synced):
+                synced = changed
+            rows[item["id"]] = (item["id"], self.projectId, changed.isoformat() if changed is not None else None,
+                                *(item.get(field) for field in columns.values()), json.dumps(item, ensure_ascii=False))
+        with self.connection:
+            if replace:
+                self.connection.execute(f"DELETE FROM {table} WHERE project_id = ?", (self.projectId,))
+            self.connection.executemany(f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({placeholders})",
+                                        rows.values())
+            if synced is not None:
+                self.connection.execute("INSERT OR REPLACE INTO sync_state (project_id, name, synced) VALUES (?, ?, ?)",
+                                        (self.projectId, table, synced.isoformat()))
+        return len(rows)
+
+    def get(self, table, id):
+        """
+        Return TestIT model of item of table by id or None
+        """
+        self._check_columns(table, ())
+        row = self.connection.execute(f"SELECT data FROM {table} WHERE id = ? AND project_id = ?",
+                                      (id, self.projectId)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def find(self, table, order_by=None, limit=None, **columns):
+        """
+        Return list of TestIT models of items of table with given values of indexed columns
+        find("work_items", section_id=section_id, order_by="name")
+        """
+        self._check_columns(table, [*columns, *([order_by] if order_by is not None else [])])
+        query = f"SELECT data FROM {table} WHERE project_id = ?"
+        values = [self.projectId]
+        for column, value in columns.items():
+            query += f" AND {column} = ?"
+            values.append(value)
+        if order_by is not None:
+            query += f" ORDER BY {order_by}"
+        if limit is not None:
+            query += " LIMIT ?"
+            values.append(limit)
+        return [json.loads(row[0]) for row in self.connection.execute(query, values)]
+
+    def count(self, table, **columns):
+        """
+        Return number of items of table with given values of indexed columns
+        """
+        self._check_columns(table, columns)
+        query = f"SELECT COUNT(*) FROM {table} WHERE project_id = ?"
+        values = [self.projectId]
+        for column, value in columns.items():
+            query += f" AND {column} = ?"
+            values.append(value)
+        return self.connection.execute(query, values).fetchone()[0]
+
+    @staticmethod
+    def _check_columns(table, columns):
+        if table not in TABLES:
+            raise AssertionError(f"Unknown table: {table}")
+        for column in columns:
+            if column not in TABLES[table] and column not in ("id", "changed"):
+                raise AssertionError(f"Unknown column of {table}: {column}")
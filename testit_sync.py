@@ -0,0 +1,137 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import hashlib
+import json
+
+
+def _steps(steps):
+    """
+    Normalize list of steps (setup, teardown) keeping their order, nested steps included
+    """
+    return [[step.get("title") or None, step.get("description") or None, _steps(step.get("steps") or [])]
+            for step in steps or []]
+
+
+def autotest_hash(autotest):
+    """
+    Return sha256 of meaningful fields of AutoTest model: name, namespace, classname, steps, setup, teardown,
+    labels and links. The hash does not depend on identifiers assigned by TestIT, order of labels and links
+    and empty values, so model returned by GetAllAutoTests and AutoTestPostModel with the same content
+    have the same hash
+    """
+    content = {
+        "name": autotest.get("name") or None,
+        "namespace": autotest.get("namespace") or None,
+        "classname": autotest.get("classname") or None,
+        "steps": _steps(autotest.get("steps")),
+        "setup": _steps(autotest.get("setup")),
+        "teardown": _steps(autotest.get("teardown")),
+        "labels": sorted(label["name"] for label in autotest.get("labels") or []),
+        "links": sorted([link.get("url") or "", link.get("title") or "", link.get("description") or "",
+                         link.get("type") or ""] for link in autotest.get("links") or []),
+    }
+    encoded = json.dumps(content, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class SyncResult:
+    """
+    Result of AutoTestSync.sync
+    """
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        # externalId -> exception for AutoTests which were not accepted by TestIT
+        self.errors = dict()
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+class AutoTestSync:
+    """
+    Create and update AutoTests of one project so that they match given AutoTestPostModel list,
+    sending only new AutoTests and AutoTests whose content has changed
+
+    Existing AutoTests are loaded page by page with GetAllAutoTests and compared by autotest_hash,
+    changes are sent with CreateMultipleInChunks and UpdateMultipleInChunks
+    """
+    def __init__(self, client, projectId, chunk_size=500, chunk_bytes=None, max_workers=4, retries=1,
+                 page_size=1000, prefetch=0):
+        """
+        :param client: TestITClient
+        :param projectId: Project internal identifier
+        :param chunk_size: Maximum number of AutoTests in one bulk request
+        :param chunk_bytes: Maximum size of json of one bulk request (None - no limit)
+        :param max_workers: Number of threads sending bulk requests
+        :param retries: Number of retries of failed bulk request before it is split in halves
+        :param page_size: Number of existing AutoTests requested at once
+        :param prefetch: Number of pages of existing AutoTests requested in advance in worker threads
+        """
+        self.client = client
+        self.projectId = projectId
+        self.chunk_size = chunk_size
+        self.chunk_bytes = chunk_bytes
+        self.max_workers = max_workers
+        self.retries = retries
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+    def existing(self):
+        """
+        Return dict externalId -> (id, hash) of AutoTests of the project in TestIT
+        """
+        existing = dict()
+        for autotest in self.client.IterAllAutoTests(page_size=self.page_size, prefetch=self.prefetch,
+                                                     projectId=self.projectId, isDeleted=False, includeSteps=True,
+                                                     includeLabels=True, OrderBy="createdDate asc"):
+            # stable order between pages, AutoTest skipped between them would be created again
+            existing[autotest["externalId"]] = (autotest["id"], autotest_hash(autotest))
+        return existing
+
+    def sync(self, autotests):
+        """
+        Create AutoTests with new externalId and update changed ones, return SyncResult
+        :param autotests: List of dicts like AutoTestPostModel (projectId may be omitted),
+        last one wins if several of them have the same externalId
+        """
+        existing = self.existing()
+        wanted = dict()
+        for autotest in autotests:
+            wanted[autotest["externalId"]] = {"projectId": self.projectId, **autotest}
+        result = SyncResult()
+        creates = list()
+        updates = list()
+        for externalId, autotest in wanted.items():
+            if externalId not in existing:
+                creates.append(autotest)
+                continue
+            autotest_id, autotest_digest = existing[externalId]
+            if autotest_hash(autotest) == autotest_digest:
+                result.unchanged += 1
+            else:
+                updates.append({**autotest, "id": autotest_id})
+        if creates:
+            bulk = self.client.CreateMultipleInChunks(creates, self.chunk_size, self.chunk_bytes, self.max_workers,
+                                                      self.retries)
+            result.created = len(creates) - len(bulk.errors)
+            for index, error in bulk.errors.items():
+                result.errors[creates[index]["externalId"]] = error
+        if updates:
+            bulk = self.client.UpdateMultipleInChunks(updates, self.chunk_size, self.chunk_bytes, self.max_workers,
+                                                      self.retries)
+            result.updated = len(updates) - len(bulk.errors)
+            for index, error in bulk.errors.items():
+                result.errors[updates[index]["externalId"]] = error
+        return result
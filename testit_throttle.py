@@ -0,0 +1,113 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the rate of requests to TestIT
+    One limiter can be shared by several clients and threads
+    """
+    def __init__(self, rate, burst=None):
+        """
+        :param rate: Average number of requests per second
+        :param burst: Maximum number of requests sent at once after idle period (default - rate, but at least 1)
+        """
+        if rate <= 0:
+            raise AssertionError("rate should be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take token for one request and return time (in seconds) to wait before sending it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # token may be taken in advance, then the request waits until it is refilled
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """
+        Wait until one more request may be sent
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ConcurrencyController:
+    """
+    Adaptive limit of requests in flight (additive increase, multiplicative decrease)
+
+    Limit grows by one per limit successful requests while their latency stays close to the lowest seen latency,
+    and is multiplied by decrease on 429, 5xx responses and network errors (no more than once per latency period)
+    """
+    def __init__(self, initial=4, minimum=1, maximum=64, decrease=0.5, latency_tolerance=2.0):
+        """
+        :param initial: Initial limit of requests in flight
+        :param minimum: Minimum limit of requests in flight
+        :param maximum: Maximum limit of requests in flight
+        :param decrease: Multiplier of limit on overload signal
+        :param latency_tolerance: Limit grows only while latency is no more than latency_tolerance * lowest latency
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise AssertionError("1 <= minimum <= initial <= maximum expected")
+        if not 0 < decrease < 1:
+            raise AssertionError("decrease should be between 0 and 1")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.min_latency = None
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Wait until one more request may be sent
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    def release(self, latency, status_code=None):
+        """
+        Report finished request and adjust limit
+        :param latency: Time (in seconds) of the request
+        :param status_code: Response status, None if request failed with network error
+        """
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if status_code is None or status_code == 429 or status_code >= 500:
+                # one overload signal per latency period, requests sent before decrease report the same overload
+                if now - self._last_decrease > (self.min_latency or 0.0):
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self._last_decrease = now
+            else:
+                if self.min_latency is None or latency < self.min_latency:
+                    self.min_latency = latency
+                if latency <= self.min_latency * self.latency_tolerance:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
@@ -0,0 +1,188 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import mimetypes
+import os
+import stat
+import uuid
+
+
+class MultipartStream:
+    """
+    multipart/form-data body with one file, read from disk chunk by chunk while it is sent
+
+    The file is never loaded into memory: the object is passed to HTTP library as a file-like body
+    with known length, so request is sent with Content-Length and without buffering
+    """
+    def __init__(self, file, field_name='file', filename=None, chunk_size=1024 * 1024, progress=None):
+        """
+        :param file: Path to file or file object opened in binary mode
+        :param field_name: Name of form field with file
+        :param filename: Name of file sent to TestIT (default - name of file on disk)
+        :param chunk_size: Size of chunks the file is read by
+        :param progress: Callable (bytes_sent, total_bytes) called after every chunk
+        """
+        if isinstance(file, (str, os.PathLike)):
+            self._file = open(file, mode='rb')
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+        if filename is None:
+            filename = os.path.basename(getattr(self._file, 'name', None) or 'file')
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        file_content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        quoted_filename = filename.replace('\\', '\\\\').replace('"', '\\"')
+        self._head = (f'--{self.boundary}\r\n'
+                      f'Content-Disposition: form-data; name="{field_name}"; filename="{quoted_filename}"\r\n'
+                      f'Content-Type: {file_content_type}\r\n\r\n').encode('utf-8')
+        self._tail = f'\r\n--{self.boundary}--\r\n'.encode('utf-8')
+        # file is sent from its current position
+        self._file_start = self._file.tell()
+        self._file_size = self._file.seek(0, os.SEEK_END) - self._file_start
+        self._file.seek(self._file_start)
+        self._position = 0
+
+    def __len__(self):
+        return len(self._head) + self._file_size + len(self._tail)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """
+        Move to position of the body, used by HTTP library to send the body again (on retry)
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self)
+        self._position = min(max(offset, 0), len(self))
+        file_offset = min(max(self._position - len(self._head), 0), self._file_size)
+        self._file.seek(self._file_start + file_offset)
+        return self._position
+
+    def read(self, size=-1):
+        """
+        Return next part of the body, no more than size bytes (and no more than one chunk of the file)
+        """
+        if size is None or size < 0:
+            size = self.chunk_size
+        head_end = len(self._head)
+        tail_start = head_end + self._file_size
+        if self._position < head_end:
+            data = self._head[self._position:self._position + size]
+        elif self._position < tail_start:
+            data = self._file.read(min(size, self.chunk_size, tail_start - self._position))
+            if not data:
+                raise IOError("File was truncated while it was being sent")
+        else:
+            data = self._tail[self._position - tail_start:self._position - tail_start + size]
+        self._position += len(data)
+        if self.progress is not None and data:
+            self.progress(min(max(self._position - head_end, 0), self._file_size), self._file_size)
+        return data
+
+    def close(self):
+        """
+        Close the file if it was opened by the stream
+        """
+        if self._owns_file:
+            self._file.close()
+
+
+class DownloadTarget:
+    """
+    Destination of streamed download: path (optionally written via temporary file and renamed when complete)
+    or file object opened in binary mode
+    """
+    def __init__(self, destination, atomic=True):
+        """
+        :param destination: Path to file or file object opened in binary mode
+        :param atomic: Write to temporary file in the same directory and rename it to destination path
+        only when download is complete
+        """
+        self.path = None
+        self._temp_path = None
+        if isinstance(destination, (str, os.PathLike)):
+            self.path = os.fspath(destination)
+            if atomic:
+                directory, name = os.path.split(os.path.abspath(self.path))
+                self._temp_path = os.path.join(directory, f'.{name}.{uuid.uuid4().hex}.part')
+                # created like open() does (0o666 minus umask), not with 0o600 of tempfile.mkstemp
+                handle = os.open(self._temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0),
+                                 0o666)
+                self._file = os.fdopen(handle, 'wb')
+            else:
+                self._file = open(self.path, mode='wb')
+            self._owns_file = True
+        else:
+            self._file = destination
+            self._owns_file = False
+        self._start = self._file.tell() if self._file.seekable() else None
+        # number of bytes written
+        self.written = 0
+
+    def write(self, chunk):
+        self._file.write(chunk)
+        self.written += len(chunk)
+
+    def restart(self):
+        """
+        Drop written bytes, used when TestIT sends the whole body again instead of requested range
+        """
+        if self.written == 0:
+            return
+        if self._start is None:
+            raise IOError("Download can not be restarted: destination is not seekable")
+        self._file.seek(self._start)
+        self._file.truncate()
+        self.written = 0
+
+    def commit(self):
+        """
+        Finish complete download
+        """
+        self._file.flush()
+        if self._owns_file:
+            self._file.close()
+        if self._temp_path is not None:
+            # replaced file keeps its permissions like when it is overwritten without temporary file
+            try:
+                os.chmod(self._temp_path, stat.S_IMODE(os.stat(self.path).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(self._temp_path, self.path)
+
+    def abort(self):
+        """
+        Drop incomplete download
+        """
+        if self._owns_file:
+            self._file.close()
+        if self._temp_path is not None:
+            os.remove(self._temp_path)
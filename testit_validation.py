@@ -0,0 +1,241 @@
+# Copyright (c) "Сifra" LLC, 2022, https://github.com/GSGroup
+# Permission to use, copy, modify, and/or distribute this software
+# for any purpose with or without fee is hereby granted,
+# provided that the above copyright notice and this permission notice appear in all copies.
+# THE SOFTWARE IS PROVIDED "AS IS" AND GS GROUP DISCLAIMS ALL WARRANTIES WITH REGARD TO THIS SOFTWARE
+# INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS.
+# IN NO EVENT SHALL GS GROUP BE LIABLE FOR ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES
+# OR ANY DAMAGES WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS,
+# WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION,
+# ARISING OUT OF OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+import re
+import threading
+from collections.abc import Mapping, Sequence
+from datetime import date
+from uuid import UUID
+
+import testit_models
+
+# model -> fields TestIT rejects the model without, nested fields are written through dots: "links.url"
+REQUIRED = {
+    "AutoTestPostModel": ("externalId", "projectId", "name", "links.url", "labels.name"),
+    "AutoTestPutModel": ("externalId", "projectId", "name", "links.url", "labels.name"),
+    "AutoTestResultsForTestRunModel": ("configurationId", "autoTestExternalId", "outcome", "links.url"),
+    "ConfigurationPostModel": ("projectId", "name"),
+    "ConfigurationPutModel": ("id", "projectId", "name"),
+    "CustomAttributeModel": ("id", "type", "name"),
+    "CustomAttributePostModel": ("type", "name"),
+    "CustomAttributeTestPlanProjectRelationPutModel": ("id",),
+    "ParameterPostModel": ("value", "name"),
+    "ParameterPutModel": ("id", "value", "name"),
+    "ProjectPostModel": ("name",),
+    "ProjectPutModel": ("id", "name"),
+    "SectionMoveModel": ("id", "parentId"),
+    "SectionPostModel": ("name", "projectId"),
+    "SectionPutModel": ("id", "name", "projectId"),
+    "SectionRenameModel": ("id", "name"),
+    "TestPlanPostModel": ("name", "projectId", "tags.name"),
+    "TestPlanPutModel": ("id", "name", "projectId", "tags.name"),
+    "TestRunFillByAutoTestsPostModel": ("projectId", "configurationIds", "autoTestExternalIds"),
+    "TestRunFillByConfigurationsPostModel": ("projectId", "testPlanId", "testPointSelectors"),
+    "TestRunFillByWorkItemsPostModel": ("projectId", "testPlanId", "configurationIds", "workitemIds"),
+    "TestRunV2PostShortModel": ("projectId",),
+    "TestRunV2PutModel": ("id", "name"),
+    "TestSuiteV2PostModel": ("testPlanId", "name"),
+    "TestSuiteV2PutModel": ("id", "name"),
+    "WorkItemIdModel": ("id",),
+    "WorkItemPostModel": ("entityTypeName", "state", "priority", "name", "projectId", "sectionId", "links.url",
+                          "tags.name"),
+    "WorkItemPutModel": ("id", "sectionId", "state", "priority", "name", "links.url", "tags.name"),
+}
+
+# fields which templates describe by one item, but TestIT accepts lists of such items
+ARRAYS = {
+    "AutoTestResultsForTestRunModel": ("stepResults.attachments", "setupResults.attachments",
+                                       "teardownResults.attachments"),
+    "WorkItemSelectModel": ("filter.states", "filter.priorities"),
+}
+
+_UUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}")
+
+# model -> compiled check, filled on first validation of the model
+_checks = dict()
+_checks_lock = threading.Lock()
+
+
+class ValidationError(AssertionError):
+    """
+    Request body does not match its model
+    """
+    def __init__(self, errors, indexes=None):
+        """
+        :param errors: List of messages "path: problem"
+        :param indexes: Index of item -> list of messages, for lists of models
+        """
+        self.errors = errors
+        self.indexes = indexes or {}
+        shown = "; ".join(errors[:10])
+        more = f" (and {len(errors) - 10} more)" if len(errors) > 10 else ""
+        super().__init__(f"Request body is invalid: {shown}{more}")
+
+
+def _join(where, field):
+    return f"{where}.{field}" if where else field
+
+
+def _compile_value(template, where, required, arrays):
+    """
+    Return check(value, path, errors) of value described by template, path of the value in model is where
+    """
+    if isinstance(template, list):
+        check_item = _compile_value(template[0], where, required, arrays) if template else None
+
+        def check_list(value, path, errors):
+            if isinstance(value, (str, bytes, Mapping)) or not isinstance(value, Sequence):
+                errors.append(f"{path}: list expected")
+                return
+            if check_item is not None:
+                for index, item in enumerate(value):
+                    if item is not None:
+                        check_item(item, f"{path}[{index}]", errors)
+        return check_list
+    if isinstance(template, dict):
+        if "additionalProp" in template:
+            check_item = _compile_value(template["additionalProp"], where, required, arrays)
+
+            def check_map(value, path, errors):
+                if not isinstance(value, Mapping):
+                    errors.append(f"{path}: object expected")
+                    return
+                for key, item in value.items():
+                    if not isinstance(key, str):
+                        errors.append(f"{path}: keys should be strings")
+                    elif item is not None:
+                        check_item(item, f"{path}.{key}", errors)
+            check = check_map
+        else:
+            check = _compile_model(template, where, required, arrays)
+    else:
+        check = _compile_scalar(template)
+    if where in arrays:
+        # one item or list of items
+        check_single = check
+
+        def check(value, path, errors):
+            if isinstance(value, (list, tuple)):
+                for index, item in enumerate(value):
+                    check_single(item, f"{path}[{index}]", errors)
+            else:
+                check_single(value, path, errors)
+    return check
+
+
+def _compile_scalar(kind):
+    if kind.startswith("choose one from:"):
+        choices = tuple(choice.strip() for choice in kind[len("choose one from:"):].split("|"))
+        allowed = frozenset(choices)
+        expected = " | ".join(choices)
+
+        def check_choice(value, path, errors):
+            if not isinstance(value, str) or value not in allowed:
+                errors.append(f"{path}: {value!r} is not one of {expected}")
+        return check_choice
+    if kind == "boolean":
+        def check_boolean(value, path, errors):
+            if not isinstance(value, bool):
+                errors.append(f"{path}: boolean expected, got {type(value).__name__}")
+        return check_boolean
+    if kind == "integer":
+        def check_integer(value, path, errors):
+            if not isinstance(value, int) or isinstance(value, bool):
+                errors.append(f"{path}: integer expected, got {type(value).__name__}")
+        return check_integer
+    if kind == "uuid":
+        def check_uuid(value, path, errors):
+            if isinstance(value, UUID):
+                return
+            if not isinstance(value, str) or _UUID_PATTERN.fullmatch(value) is None:
+                errors.append(f"{path}: uuid expected, got {value!r}")
+        return check_uuid
+
+    def check_string(value, path, errors):
+        # dates are sent as strings, orjson encodes datetime objects itself
+        if not isinstance(value, (str, date)):
+            errors.append(f"{path}: string expected, got {type(value).__name__}")
+    return check_string
+
+
+def _compile_model(template, where, required, arrays):
+    fields = [(field, _compile_value(value, _join(where, field), required, arrays))
+              for field, value in template.items()]
+    needed = tuple(field for field in template if _join(where, field) in required)
+
+    def check_model(value, path, errors):
+        if not isinstance(value, Mapping):
+            errors.append(f"{path or 'body'}: object expected, got {type(value).__name__}")
+            return
+        for field in needed:
+            if value.get(field) is None:
+                errors.append(f"{_join(path, field)}: required field is missing")
+        for field, check in fields:
+            item = value.get(field)
+            if item is not None:
+                check(item, _join(path, field), errors)
+    return check_model
+
+
+def _check(model):
+    """
+    Return compiled check of model (name of model from testit_models or "list of uuid string")
+    """
+    check = _checks.get(model)
+    if check is None:
+        if model == "uuid string":
+            check = _compile_scalar("uuid")
+        elif model in testit_models.__all__:
+            check = _compile_model(getattr(testit_models, model), "", frozenset(REQUIRED.get(model, ())),
+                                   frozenset(ARRAYS.get(model, ())))
+        else:
+            raise AssertionError(f"Unknown model: {model}")
+        with _checks_lock:
+            _checks[model] = check
+    return check
+
+
+def find_errors(model, data):
+    """
+    Return list of problems of data as model ("path: problem"), empty list if data is valid
+    """
+    found = list()
+    _check(model)(data, "", found)
+    return found
+
+
+def validate_items(model, items):
+    """
+    Validate every item of bulk list without sending it, return dict index of invalid item -> list of problems
+    """
+    check = _check(model)
+    invalid = dict()
+    for index, item in enumerate(items):
+        found = list()
+        check(item, f"[{index}]", found)
+        if found:
+            invalid[index] = found
+    return invalid
+
+
+def validate(body, data):
+    """
+    Raise ValidationError if data does not match request body description of endpoint:
+    name of model or "list of <model>", problems of all items of list are reported at once
+    """
+    if body.startswith("list of "):
+        invalid = validate_items(body[len("list of "):], data)
+        if invalid:
+            raise ValidationError([problem for problems in invalid.values() for problem in problems], invalid)
+        return
+    found = find_errors(body, data)
+    if found:
+        raise ValidationError(found)